@@ -10,11 +10,30 @@ from typing import Any
 from urllib.parse import urlparse
 
 from app.crawler import CrawlState
-from app.db import Database
+from app.db import ChunkWriter, Database
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _to_json(obj: Any) -> str:
+    """序列化为 JSON 字符串，安装了 orjson 时优先使用。"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _from_json(data: str) -> Any:
+    """解析 JSON 字符串；orjson 的解析错误同样是 json.JSONDecodeError 的子类。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def retry_with_backoff(
     func: Callable[[], Any],
     max_retries: int = 3,
@@ -49,6 +68,7 @@ class BridgeAPI:
 
     def __init__(self, db_path: Path) -> None:
         self.db = Database(db_path)
+        self._writer = ChunkWriter(self.db)
         self.state = CrawlState()
         self.ui_window = None
         self.crawler_window = None
@@ -57,6 +77,8 @@ class BridgeAPI:
         self._pending_action: dict[str, Any] | None = None
         self._duplicate_batches = 0
         self._video_complete_timer: Timer | None = None
+        # 单视频抓取在捕获数据后自动完成前的等待秒数（测试中可调小）
+        self.video_complete_delay = 2.0
         logger.info("Bridge API initialised")
 
     # ---------------------------------------------------------------------
@@ -88,7 +110,7 @@ class BridgeAPI:
         try:
             js_code = (
                 "window.dispatchEvent(new CustomEvent('crawl-progress', { detail: "
-                + json.dumps(status)
+                + _to_json(status)
                 + " }));"
             )
             self.ui_window.evaluate_js(js_code)
@@ -104,7 +126,7 @@ class BridgeAPI:
 
         if action.get("mode") == "author":
             latest = action.get("latest") or {}
-            payload = json.dumps(
+            payload = _to_json(
                 {
                     "latest_aweme_id": latest.get("aweme_id"),
                     "latest_create_time": latest.get("create_time"),
@@ -235,7 +257,7 @@ class BridgeAPI:
 
         if isinstance(result, str):
             try:
-                data = json.loads(result)
+                data = _from_json(result)
             except json.JSONDecodeError:
                 data = {"logged_in": False, "raw": result}
         else:
@@ -355,7 +377,7 @@ class BridgeAPI:
 
         def process_chunk():
             self.state.increment_received(len(items))
-            result = self.db.upsert_videos(items)
+            result = self._writer.submit(items)
             return result
 
         try:
@@ -391,7 +413,7 @@ class BridgeAPI:
                 # Auto-complete video crawl after capturing data
                 if inserted > 0 or updated > 0:
                     logger.info("Video data captured, scheduling completion")
-                    self._schedule_video_completion(delay=2.0)
+                    self._schedule_video_completion(delay=self.video_complete_delay)
             else:
                 self.state.set_status(
                     "running", f"Captured {inserted} new videos, {updated} refreshed"
@@ -420,9 +442,13 @@ class BridgeAPI:
         filters: dict[str, Any] | None = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: list[Any] | None = None,
+        include_total: bool = True,
     ) -> dict[str, Any]:
         try:
-            return self.db.list_videos(filters or {}, page, page_size)
+            return self.db.list_videos(
+                filters or {}, page, page_size, cursor, include_total
+            )
         except Exception as exc:  # pragma: no cover - DB failure handling
             logger.exception("Error listing videos")
             return {
@@ -431,6 +457,7 @@ class BridgeAPI:
                 "page": page,
                 "page_size": page_size,
                 "total": 0,
+                "next_cursor": None,
             }
 
     def export_csv(self, filters: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -546,8 +573,7 @@ class BridgeAPI:
                         
                         if isinstance(result, str):
                             try:
-                                import json
-                                result = json.loads(result)
+                                result = _from_json(result)
                             except json.JSONDecodeError:
                                 result = {}
                         
@@ -22,6 +22,8 @@ class CrawlState:
     last_error: str | None = None
     context: dict[str, Any] = field(default_factory=dict)
     lock: threading.Lock = field(default_factory=threading.Lock)
+    # 爬取进入 complete 状态时置位，start()/reset() 时清除
+    completed_event: threading.Event = field(default_factory=threading.Event)
 
     def reset(self) -> None:
         with self.lock:
@@ -36,6 +38,7 @@ class CrawlState:
             self.items_updated = 0
             self.last_error = None
             self.context = {}
+            self.completed_event.clear()
 
     def start(
         self, mode: str, target: str, context: dict[str, Any] | None = None
@@ -52,6 +55,7 @@ class CrawlState:
             self.items_inserted = 0
             self.items_updated = 0
             self.last_error = None
+            self.completed_event.clear()
 
     def stop(self, status: str = "stopped", message: str | None = None) -> None:
         with self.lock:
@@ -66,6 +70,7 @@ class CrawlState:
             self.status = "complete"
             if message is not None:
                 self.status_message = message
+            self.completed_event.set()
 
     def set_status(self, status: str, message: str | None = None) -> None:
         with self.lock:
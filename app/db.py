@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
-from collections.abc import Iterable
+import os
+import queue
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import func, or_
+from sqlalchemy import Index, and_, event, func, inspect, or_, tuple_
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 
 
@@ -51,14 +61,249 @@ class Video(SQLModel, table=True):
     received_at: dt.datetime = Field(default_factory=dt.datetime.utcnow)
 
 
+# 列表和"作者最新视频"都按 (create_time, received_at, aweme_id) 倒序，复合索引让
+# 筛选 + 排序直接走索引，取第一页或最新一条不再需要全表扫描后排序；aweme_id 是
+# keyset 分页的最后一个排序键，也必须在索引里，否则游标翻页仍要临时排序
+VIDEO_INDEXES = (
+    Index(
+        "ix_video_create_time_received_at",
+        Video.create_time.desc(),
+        Video.received_at.desc(),
+        Video.aweme_id.desc(),
+    ),
+    Index(
+        "ix_video_author_id_create_time",
+        Video.author_id,
+        Video.create_time.desc(),
+        Video.received_at.desc(),
+        Video.aweme_id.desc(),
+    ),
+    Index(
+        "ix_video_author_sec_uid_create_time",
+        Video.author_sec_uid,
+        Video.create_time.desc(),
+        Video.received_at.desc(),
+        Video.aweme_id.desc(),
+    ),
+)
+
+
+class VideoTag(SQLModel, table=True):
+    """视频描述中提取的话题标签，入库时解析一次，供列表按标签筛选。"""
+
+    aweme_id: str = Field(primary_key=True)
+    tag: str = Field(primary_key=True, index=True)
+
+
+# 话题标签：# 后直到空白或下一个 # 的内容；模式无回溯风险，模块加载时预编译
+_HASHTAG_RE = re.compile(r"#([^\s#]+)")
+
+
+def _build_upsert(model: type[SQLModel], key: str, keep: tuple[str, ...] = ()) -> Any:
+    """构建 INSERT ... ON CONFLICT(key) DO UPDATE，冲突时更新除 key/keep 外的所有列。"""
+    table = model.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c[key]],
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in table.columns
+            if column.name != key and column.name not in keep
+        },
+    )
+
+
+# upsert 语句只构建一次，之后每次 executemany 直接复用（编译结果也会被缓存）；
+# 视频的 received_at 只记录首次入库时间，冲突更新时保持不变
+_VIDEO_UPSERT = _build_upsert(Video, "aweme_id", keep=("received_at",))
+_AUTHOR_UPSERT = _build_upsert(Author, "author_id")
+
+# SQLite 3.35 起支持 RETURNING，单条 upsert 可直接带回写入后的整行
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_AUTHOR_UPSERT_RETURNING = _AUTHOR_UPSERT.returning(*Author.__table__.c)
+
+# SQLite 单条语句可绑定的参数上限（旧版本为 999）。executemany 按行绑定参数，
+# 不受此限制；只有 IN (...) 这类把整批值放进一条语句的查询需要分段
+_SQLITE_MAX_PARAMS = 999
+
+
+# 归一化后的单个批次：(视频行, 按 author_id 去重的作者行)
+_PreparedChunk = tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]
+
+
+def _param_batches(values: Sequence[Any]) -> Iterator[Sequence[Any]]:
+    """按参数上限切分，供 IN (...) 查询逐段执行（同一事务内）。"""
+    for start in range(0, len(values), _SQLITE_MAX_PARAMS):
+        yield values[start : start + _SQLITE_MAX_PARAMS]
+
+_MEMORY_PATH = ":memory:"
+
+# 每个连接缓存的预编译语句数（sqlite3 默认 128）。upsert/查询语句在模块级只构建一次，
+# SQLAlchemy 每次生成相同的 SQL 文本，命中缓存即可跳过 sqlite3_prepare
+_SQLITE_CACHED_STATEMENTS = 256
+
+# 导出 CSV 时每次从游标读取的行数，以及输出文件的写缓冲大小
+_EXPORT_FETCH_SIZE = 1000
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# 每个新连接都会执行的 PRAGMA：busy_timeout 让并发写入等待锁释放，
+# 而不是立即报 database is locked
+_SQLITE_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# 仅对文件数据库有意义的 PRAGMA（内存库没有日志文件，也无法 mmap）；WAL 允许读写并发
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",
+)
+
+# 文件数据库的同步级别，可用环境变量 DB_SYNC 覆盖。WAL 下 NORMAL 只在检查点时
+# fsync，断电可能丢失最近提交但不会损坏数据库；OFF 完全不 fsync，仅适合可随时
+# 重建的测试库
+_DB_SYNC_ENV = "DB_SYNC"
+_DB_SYNC_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def _synchronous_pragma() -> str:
+    mode = os.environ.get(_DB_SYNC_ENV, "NORMAL").strip().upper()
+    if mode not in _DB_SYNC_MODES:
+        raise ValueError(
+            f"{_DB_SYNC_ENV} 必须是 {', '.join(_DB_SYNC_MODES)} 之一，当前为 {mode!r}"
+        )
+    return f"PRAGMA synchronous={mode}"
+
+
+def _pragma_listener(pragmas: tuple[str, ...]) -> Any:
+    def apply(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return apply
+
+
+# 本进程中已建好表和索引的数据库文件，同一文件再次打开时跳过建表检查
+_SCHEMA_READY: set[Path] = set()
+_SCHEMA_LOCK = threading.Lock()
+
+
+def _ensure_schema(engine: Any, db_path: Path | None) -> None:
+    """建表并补建索引；文件库按路径记忆，内存库每个引擎都是新库，总是执行。"""
+    with _SCHEMA_LOCK:
+        if db_path is not None and db_path in _SCHEMA_READY and db_path.exists():
+            return
+        tag_table_missing = not inspect(engine).has_table(VideoTag.__tablename__)
+        SQLModel.metadata.create_all(engine)
+        _create_video_indexes(engine)
+        if tag_table_missing:
+            _backfill_video_tags(engine)
+        if db_path is not None:
+            _SCHEMA_READY.add(db_path)
+
+
+def _create_video_indexes(engine: Any) -> None:
+    """补建列表索引；create_all 不会给已存在的表建新索引，也不会更新索引的列。"""
+    with engine.begin() as conn:
+        for index in VIDEO_INDEXES:
+            columns = [
+                row[2]
+                for row in conn.exec_driver_sql(f"PRAGMA index_info({index.name})")
+            ]
+            # 旧版本建的同名索引缺少 aweme_id 列，删除后按新定义重建
+            if columns and columns != [column.name for column in index.columns]:
+                index.drop(conn)
+            index.create(conn, checkfirst=True)
+
+
+def _backfill_video_tags(engine: Any) -> None:
+    """标签表新建时，为升级前已入库的视频从描述中补齐标签（只执行一次）。"""
+    query = sa_select(Video.aweme_id, Video.desc).where(Video.desc.contains("#"))
+    with engine.begin() as conn:
+        result = conn.execute(query)
+        while batch := result.fetchmany(_EXPORT_FETCH_SIZE):
+            tag_rows = [
+                {"aweme_id": aweme_id, "tag": tag}
+                for aweme_id, desc in batch
+                for tag in Database._extract_tags(desc)
+            ]
+            if tag_rows:
+                conn.execute(VideoTag.__table__.insert(), tag_rows)
+
+
+def reset_database(db_path: Path) -> None:
+    """删除数据库文件及其 WAL/SHM 附属文件。"""
+    with _SCHEMA_LOCK:
+        _SCHEMA_READY.discard(Path(db_path).absolute())
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
 class Database:
     """基于 SQLite 的轻量级数据库层。"""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
-        SQLModel.metadata.create_all(self._engine)
+        if str(db_path) == _MEMORY_PATH:
+            # 内存库只存在于单个连接中，所有线程必须共用这一个连接
+            self._engine = create_engine(
+                "sqlite://",
+                echo=False,
+                connect_args={
+                    "check_same_thread": False,
+                    "cached_statements": _SQLITE_CACHED_STATEMENTS,
+                },
+                poolclass=StaticPool,
+            )
+            pragmas = _SQLITE_PRAGMAS
+            schema_key = None
+        else:
+            # 建表检查按路径记忆，但目录可能在运行中被删除（清空数据、测试），
+            # mkdir 本身幂等且开销很小，每次都执行
+            schema_key = self.db_path.absolute()
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._engine = create_engine(
+                f"sqlite:///{self.db_path}",
+                echo=False,
+                connect_args={"cached_statements": _SQLITE_CACHED_STATEMENTS},
+            )
+            pragmas = (
+                *_SQLITE_FILE_PRAGMAS,
+                _synchronous_pragma(),
+                *_SQLITE_PRAGMAS,
+            )
+        event.listen(self._engine, "connect", _pragma_listener(pragmas))
+        # 进程内的写入串行化：同一时刻只有一个写事务，其余线程在锁上排队，
+        # 而不是在 busy_timeout 里轮询；内存库共用一个连接时也避免事务交错
+        self._write_lock = threading.Lock()
+        _ensure_schema(self._engine, schema_key)
+
+    @contextmanager
+    def _write_session(self) -> Iterator[Session]:
+        """写事务：BEGIN IMMEDIATE 一开始就拿到写锁，整批写入只提交一次。
+
+        pysqlite 默认在第一条 DML 前才隐式 BEGIN，之前的 SELECT 不在事务内，
+        并发写入时读锁升级为写锁可能直接失败；显式 IMMEDIATE 事务避免了这一点。
+        """
+        with self._write_lock, Session(
+            self._engine, expire_on_commit=False
+        ) as session:
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield session
+                session.commit()
+            except BaseException:
+                session.rollback()
+                raise
+
+    def close(self) -> None:
+        """释放连接池中的所有连接（删除数据库文件前调用）。"""
+        self._engine.dispose()
 
     # ------------------------------------------------------------------
     # Normalisation helpers
@@ -120,7 +365,9 @@ class Database:
             return value[0]
         return value if isinstance(value, str) else None
 
-    def _normalize_author(self, raw: dict[str, Any]) -> dict[str, Any] | None:
+    def _normalize_author(
+        self, raw: dict[str, Any], received_at: dt.datetime | None = None
+    ) -> dict[str, Any] | None:
         if not raw:
             return None
 
@@ -155,12 +402,12 @@ class Database:
             ),
             "aweme_count": self._coerce_int(raw.get("aweme_count")),
             "region": raw.get("region") or raw.get("country"),
-            "received_at": dt.datetime.utcnow(),
+            "received_at": received_at or dt.datetime.utcnow(),
         }
         return normalized
 
     def _normalize_item(
-        self, item: dict[str, Any]
+        self, item: dict[str, Any], received_at: dt.datetime | None = None
     ) -> tuple[dict[str, Any], dict[str, Any] | None]:
         aweme_id = item.get("aweme_id") or item.get("id")
         if not aweme_id:
@@ -224,7 +471,8 @@ class Database:
                 "author_id": author_id,
                 "unique_id": author_unique_id,
                 "sec_uid": author_sec_uid,
-            }
+            },
+            received_at,
         )
 
         return video_data, author_data
@@ -236,13 +484,15 @@ class Database:
         normalized = self._normalize_author(author)
         if not normalized:
             return None
-        with Session(self._engine) as session:
-            record = self._upsert_author(session, normalized)
-            session.commit()
-            session.refresh(record)
-            return record
+        with self._write_session() as session:
+            if _SQLITE_HAS_RETURNING:
+                # 一条 INSERT ... ON CONFLICT ... RETURNING，省去先查再写的往返
+                row = session.execute(_AUTHOR_UPSERT_RETURNING, normalized).one()
+                return Author(**row._mapping)
+            return self._upsert_author(session, normalized)
 
     def _upsert_author(self, session: Session, author_data: dict[str, Any]) -> Author:
+        """旧版 SQLite 不支持 RETURNING 时的回退：先查询再插入或更新。"""
         author_id = author_data["author_id"]
         record = session.get(Author, author_id)
         if record:
@@ -269,61 +519,144 @@ class Database:
     def get_latest_for_author(self, author_id: str) -> dict[str, Any] | None:
         if not author_id:
             return None
-        with Session(self._engine) as session:
-            statement = (
-                select(Video)
-                .where(Video.author_id == str(author_id))
-                .order_by(Video.create_time.desc(), Video.received_at.desc())
-                .limit(1)
-            )
-            row = session.exec(statement).first()
-            if not row:
-                return None
-            return {
-                "aweme_id": row.aweme_id,
-                "author_id": row.author_id,
-                "create_time": row.create_time.isoformat() if row.create_time else None,
-            }
+        # 只取需要的三列，LIMIT 1 配合 (author_id, create_time) 索引只读一行
+        statement = (
+            sa_select(Video.aweme_id, Video.author_id, Video.create_time)
+            .where(Video.author_id == str(author_id))
+            .order_by(Video.create_time.desc(), Video.received_at.desc())
+            .limit(1)
+        )
+        with self._engine.connect() as conn:
+            row = conn.execute(statement).first()
+        if not row:
+            return None
+        return {
+            "aweme_id": row.aweme_id,
+            "author_id": row.author_id,
+            "create_time": row.create_time.isoformat() if row.create_time else None,
+        }
 
     # ------------------------------------------------------------------
     # Video operations
     # ------------------------------------------------------------------
     def upsert_videos(self, items: Iterable[dict[str, Any]]) -> dict[str, int]:
-        inserted = 0
-        updated = 0
-        with Session(self._engine) as session:
-            for raw in items:
-                try:
-                    video_data, author_data = self._normalize_item(raw)
-                except ValueError:
-                    continue
-
-                author_record = None
-                if author_data:
-                    author_record = self._upsert_author(session, author_data)
-
-                if author_record:
-                    if not video_data.get("author_id"):
-                        video_data["author_id"] = author_record.author_id
-                    if author_record.nickname and not video_data.get("author_name"):
-                        video_data["author_name"] = author_record.nickname
-                    if author_record.unique_id and not video_data.get(
-                        "author_unique_id"
-                    ):
-                        video_data["author_unique_id"] = author_record.unique_id
-                    if author_record.sec_uid and not video_data.get("author_sec_uid"):
-                        video_data["author_sec_uid"] = author_record.sec_uid
-
-                existing = session.get(Video, video_data["aweme_id"])
-                if existing:
-                    for key, value in video_data.items():
-                        setattr(existing, key, value)
-                    updated += 1
+        """在单个事务内批量写入视频，使用 executemany + ON CONFLICT 完成 upsert。
+
+        每次调用都会单独提交一次；手上已有多个批次时不要逐个调用，应交给
+        ``upsert_video_chunks``（并发调用方则经 ``ChunkWriter``）合并为一次提交。
+        """
+        return self.upsert_video_chunks([items])[0]
+
+    def upsert_video_chunks(
+        self, chunks: Sequence[Iterable[dict[str, Any]]]
+    ) -> list[dict[str, int]]:
+        """将多个批次合并到同一事务写入，按批次分别返回新增/更新计数。"""
+        # 整次写入共用一个时间戳，不在逐条归一化时反复取当前时间
+        received_at = dt.datetime.utcnow()
+        prepared = [self._prepare_chunk(items, received_at) for items in chunks]
+        return self._write_chunks(prepared, received_at)
+
+    def _prepare_chunk(
+        self, items: Iterable[dict[str, Any]], received_at: dt.datetime
+    ) -> _PreparedChunk:
+        """归一化单个批次，返回 (视频行, 作者行)；缺少 aweme_id 的条目跳过。"""
+        rows: list[dict[str, Any]] = []
+        authors: dict[str, dict[str, Any]] = {}
+        for raw in items:
+            try:
+                video_data, author_data = self._normalize_item(raw, received_at)
+            except ValueError:
+                continue
+
+            if author_data:
+                # 同一作者出现多次时以最后一条为准，与逐条 upsert 结果一致
+                authors[author_data["author_id"]] = author_data
+                self._fill_author_fields(video_data, author_data)
+
+            rows.append(video_data)
+        return rows, authors
+
+    def _write_chunks(
+        self, prepared: Sequence[_PreparedChunk], received_at: dt.datetime
+    ) -> list[dict[str, int]]:
+        """在一个事务内写入已归一化的批次，按批次分别返回新增/更新计数。"""
+        rows: list[dict[str, Any]] = []
+        row_chunks: list[int] = []
+        authors: dict[str, dict[str, Any]] = {}
+        for index, (chunk_rows, chunk_authors) in enumerate(prepared):
+            rows.extend(chunk_rows)
+            row_chunks.extend([index] * len(chunk_rows))
+            authors.update(chunk_authors)
+
+        with self._write_session() as session:
+            if authors:
+                session.execute(_AUTHOR_UPSERT, list(authors.values()))
+
+            results = [{"inserted": 0, "updated": 0} for _ in prepared]
+            if not rows:
+                return results
+
+            existing = self._existing_video_ids(
+                session, [row["aweme_id"] for row in rows]
+            )
+            for row, index in zip(rows, row_chunks, strict=True):
+                row["received_at"] = received_at
+                if row["aweme_id"] in existing:
+                    results[index]["updated"] += 1
                 else:
-                    session.add(Video(**video_data))
-                    inserted += 1
-            session.commit()
-        return {"inserted": inserted, "updated": updated}
+                    existing.add(row["aweme_id"])
+                    results[index]["inserted"] += 1
+
+            session.execute(_VIDEO_UPSERT, rows)
+            self._replace_video_tags(session, rows)
+        return results
+
+    @staticmethod
+    def _fill_author_fields(
+        video_data: dict[str, Any], author_data: dict[str, Any]
+    ) -> None:
+        if not video_data.get("author_id"):
+            video_data["author_id"] = author_data["author_id"]
+        if author_data["nickname"] and not video_data.get("author_name"):
+            video_data["author_name"] = author_data["nickname"]
+        if author_data["unique_id"] and not video_data.get("author_unique_id"):
+            video_data["author_unique_id"] = author_data["unique_id"]
+        if author_data["sec_uid"] and not video_data.get("author_sec_uid"):
+            video_data["author_sec_uid"] = author_data["sec_uid"]
+
+    @staticmethod
+    def _existing_video_ids(session: Session, aweme_ids: list[str]) -> set[str]:
+        existing: set[str] = set()
+        unique_ids = list(dict.fromkeys(aweme_ids))
+        for batch in _param_batches(unique_ids):
+            existing.update(
+                session.exec(
+                    select(Video.aweme_id).where(Video.aweme_id.in_(batch))
+                ).all()
+            )
+        return existing
+
+    @staticmethod
+    def _extract_tags(desc: str | None) -> list[str]:
+        if not desc:
+            return []
+        return list(dict.fromkeys(_HASHTAG_RE.findall(desc)))
+
+    def _replace_video_tags(self, session: Session, rows: list[dict[str, Any]]) -> None:
+        tags_by_video = {
+            row["aweme_id"]: self._extract_tags(row["desc"]) for row in rows
+        }
+        for batch in _param_batches(list(tags_by_video)):
+            session.execute(
+                VideoTag.__table__.delete().where(VideoTag.aweme_id.in_(batch))
+            )
+        tag_rows = [
+            {"aweme_id": aweme_id, "tag": tag}
+            for aweme_id, tags in tags_by_video.items()
+            for tag in tags
+        ]
+        if tag_rows:
+            session.execute(VideoTag.__table__.insert(), tag_rows)
 
     # ------------------------------------------------------------------
     # Querying and export
@@ -347,6 +680,16 @@ class Database:
             like = f"%{author_name.strip()}%"
             conditions.append(Video.author_name.ilike(like))
 
+        tag = filters.get("tag")
+        if tag:
+            conditions.append(
+                Video.aweme_id.in_(
+                    select(VideoTag.aweme_id).where(
+                        VideoTag.tag == str(tag).strip().lstrip("#")
+                    )
+                )
+            )
+
         item_type = filters.get("item_type")
         if item_type:
             conditions.append(Video.item_type == item_type)
@@ -368,45 +711,109 @@ class Database:
         filters: dict[str, Any],
         page: int,
         page_size: int,
+        cursor: Sequence[Any] | None = None,
+        include_total: bool = True,
     ) -> dict[str, Any]:
+        """分页查询视频列表。
+
+        传入上一页返回的 ``next_cursor`` 时按 (create_time, received_at, aweme_id)
+        做 keyset 分页，直接从索引位置继续扫描，翻到深页也不需要 OFFSET 跳过前面的行；
+        未传 cursor 时仍按 page 计算 OFFSET，兼容现有调用方。
+
+        同一筛选条件下翻页时总数不变，调用方可传 ``include_total=False`` 跳过
+        COUNT 查询并沿用第一页的 total，此时返回的 total 为 None。
+        """
         page = max(page, 1)
         page_size = max(min(page_size, 200), 1)
         conditions = self._build_conditions(filters)
 
-        with Session(self._engine) as session:
-            count_stmt = select(func.count()).select_from(Video)
+        with self._engine.connect() as connection:
+            total = None
+            if include_total:
+                count_stmt = sa_select(func.count()).select_from(Video)
+                if conditions:
+                    count_stmt = count_stmt.where(*conditions)
+                total = connection.execute(count_stmt).scalar_one()
+
+            # 一次 LEFT JOIN 带出作者信息，避免列表页再单独查询作者；
+            # 直接查询列而非 ORM 实体，结果行无需构造和校验 Video 对象
+            query = sa_select(
+                *Video.__table__.c,
+                Author.nickname.label("author_nickname"),
+                Author.follower_count.label("author_follower_count"),
+                Author.aweme_count.label("author_aweme_count"),
+            ).outerjoin(Author, Author.author_id == Video.author_id)
             if conditions:
-                count_stmt = count_stmt.where(*conditions)
-            total = session.exec(count_stmt).one()
-
-            offset = (page - 1) * page_size
-            query = select(Video).where(*conditions) if conditions else select(Video)
-            query = query.order_by(Video.create_time.desc(), Video.received_at.desc())
-            rows = session.exec(query.offset(offset).limit(page_size)).all()
-
-        def serialize(row: Video) -> dict[str, Any]:
-            data = row.model_dump()
-            data["create_time"] = (
-                row.create_time.isoformat() if row.create_time else None
+                query = query.where(*conditions)
+            # aweme_id 作为最后的排序键，保证顺序稳定，keyset 游标才能唯一定位
+            query = query.order_by(
+                Video.create_time.desc(),
+                Video.received_at.desc(),
+                Video.aweme_id.desc(),
             )
-            data["received_at"] = row.received_at.isoformat()
+            if cursor:
+                rows = connection.execute(
+                    query.where(self._after_cursor(cursor)).limit(page_size)
+                ).mappings().all()
+                if len(rows) < page_size and cursor[0] is not None:
+                    # create_time 为空的行排在最后，不在行值比较范围内；
+                    # 有值的行翻完后从空值部分的开头接上
+                    rows += connection.execute(
+                        query.where(Video.create_time.is_(None)).limit(
+                            page_size - len(rows)
+                        )
+                    ).mappings().all()
+            else:
+                query = query.offset((page - 1) * page_size)
+                rows = connection.execute(query.limit(page_size)).mappings().all()
+
+        def serialize(row: Any) -> dict[str, Any]:
+            data = dict(row)
+            nickname = data.pop("author_nickname")
+            create_time = data["create_time"]
+            data["create_time"] = create_time.isoformat() if create_time else None
+            data["received_at"] = data["received_at"].isoformat()
+            if not data["author_name"]:
+                data["author_name"] = nickname
             return data
 
+        items = [serialize(row) for row in rows]
+        next_cursor = None
+        if len(items) == page_size:
+            last = items[-1]
+            next_cursor = [last["create_time"], last["received_at"], last["aweme_id"]]
+
         return {
-            "items": [serialize(row) for row in rows],
+            "items": items,
             "page": page,
             "page_size": page_size,
             "total": total,
+            "next_cursor": next_cursor,
         }
 
+    @staticmethod
+    def _after_cursor(cursor: Sequence[Any]) -> Any:
+        """排在游标之后的行，写成行值比较，SQLite 可直接在索引上定位起点。
+
+        行值比较中 create_time 为空的行结果为 NULL，不会被选中；游标本身
+        create_time 为空时单独处理，有值时空值部分由 ``list_videos`` 补查。
+        """
+        create_time, received_at, aweme_id = cursor
+        received_at = dt.datetime.fromisoformat(received_at)
+        if create_time is None:
+            return and_(
+                Video.create_time.is_(None),
+                tuple_(Video.received_at, Video.aweme_id) < (received_at, aweme_id),
+            )
+        return tuple_(Video.create_time, Video.received_at, Video.aweme_id) < (
+            dt.datetime.fromisoformat(create_time),
+            received_at,
+            aweme_id,
+        )
+
     def export_csv(self, filters: dict[str, Any]) -> Path:
+        """按筛选条件导出 CSV，逐行流式读取以保持内存占用恒定。"""
         conditions = self._build_conditions(filters)
-        with Session(self._engine) as session:
-            query = select(Video)
-            if conditions:
-                query = query.where(*conditions)
-            rows = session.exec(query.order_by(Video.create_time.desc())).all()
-
         export_dir = self.db_path.parent
         timestamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         export_path = export_dir / f"douyin_export_{timestamp}.csv"
@@ -433,16 +840,111 @@ class Database:
             "item_type",
             "received_at",
         ]
+        columns = [Video.__table__.c[name] for name in headers]
+        datetime_positions = [
+            index
+            for index, name in enumerate(headers)
+            if name in ("create_time", "received_at")
+        ]
 
-        with export_path.open("w", newline="", encoding="utf-8") as fp:
-            writer = csv.DictWriter(fp, fieldnames=headers)
-            writer.writeheader()
-            for row in rows:
-                payload = row.model_dump()
-                payload["create_time"] = (
-                    row.create_time.isoformat() if row.create_time else ""
-                )
-                payload["received_at"] = row.received_at.isoformat()
-                writer.writerow({key: payload.get(key, "") for key in headers})
+        query = sa_select(*columns)
+        if conditions:
+            query = query.where(*conditions)
+        query = query.order_by(Video.create_time.desc())
+
+        def rows(result: Any) -> Iterator[list[Any]]:
+            # 每次只从游标取一批，内存占用与总行数无关
+            while batch := result.fetchmany(_EXPORT_FETCH_SIZE):
+                for record in batch:
+                    row = list(record)
+                    for index in datetime_positions:
+                        value = row[index]
+                        row[index] = value.isoformat() if value else ""
+                    yield row
+
+        with self._engine.connect() as conn, export_path.open(
+            "w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE
+        ) as fp:
+            result = conn.execute(query)
+            writer = csv.writer(fp)
+            writer.writerow(headers)
+            # 整个导出只调用一次 writerows，由 C 实现内部迭代生成器
+            writer.writerows(rows(result))
 
         return export_path
+
+
+class ChunkWriter:
+    """单写线程：并发提交的批次在队列中合并，共用一个事务写入。
+
+    pywebview 的每次 JS 调用运行在独立线程中，多个 push_chunk 同时到达时
+    会各自打开事务争抢写锁。这里改为由一个后台线程串行写入，每次取出队列中
+    已积压的全部批次（最多 ``max_batches`` 个）一并提交；``submit`` 阻塞到
+    所在批次落盘后返回该批次自己的计数，调用方语义不变。
+    """
+
+    def __init__(self, db: Database, max_batches: int = 512) -> None:
+        self._db = db
+        self._max_batches = max_batches
+        self._queue: queue.SimpleQueue[
+            tuple[list[dict[str, Any]], Future[dict[str, int]]]
+        ] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, items: Iterable[dict[str, Any]]) -> dict[str, int]:
+        future: Future[dict[str, int]] = Future()
+        self._ensure_thread()
+        self._queue.put((list(items), future))
+        return future.result()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="chunk-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            pending = [self._queue.get()]
+            while len(pending) < self._max_batches:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # 逐个批次归一化，某个批次的数据有问题时只让该批次的调用方失败
+            received_at = dt.datetime.utcnow()
+            prepared: list[tuple[_PreparedChunk, Future[dict[str, int]]]] = []
+            for items, future in pending:
+                try:
+                    chunk = self._db._prepare_chunk(items, received_at)
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    prepared.append((chunk, future))
+            if prepared:
+                self._write(prepared, received_at)
+
+    def _write(
+        self,
+        prepared: list[tuple[_PreparedChunk, Future[dict[str, int]]]],
+        received_at: dt.datetime,
+    ) -> None:
+        try:
+            results = self._db._write_chunks(
+                [chunk for chunk, _ in prepared], received_at
+            )
+        except Exception as exc:
+            if len(prepared) == 1:
+                prepared[0][1].set_exception(exc)
+                return
+            # 合并写入失败时逐个批次重试，避免一个坏批次连累其他批次丢数据
+            for entry in prepared:
+                self._write([entry], received_at)
+            return
+
+        for (_, future), result in zip(prepared, results, strict=True):
+            future.set_result(result)
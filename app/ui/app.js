@@ -298,7 +298,7 @@ document.addEventListener("DOMContentLoaded", () => {
     document.getElementById("prev-page-btn")?.addEventListener("click", () => {
         if (currentPage > 1) {
             currentPage--;
-            loadData();
+            loadData(true);
         }
     });
 
@@ -306,20 +306,25 @@ document.addEventListener("DOMContentLoaded", () => {
         const maxPage = Math.ceil(totalItems / currentPageSize);
         if (currentPage < maxPage) {
             currentPage++;
-            loadData();
+            loadData(true);
         }
     });
 
     // ------------------------------------------------------------
     // Data loading
     // ------------------------------------------------------------
-    async function loadData() {
+    // Paging within the same filters keeps the total, so skip the COUNT query
+    async function loadData(reuseTotal = false) {
         if (!api) {
             return;
         }
         try {
-            const result = await api.list_videos(currentFilters, currentPage, currentPageSize);
-            totalItems = result.total || 0;
+            const result = await api.list_videos(
+                currentFilters, currentPage, currentPageSize, null, !reuseTotal
+            );
+            if (!reuseTotal) {
+                totalItems = result.total || 0;
+            }
             renderData(result);
         } catch (error) {
             console.error("Failed to load data:", error);
@@ -18,9 +18,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from market_data_collector import (
     ExchangeAdapter,
     SubscriptionManager,
-    configure_logging,
+    init_logging,
     settings,
 )
+from market_data_collector.utils import run
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,7 @@ async def consume_queue(queue: asyncio.Queue, queue_name: str, running: asyncio.
 
 async def main():
     """Main entry point for subscription demo."""
-    configure_logging()
+    init_logging()
     
     logger.info("=" * 60)
     logger.info("Market Data Subscription Demo")
@@ -201,7 +202,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Exiting...")
     except Exception as e:
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from market_data_collector import SubscriptionManager
 from market_data_collector.config import MarketDataSettings
+from market_data_collector.utils import run
 
 # Configure logging
 logging.basicConfig(
@@ -74,6 +75,10 @@ def create_mock_exchange():
     exchange.watch_ohlcv = AsyncMock(return_value=[
         [1698765420000, 34990.0, 35010.0, 34980.0, 35000.0, 123.45]
     ])
+    exchange.watch_ohlcv_multi = AsyncMock(side_effect=lambda symbol, timeframes: {
+        timeframe: [[1698765420000, 34990.0, 35010.0, 34980.0, 35000.0, 123.45]]
+        for timeframe in timeframes
+    })
     
     # Mock funding rate
     exchange.fetch_funding_rate = AsyncMock(return_value={
@@ -229,7 +234,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Demo interrupted by user")
     except Exception as e:
@@ -0,0 +1,83 @@
+"""
+Fake exchange adapter shared by the subscription tests.
+
+Implements the ExchangeAdapter methods the SubscriptionManager calls with
+plain ``async def`` methods returning canned payloads, so the subscription
+loops spend their time in the code under test instead of in
+``unittest.mock`` speccing and call dispatch.
+"""
+
+TICKER = {
+    "symbol": "BTC/USDT:USDT",
+    "timestamp": 1698765432000,
+    "last": 35000.0,
+    "bid": 34999.5,
+    "ask": 35000.5,
+}
+
+ORDERBOOK = {
+    "symbol": "BTC/USDT:USDT",
+    "timestamp": 1698765432000,
+    "bids": [[34999.5, 1.5], [34999.0, 2.3]],
+    "asks": [[35000.5, 1.8], [35001.0, 2.1]],
+}
+
+TRADES = [
+    {
+        "id": "12345",
+        "timestamp": 1698765432000,
+        "symbol": "BTC/USDT:USDT",
+        "side": "buy",
+        "price": 35000.0,
+        "amount": 0.5,
+    }
+]
+
+OHLCV = [[1698765420000, 34990.0, 35010.0, 34980.0, 35000.0, 123.45]]
+
+FUNDING_RATE = {
+    "symbol": "BTC/USDT:USDT",
+    "fundingRate": 0.0001,
+    "fundingTimestamp": 1698768000000,
+    "timestamp": 1698765432000,
+}
+
+MARK_PRICE = 35005.5
+
+
+class FakeExchange:
+    """
+    Stand-in for ExchangeAdapter returning the canned payloads above.
+
+    Args:
+        fail_first_ticker: Raise from the first ``watch_ticker`` call, to
+            exercise the subscription error recovery path
+    """
+
+    def __init__(self, fail_first_ticker: bool = False):
+        self.fail_first_ticker = fail_first_ticker
+        self.ticker_calls = 0
+
+    async def watch_ticker(self, symbol):
+        self.ticker_calls += 1
+        if self.fail_first_ticker and self.ticker_calls == 1:
+            raise RuntimeError("Simulated error")
+        return TICKER
+
+    async def watch_order_book(self, symbol, limit=None):
+        return ORDERBOOK
+
+    async def watch_trades(self, symbol):
+        return TRADES
+
+    async def watch_ohlcv(self, symbol, timeframe="1m"):
+        return OHLCV
+
+    async def watch_ohlcv_multi(self, symbol, timeframes):
+        return {timeframe: OHLCV for timeframe in timeframes}
+
+    async def fetch_funding_rate(self, symbol):
+        return FUNDING_RATE
+
+    async def derive_mark_price(self, symbol):
+        return MARK_PRICE
@@ -11,6 +11,8 @@ from .config import (
     settings,
 )
 from .exchange import ExchangeAdapter, create_exchange_adapter
+from .models import Ticker, TradeColumns
+from .ringbuf import SharedRingBuffer
 from .runtime import (
     Runtime,
     acquire_reader,
@@ -22,8 +24,8 @@ from .runtime import (
     stop as stop_runtime,
 )
 from .storage import SQLiteStorage
-from .subscriptions import SubscriptionManager
-from .utils.logging import configure_logging, get_logger
+from .subscriptions import Channel, ChannelQueue, Envelope, SubscriptionManager
+from .utils.logging import configure_logging, get_logger, init_logging
 
 __all__ = [
     "ExchangeSettings",
@@ -44,10 +46,15 @@ __all__ = [
     "acquire_reader",
     "release_reader",
     "reader_session",
+    "SharedRingBuffer",
+    "Ticker",
+    "TradeColumns",
     "SQLiteStorage",
+    "Channel",
+    "ChannelQueue",
+    "Envelope",
     "SubscriptionManager",
     "configure_logging",
     "get_logger",
+    "init_logging",
 ]
-
-configure_logging()
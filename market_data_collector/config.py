@@ -42,7 +42,8 @@ class LoggingSettings(BaseModel):
     """Logging configuration for the collector."""
 
     level: str = "INFO"
-    file: str = "logs/market_data_collector.log"
+    # None disables file logging (a NullHandler is installed instead)
+    file: str | None = "logs/market_data_collector.log"
     format: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     datefmt: str | None = None
 
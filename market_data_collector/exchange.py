@@ -13,13 +13,135 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import random
+import tempfile
+import time
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import ccxt
 import ccxt.pro as ccxtpro
 
+from .models import Ticker, TradeColumns
+from .utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Timestamps below this (year 3000 in seconds) are treated as seconds
+_SECONDS_CUTOFF = 32503680000
+
+# Batches longer than this are normalized with a single unit check
+_OHLCV_BATCH_MIN = 8
+
+# Default location for the on-disk markets cache
+_MARKETS_CACHE_DIR = Path.home() / ".cache" / "doudou"
+
+# Market tables built by ccxt's set_markets, shared with the ccxt.pro clients
+_SHARED_MARKET_ATTRS = (
+    "markets",
+    "markets_by_id",
+    "symbols",
+    "ids",
+    "currencies",
+    "currencies_by_id",
+    "codes",
+)
+
+# Retry attempts (not first attempts) allowed in flight at once per event
+# loop, so a reconnect storm across many symbols is admitted gradually
+_RETRY_CONCURRENCY = 8
+
+_retry_gate: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+
+def _retry_slot() -> asyncio.Semaphore:
+    """Return the retry semaphore shared by all adapters on the running loop."""
+    global _retry_gate
+    loop = asyncio.get_running_loop()
+    if _retry_gate is None or _retry_gate[0] is not loop:
+        _retry_gate = (loop, asyncio.Semaphore(_RETRY_CONCURRENCY))
+    return _retry_gate[1]
+
+
+# Environment overrides for the WebSocket connection pool
+_ENV_MAX_CONNECTIONS = "MAX_WEBSOCKET_CONNECTIONS"
+_ENV_MAX_SYMBOLS_PER_CONNECTION = "MAX_SYMBOLS_PER_WEBSOCKET"
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={value!r}")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _format_symbol(base: str, quote: str, market_type: str) -> str:
+    if market_type == "swap":
+        # Perpetual futures format
+        return f"{base}/{quote}:{quote}"
+    # Spot format
+    return f"{base}/{quote}"
+
+
+class _ProPool:
+    """
+    Fixed set of ccxt.pro clients sharing the subscription load.
+    
+    Each symbol is pinned to one client by a stable hash of its name, so all
+    of a symbol's streams share that client's socket and the per-connection
+    subscription cap applies to a slice of the symbols rather than all.
+    """
+
+    __slots__ = ("clients", "max_symbols", "_symbols")
+
+    def __init__(
+        self,
+        clients: List[ccxtpro.Exchange],
+        max_symbols: Optional[int] = None,
+    ):
+        self.clients = clients
+        self.max_symbols = max_symbols
+        self._symbols: List[Set[str]] = [set() for _ in clients]
+
+    def pick(self, symbol: str) -> ccxtpro.Exchange:
+        """Return the client that owns ``symbol``."""
+        if len(self.clients) == 1:
+            index = 0
+        else:
+            index = zlib.crc32(symbol.encode()) % len(self.clients)
+        
+        symbols = self._symbols[index]
+        if symbol not in symbols:
+            symbols.add(symbol)
+            if self.max_symbols and len(symbols) > self.max_symbols:
+                logger.warning(
+                    f"WebSocket connection {index} holds {len(symbols)} symbols "
+                    f"(limit {self.max_symbols}); raise {_ENV_MAX_CONNECTIONS}"
+                )
+        return self.clients[index]
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection count and symbols assigned to each connection."""
+        return {
+            "connections": len(self.clients),
+            "max_symbols_per_connection": self.max_symbols,
+            "symbols_per_connection": [len(symbols) for symbols in self._symbols],
+        }
+
+    async def close(self) -> None:
+        """Close every client in the pool."""
+        await asyncio.gather(
+            *(client.close() for client in self.clients if hasattr(client, "close"))
+        )
+
 
 class ExchangeAdapter:
     """
@@ -30,6 +152,22 @@ class ExchangeAdapter:
     reconnection and backoff logic.
     """
 
+    __slots__ = (
+        "exchange_name",
+        "default_type",
+        "sandbox",
+        "markets_cache_ttl",
+        "markets_cache_dir",
+        "exchange_pro",
+        "exchange",
+        "max_retries",
+        "base_backoff",
+        "max_backoff",
+        "_connected",
+        "_watch_tasks",
+        "_pool",
+    )
+
     def __init__(
         self,
         exchange_name: str = "bybit",
@@ -38,6 +176,11 @@ class ExchangeAdapter:
         api_key: Optional[str] = None,
         secret: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
+        ws_options: Optional[Dict[str, Any]] = None,
+        markets_cache_ttl: int = 21600,
+        markets_cache_dir: Optional[Path] = None,
+        max_connections: Optional[int] = None,
+        max_symbols_per_connection: Optional[int] = None,
     ):
         """
         Initialize exchange adapter with ccxt.pro and ccxt instances.
@@ -49,10 +192,23 @@ class ExchangeAdapter:
             api_key: API key for authenticated endpoints (optional)
             secret: API secret for authenticated endpoints (optional)
             options: Additional exchange-specific options
+            ws_options: WebSocket client options passed to ccxt.pro
+                (e.g. ``{"compress": 0}`` to skip per-frame inflate)
+            markets_cache_ttl: Seconds a cached markets file stays valid;
+                0 disables the on-disk markets cache
+            markets_cache_dir: Directory for the markets cache
+                (default: ~/.cache/doudou)
+            max_connections: Number of ccxt.pro clients (WebSocket
+                connections) symbols are spread across (default:
+                ``MAX_WEBSOCKET_CONNECTIONS`` or 1)
+            max_symbols_per_connection: Symbols per connection before a
+                warning is logged (default: ``MAX_SYMBOLS_PER_WEBSOCKET``)
         """
         self.exchange_name = exchange_name
         self.default_type = default_type
         self.sandbox = sandbox
+        self.markets_cache_ttl = markets_cache_ttl
+        self.markets_cache_dir = Path(markets_cache_dir or _MARKETS_CACHE_DIR)
         
         # Configuration for both instances
         config = {
@@ -67,9 +223,23 @@ class ExchangeAdapter:
         if options:
             config["options"].update(options)
         
-        # Initialize async exchange (ccxt.pro) for WebSocket
+        # WebSocket-only settings go to the ccxt.pro instance
+        config_pro = config
+        if ws_options:
+            config_pro = {**config, "options": {**config["options"], "ws": ws_options}}
+        
+        # Initialize async exchanges (ccxt.pro) for WebSocket; the first
+        # client doubles as ``exchange_pro`` for non symbol-specific calls
+        if max_connections is None:
+            max_connections = _env_int(_ENV_MAX_CONNECTIONS) or 1
+        if max_symbols_per_connection is None:
+            max_symbols_per_connection = _env_int(_ENV_MAX_SYMBOLS_PER_CONNECTION)
         exchange_class_pro = getattr(ccxtpro, exchange_name)
-        self.exchange_pro: ccxtpro.Exchange = exchange_class_pro(config)
+        self._pool = _ProPool(
+            [exchange_class_pro(config_pro) for _ in range(max(1, max_connections))],
+            max_symbols_per_connection,
+        )
+        self.exchange_pro: ccxtpro.Exchange = self._pool.clients[0]
         
         # Initialize sync exchange (ccxt) for REST fallback
         exchange_class = getattr(ccxt, exchange_name)
@@ -77,7 +247,8 @@ class ExchangeAdapter:
         
         # Enable sandbox mode if requested
         if sandbox:
-            self.exchange_pro.set_sandbox_mode(True)
+            for client in self._pool.clients:
+                client.set_sandbox_mode(True)
             self.exchange.set_sandbox_mode(True)
             logger.info(f"Sandbox mode enabled for {exchange_name}")
         
@@ -92,7 +263,8 @@ class ExchangeAdapter:
         
         logger.info(
             f"Exchange adapter initialized: {exchange_name} "
-            f"(type={default_type}, sandbox={sandbox})"
+            f"(type={default_type}, sandbox={sandbox}, "
+            f"ws_connections={len(self._pool.clients)})"
         )
     
     async def close(self) -> None:
@@ -109,9 +281,8 @@ class ExchangeAdapter:
         
         self._watch_tasks.clear()
         
-        # Close async exchange
-        if hasattr(self.exchange_pro, "close"):
-            await self.exchange_pro.close()
+        # Close async exchanges
+        await self._pool.close()
         
         # Close sync exchange
         if hasattr(self.exchange, "close"):
@@ -128,7 +299,8 @@ class ExchangeAdapter:
         """Context manager exit."""
         await self.close()
     
-    def _normalize_timestamp(self, timestamp: Optional[int]) -> Optional[int]:
+    @staticmethod
+    def _normalize_timestamp(timestamp: Optional[int]) -> Optional[int]:
         """
         Normalize timestamp to milliseconds.
         
@@ -141,11 +313,9 @@ class ExchangeAdapter:
         if timestamp is None:
             return None
         
-        # If timestamp looks like seconds (< year 3000 in seconds), convert to ms
-        if timestamp < 32503680000:
-            return int(timestamp * 1000)
-        
-        return int(timestamp)
+        # Timestamps below year 3000 in seconds are seconds; scale instead of
+        # branching to separate return paths
+        return int(timestamp * (1000 if timestamp < _SECONDS_CUTOFF else 1))
     
     def _normalize_ticker(self, ticker: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize ticker data with timestamp in milliseconds."""
@@ -153,6 +323,10 @@ class ExchangeAdapter:
             ticker["timestamp"] = self._normalize_timestamp(ticker["timestamp"])
         return ticker
     
+    def _normalize_ticker_struct(self, ticker: Dict[str, Any]) -> Ticker:
+        """Normalize ticker data into a Ticker struct."""
+        return Ticker.from_ccxt(self._normalize_ticker(ticker))
+    
     def _normalize_order_book(self, orderbook: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize order book data with timestamp in milliseconds."""
         if orderbook and "timestamp" in orderbook:
@@ -176,6 +350,102 @@ class ExchangeAdapter:
             ohlcv[0] = self._normalize_timestamp(ohlcv[0])
         return ohlcv
     
+    def _normalize_trades(self, trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize a list of trades in place.
+        
+        Like OHLCV batches, one response uses a single timestamp unit, so
+        the unit is taken from the first trade with a timestamp and
+        millisecond batches are returned untouched.
+        """
+        first = next(
+            (t["timestamp"] for t in trades if t.get("timestamp") is not None), None
+        )
+        if first is None or first >= _SECONDS_CUTOFF:
+            return trades
+        
+        for trade in trades:
+            timestamp = trade.get("timestamp")
+            if timestamp is not None:
+                trade["timestamp"] = int(timestamp * 1000)
+        return trades
+    
+    def _normalize_trade_columns(self, trades: List[Dict[str, Any]]) -> TradeColumns:
+        """Normalize a list of trades into column arrays."""
+        return TradeColumns.from_trades(self._normalize_trades(trades))
+    
+    def _normalize_ohlcv_list(self, ohlcv_list: List[List]) -> List[List]:
+        """Normalize a list of OHLCV candles."""
+        if len(ohlcv_list) > _OHLCV_BATCH_MIN:
+            return self._normalize_ohlcv_batch(ohlcv_list)
+        return [self._normalize_ohlcv(ohlcv) for ohlcv in ohlcv_list]
+    
+    def _normalize_ohlcv_batch(self, rows: List[List]) -> List[List]:
+        """
+        Normalize a batch of OHLCV candles in place.
+        
+        One exchange response uses a single timestamp unit, so the
+        seconds/milliseconds decision is made once from the first candle
+        instead of per row. Millisecond batches, the usual case, are
+        returned without touching any row.
+        
+        Args:
+            rows: Candles as [timestamp, open, high, low, close, volume]
+            
+        Returns:
+            The same list with timestamps in milliseconds
+        """
+        first = rows[0][0] if rows and rows[0] else None
+        if first is None or first >= _SECONDS_CUTOFF:
+            return rows
+        
+        for row in rows:
+            row[0] = int(row[0] * 1000)
+        return rows
+    
+    def _demux_ohlcv(
+        self, update: Dict[str, Dict[str, List[List]]]
+    ) -> Dict[str, List[List]]:
+        """Flatten a ``{symbol: {timeframe: candles}}`` update by timeframe."""
+        return {
+            timeframe: self._normalize_ohlcv_list(ohlcv_list)
+            for by_timeframe in update.values()
+            for timeframe, ohlcv_list in by_timeframe.items()
+        }
+    
+    async def _watch(
+        self,
+        operation_name: str,
+        watch: Callable[..., Awaitable[Any]],
+        normalize: Callable[[Any], Any],
+        *args,
+    ) -> Any:
+        """
+        Await a ccxt.pro watch call, entering the retry loop only on failure.
+        
+        The success path is a single await with no closure or retry frame,
+        which is what runs for nearly every WebSocket message.
+        
+        Args:
+            operation_name: Name of the operation for logging
+            watch: ccxt.pro watch method
+            normalize: Function applied to the watch result
+            *args: Positional arguments for the watch method
+            
+        Returns:
+            Normalized watch result
+        """
+        try:
+            return normalize(await watch(*args))
+        except Exception as e:
+            error = e
+        
+        async def _retry():
+            return normalize(await watch(*args))
+        
+        # The fast path was the first attempt; go straight to gated retries
+        return await self._retry_after_failure(_retry, operation_name, error)
+    
     async def _retry_with_backoff(
         self, 
         coro, 
@@ -184,7 +454,10 @@ class ExchangeAdapter:
         **kwargs
     ) -> Any:
         """
-        Execute coroutine with exponential backoff retry logic.
+        Execute coroutine with jittered exponential backoff retry logic.
+        
+        The first attempt runs immediately; failures are handed to
+        ``_retry_after_failure``.
         
         Args:
             coro: Coroutine function to execute
@@ -198,33 +471,70 @@ class ExchangeAdapter:
         Raises:
             Exception: If all retries are exhausted
         """
-        last_exception = None
+        try:
+            return await coro(*args, **kwargs)
+        except Exception as e:
+            error = e
         
-        for attempt in range(self.max_retries):
+        return await self._retry_after_failure(
+            coro, operation_name, error, *args, **kwargs
+        )
+    
+    async def _retry_after_failure(
+        self,
+        coro,
+        operation_name: str,
+        error: Exception,
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Retry a coroutine whose first attempt already failed with ``error``.
+        
+        Delays use decorrelated jitter (a random value between
+        ``base_backoff`` and three times the previous delay, capped at
+        ``max_backoff``) so adapters failing together do not retry in
+        lockstep. Every retry sleeps first and then runs under a per-loop
+        semaphore that limits how many retries run at once.
+        
+        Args:
+            coro: Coroutine function to execute
+            operation_name: Name of the operation for logging
+            error: Exception raised by the first attempt
+            *args: Positional arguments for the coroutine
+            **kwargs: Keyword arguments for the coroutine
+            
+        Returns:
+            Result from the coroutine
+            
+        Raises:
+            Exception: The last error once ``max_retries`` attempts failed
+        """
+        backoff = self.base_backoff
+        
+        for attempt in range(1, self.max_retries):
+            # Decorrelated jitter
+            backoff = min(
+                random.uniform(self.base_backoff, backoff * 3),
+                self.max_backoff
+            )
+            
+            logger.warning(
+                f"{operation_name} failed (attempt {attempt}/{self.max_retries}): "
+                f"{error}. Retrying in {backoff:.1f}s..."
+            )
+            
+            await asyncio.sleep(backoff)
             try:
-                return await coro(*args, **kwargs)
+                async with _retry_slot():
+                    return await coro(*args, **kwargs)
             except Exception as e:
-                last_exception = e
-                
-                if attempt < self.max_retries - 1:
-                    # Calculate backoff delay
-                    backoff = min(
-                        self.base_backoff * (2 ** attempt),
-                        self.max_backoff
-                    )
-                    
-                    logger.warning(
-                        f"{operation_name} failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {backoff:.1f}s..."
-                    )
-                    
-                    await asyncio.sleep(backoff)
-                else:
-                    logger.error(
-                        f"{operation_name} failed after {self.max_retries} attempts: {e}"
-                    )
+                error = e
         
-        raise last_exception
+        logger.error(
+            f"{operation_name} failed after {self.max_retries} attempts: {error}"
+        )
+        raise error
     
     # ========================================================================
     # WebSocket Watchers (ccxt.pro)
@@ -240,13 +550,30 @@ class ExchangeAdapter:
         Returns:
             Ticker data with normalized timestamp in milliseconds
         """
-        async def _watch():
-            ticker = await self.exchange_pro.watch_ticker(symbol)
-            return self._normalize_ticker(ticker)
+        return await self._watch(
+            f"watch_ticker({symbol})",
+            self._pool.pick(symbol).watch_ticker,
+            self._normalize_ticker,
+            symbol,
+        )
+    
+    async def watch_ticker_struct(self, symbol: str) -> Ticker:
+        """
+        Watch ticker updates via WebSocket, returned as a Ticker struct.
         
-        return await self._retry_with_backoff(
-            _watch,
-            f"watch_ticker({symbol})"
+        Same stream as ``watch_ticker`` with only the common fields kept.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., "BTC/USDT:USDT")
+            
+        Returns:
+            Ticker with timestamp in milliseconds
+        """
+        return await self._watch(
+            f"watch_ticker({symbol})",
+            self._pool.pick(symbol).watch_ticker,
+            self._normalize_ticker_struct,
+            symbol,
         )
     
     async def watch_order_book(
@@ -264,13 +591,12 @@ class ExchangeAdapter:
         Returns:
             Order book data with normalized timestamp in milliseconds
         """
-        async def _watch():
-            orderbook = await self.exchange_pro.watch_order_book(symbol, limit)
-            return self._normalize_order_book(orderbook)
-        
-        return await self._retry_with_backoff(
-            _watch,
-            f"watch_order_book({symbol}, limit={limit})"
+        return await self._watch(
+            f"watch_order_book({symbol}, limit={limit})",
+            self._pool.pick(symbol).watch_order_book,
+            self._normalize_order_book,
+            symbol,
+            limit,
         )
     
     async def watch_trades(self, symbol: str) -> List[Dict[str, Any]]:
@@ -283,13 +609,31 @@ class ExchangeAdapter:
         Returns:
             List of trade data with normalized timestamps in milliseconds
         """
-        async def _watch():
-            trades = await self.exchange_pro.watch_trades(symbol)
-            return [self._normalize_trade(trade) for trade in trades]
+        return await self._watch(
+            f"watch_trades({symbol})",
+            self._pool.pick(symbol).watch_trades,
+            self._normalize_trades,
+            symbol,
+        )
+    
+    async def watch_trades_columnar(self, symbol: str) -> TradeColumns:
+        """
+        Watch trades via WebSocket, returned column-wise.
         
-        return await self._retry_with_backoff(
-            _watch,
-            f"watch_trades({symbol})"
+        Same stream as ``watch_trades`` but packed into typed arrays, for
+        consumers that aggregate large batches.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., "BTC/USDT:USDT")
+            
+        Returns:
+            TradeColumns with timestamps in milliseconds
+        """
+        return await self._watch(
+            f"watch_trades({symbol})",
+            self._pool.pick(symbol).watch_trades,
+            self._normalize_trade_columns,
+            symbol,
         )
     
     async def watch_ohlcv(
@@ -312,20 +656,100 @@ class ExchangeAdapter:
             List of OHLCV arrays with normalized timestamps in milliseconds
             Format: [[timestamp, open, high, low, close, volume], ...]
         """
-        async def _watch():
-            ohlcv_list = await self.exchange_pro.watch_ohlcv(
-                symbol, 
-                timeframe, 
-                since, 
-                limit
-            )
-            return [self._normalize_ohlcv(ohlcv) for ohlcv in ohlcv_list]
+        return await self._watch(
+            f"watch_ohlcv({symbol}, {timeframe})",
+            self._pool.pick(symbol).watch_ohlcv,
+            self._normalize_ohlcv_list,
+            symbol,
+            timeframe,
+            since,
+            limit,
+        )
+    
+    async def watch_ohlcv_multi(
+        self,
+        symbol: str,
+        timeframes: List[str],
+    ) -> Dict[str, List[List]]:
+        """
+        Watch OHLCV updates for several timeframes of one symbol.
         
-        return await self._retry_with_backoff(
-            _watch,
-            f"watch_ohlcv({symbol}, {timeframe})"
+        Uses a single ``watchOHLCVForSymbols`` subscription when the exchange
+        supports it and demultiplexes the result by timeframe. Otherwise falls
+        back to one ``watch_ohlcv`` call per timeframe.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., "BTC/USDT:USDT")
+            timeframes: Timeframes to watch (e.g., ["1m", "5m", "1h"])
+            
+        Returns:
+            Mapping of timeframe to list of OHLCV arrays with normalized
+            timestamps; only timeframes that received an update are present
+        """
+        client = self._pool.pick(symbol)
+        supported = client.has.get("watchOHLCVForSymbols")
+        if len(timeframes) == 1 or not supported:
+            return await self._watch_ohlcv_each(symbol, timeframes)
+        
+        return await self._watch(
+            f"watch_ohlcv_multi({symbol}, {','.join(timeframes)})",
+            client.watch_ohlcv_for_symbols,
+            self._demux_ohlcv,
+            [[symbol, timeframe] for timeframe in timeframes],
         )
     
+    async def _watch_ohlcv_each(
+        self,
+        symbol: str,
+        timeframes: List[str],
+    ) -> Dict[str, List[List]]:
+        """
+        Fallback for ``watch_ohlcv_multi`` with one watch per timeframe.
+        
+        Keeps one pending ``watch_ohlcv`` task per timeframe in
+        ``_watch_tasks`` across calls and returns as soon as any of them
+        completes, so a timeframe stuck in its retry backoff does not hold
+        back the others. Tasks still pending are reused by the next call.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., "BTC/USDT:USDT")
+            timeframes: Timeframes to watch
+            
+        Returns:
+            Mapping of timeframe to OHLCV arrays for the timeframes that
+            completed successfully
+            
+        Raises:
+            Exception: The first error if every completed timeframe failed
+        """
+        pending: Dict[asyncio.Task, tuple[str, str]] = {}
+        for timeframe in timeframes:
+            name = f"watch_ohlcv({symbol}, {timeframe})"
+            task = self._watch_tasks.get(name)
+            if task is None:
+                task = asyncio.create_task(self.watch_ohlcv(symbol, timeframe))
+                self._watch_tasks[name] = task
+            pending[task] = (name, timeframe)
+        
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        
+        updates: Dict[str, List[List]] = {}
+        errors: List[BaseException] = []
+        for task, (name, timeframe) in pending.items():
+            if task not in done:
+                continue
+            del self._watch_tasks[name]
+            error = task.exception()
+            if error is None:
+                updates[timeframe] = task.result()
+            else:
+                errors.append(error)
+                logger.warning(f"{name} failed: {error}")
+        
+        if errors and not updates:
+            raise errors[0]
+        return updates
+    
     # ========================================================================
     # Funding Rate and Mark Price
     # ========================================================================
@@ -474,7 +898,7 @@ class ExchangeAdapter:
                 since,
                 limit
             )
-            return [self._normalize_ohlcv(ohlcv) for ohlcv in ohlcv_list]
+            return self._normalize_ohlcv_list(ohlcv_list)
         
         return await self._retry_with_backoff(
             _fetch,
@@ -503,6 +927,31 @@ class ExchangeAdapter:
             f"fetch_ticker({symbol})"
         )
     
+    async def fetch_ticker_fast(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch ticker via REST on the async ccxt.pro client.
+        
+        Unlike ``fetch_ticker`` this does not hop to a worker thread: the
+        request runs on the event loop over the async client's keep-alive
+        HTTP session, so concurrent calls for many symbols share pooled
+        connections instead of each occupying a thread.
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Ticker data with normalized timestamp
+        """
+        client = self._pool.pick(symbol)
+        
+        async def _fetch():
+            return self._normalize_ticker(await client.fetch_ticker(symbol))
+        
+        return await self._retry_with_backoff(
+            _fetch,
+            f"fetch_ticker_fast({symbol})"
+        )
+    
     async def fetch_order_book(
         self, 
         symbol: str, 
@@ -555,7 +1004,7 @@ class ExchangeAdapter:
                 since,
                 limit
             )
-            return [self._normalize_trade(trade) for trade in trades]
+            return self._normalize_trades(trades)
         
         return await self._retry_with_backoff(
             _fetch,
@@ -566,20 +1015,108 @@ class ExchangeAdapter:
     # Utility Methods
     # ========================================================================
     
+    @property
+    def markets_cache_path(self) -> Path:
+        """Path of the on-disk markets cache for this exchange and market type."""
+        suffix = "_sandbox" if self.sandbox else ""
+        return self.markets_cache_dir / (
+            f"markets_{self.exchange_name}_{self.default_type}{suffix}.json"
+        )
+    
+    def _read_markets_cache(self) -> Optional[Dict[str, Any]]:
+        """Return cached markets and currencies if the cache file is fresh."""
+        path = self.markets_cache_path
+        try:
+            if time.time() - os.path.getmtime(path) >= self.markets_cache_ttl:
+                return None
+            return loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable markets cache {path}: {e}")
+            return None
+    
+    def _write_markets_cache(self) -> None:
+        """Persist loaded markets atomically (write to temp file, then rename)."""
+        path = self.markets_cache_path
+        payload = dumps({
+            "markets": self.exchange.markets,
+            "currencies": self.exchange.currencies,
+        })
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(payload)
+            os.replace(tmp_name, path)
+            tmp_name = None
+        except OSError as e:
+            logger.warning(f"Could not write markets cache {path}: {e}")
+        finally:
+            # Don't leave a temp file behind for every failed write
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+    
     async def load_markets(self, reload: bool = False) -> Dict[str, Any]:
         """
         Load exchange markets metadata.
         
+        Served from the on-disk cache while it is younger than
+        ``markets_cache_ttl``; otherwise fetched over REST and cached.
+        
         Args:
             reload: Force reload markets from exchange
             
         Returns:
             Dictionary of market metadata
         """
-        return await asyncio.to_thread(
+        if not reload and self.markets_cache_ttl > 0:
+            cached = await asyncio.to_thread(self._read_markets_cache)
+            if cached:
+                self.exchange.set_markets(cached["markets"], cached.get("currencies"))
+                self._share_markets()
+                logger.debug(f"Loaded markets from cache: {self.markets_cache_path}")
+                return self.exchange.markets
+        
+        markets = await asyncio.to_thread(
             self.exchange.load_markets,
             reload
         )
+        self._share_markets()
+        
+        if self.markets_cache_ttl > 0:
+            await asyncio.to_thread(self._write_markets_cache)
+        
+        return markets
+    
+    def _share_markets(self) -> None:
+        """
+        Hand the REST client's market tables to every ccxt.pro client.
+        
+        Each ccxt.pro client otherwise loads markets over REST on its first
+        watch call and rebuilds ``markets_by_id`` and the other lookup
+        tables itself. The tables are read-only after loading, so the
+        clients share the REST client's objects. A resolved
+        ``markets_loading`` future makes their own ``load_markets()`` return
+        immediately.
+        """
+        loaded = asyncio.get_running_loop().create_future()
+        loaded.set_result(self.exchange.markets)
+        for client in self._pool.clients:
+            for attr in _SHARED_MARKET_ATTRS:
+                setattr(client, attr, getattr(self.exchange, attr))
+            client.markets_loading = loaded
+    
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Report how symbols are spread over the WebSocket connection pool.
+        
+        Returns:
+            Dictionary with ``connections``, ``max_symbols_per_connection``
+            and ``symbols_per_connection`` (one count per connection)
+        """
+        return self._pool.stats()
     
     def get_market_symbol(self, base: str, quote: str) -> str:
         """
@@ -592,12 +1129,7 @@ class ExchangeAdapter:
         Returns:
             Formatted symbol (e.g., "BTC/USDT:USDT" for swap)
         """
-        if self.default_type == "swap":
-            # Perpetual futures format
-            return f"{base}/{quote}:{quote}"
-        else:
-            # Spot format
-            return f"{base}/{quote}"
+        return _format_symbol(base, quote, self.default_type)
 
 
 # ============================================================================
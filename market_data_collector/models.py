@@ -0,0 +1,109 @@
+"""
+Compact containers for normalized market data.
+
+The watch_* methods on ExchangeAdapter return ccxt's dict structures. The
+containers here are opt-in alternatives for consumers that process large
+batches and want typed, contiguous storage instead of one dict per record.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+
+# Side codes stored in TradeColumns.side
+SIDE_BUY = 1
+SIDE_SELL = -1
+SIDE_UNKNOWN = 0
+
+_SIDE_CODES = {"buy": SIDE_BUY, "sell": SIDE_SELL}
+
+
+@dataclass(slots=True)
+class Ticker:
+    """
+    Fixed-field ticker snapshot.
+
+    Holds the fields consumers read on every update as slots, so access is
+    an attribute read rather than a dict lookup and an instance carries no
+    ``__dict__``. The raw ccxt ``info`` payload is not kept.
+    """
+
+    symbol: str
+    timestamp: Optional[int]
+    last: Optional[float]
+    bid: Optional[float]
+    ask: Optional[float]
+    base_volume: Optional[float]
+
+    @classmethod
+    def from_ccxt(cls, ticker: Dict[str, Any]) -> Ticker:
+        """Build from a ccxt ticker dict (timestamp already in milliseconds)."""
+        get = ticker.get
+        return cls(
+            get("symbol"),
+            get("timestamp"),
+            get("last"),
+            get("bid"),
+            get("ask"),
+            get("baseVolume"),
+        )
+
+
+@dataclass(slots=True)
+class TradeColumns:
+    """
+    Trades stored column-wise (structure of arrays).
+
+    Each column is a typed ``array.array``, so a batch costs 25 bytes per
+    trade instead of a dict per trade, and scans such as VWAP read one
+    contiguous buffer:
+
+        vwap = sum(p * a for p, a in zip(cols.price, cols.amount)) / sum(cols.amount)
+
+    Missing prices and amounts are stored as NaN, missing timestamps as 0 and
+    unknown sides as ``SIDE_UNKNOWN``.
+    """
+
+    timestamp: array = field(default_factory=lambda: array("q"))
+    price: array = field(default_factory=lambda: array("d"))
+    amount: array = field(default_factory=lambda: array("d"))
+    side: array = field(default_factory=lambda: array("b"))
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def extend(self, trades: Iterable[Dict[str, Any]]) -> None:
+        """Append ccxt trade dicts (timestamps already in milliseconds)."""
+        timestamps = self.timestamp.append
+        prices = self.price.append
+        amounts = self.amount.append
+        sides = self.side.append
+        nan = math.nan
+
+        for trade in trades:
+            timestamp = trade.get("timestamp")
+            price = trade.get("price")
+            amount = trade.get("amount")
+            timestamps(timestamp if timestamp is not None else 0)
+            prices(price if price is not None else nan)
+            amounts(amount if amount is not None else nan)
+            sides(_SIDE_CODES.get(trade.get("side"), SIDE_UNKNOWN))
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Dict[str, Any]]) -> TradeColumns:
+        """Build columns from a list of ccxt trade dicts."""
+        columns = cls()
+        columns.extend(trades)
+        return columns
+
+
+__all__ = [
+    "SIDE_BUY",
+    "SIDE_SELL",
+    "SIDE_UNKNOWN",
+    "Ticker",
+    "TradeColumns",
+]
@@ -0,0 +1,163 @@
+"""
+Single-producer/single-consumer ring buffer over shared memory.
+
+Lets the collector hand serialized market data to a storage process without
+going through a pipe or socket. The producer (subscription manager) and the
+consumer (storage) each own exactly one cursor, so no locks are needed:
+
+    ring = SharedRingBuffer(create=True)           # collector process
+    ring.publish(dumps(item))
+
+    ring = SharedRingBuffer(name=ring.name)        # storage process
+    view = ring.poll()                             # zero-copy memoryview
+
+Layout: a 32-byte header (head, tail, slot count, slot size as u64) followed
+by fixed-size slots, each a u64 payload length and the payload bytes.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from multiprocessing import shared_memory
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# head (written by producer), tail (written by consumer), slots, slot_size
+_HEADER = struct.Struct("<QQQQ")
+_LENGTH = struct.Struct("<Q")
+
+
+class SharedRingBuffer:
+    """
+    Fixed-capacity SPSC ring of length-prefixed byte slots in shared memory.
+
+    Only one process may publish and only one process may poll. Views
+    returned by ``poll()`` stay valid until the next ``poll()`` or
+    ``release()`` call, after which the producer may overwrite the slot.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        slots: int = 1024,
+        slot_size: int = 16384,
+        create: bool = False,
+    ):
+        """
+        Create or attach to a shared ring buffer.
+
+        Args:
+            name: Shared memory block name (required when attaching)
+            slots: Number of slots (only used when creating)
+            slot_size: Bytes per slot including the length prefix (only used
+                when creating)
+            create: Create a new block instead of attaching to ``name``
+        """
+        if create:
+            size = _HEADER.size + slots * slot_size
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _HEADER.pack_into(self._shm.buf, 0, 0, 0, slots, slot_size)
+        else:
+            if name is None:
+                raise ValueError("name is required to attach to a ring buffer")
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        _, _, self.slots, self.slot_size = _HEADER.unpack_from(self._shm.buf, 0)
+        self.max_payload = self.slot_size - _LENGTH.size
+        self._owner = create
+        self._pending = False
+
+        logger.debug(
+            f"Ring buffer {'created' if create else 'attached'}: {self.name} "
+            f"({self.slots} slots x {self.slot_size} bytes)"
+        )
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name used to attach from another process."""
+        return self._shm.name
+
+    def _cursors(self) -> tuple[int, int]:
+        head, tail, _, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        return head, tail
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER.size + (index % self.slots) * self.slot_size
+
+    def publish(self, payload: bytes) -> bool:
+        """
+        Append a payload (producer side).
+
+        Args:
+            payload: Serialized item, at most ``max_payload`` bytes
+
+        Returns:
+            True if written, False if the ring is full or the payload does
+            not fit in a slot
+        """
+        size = len(payload)
+        if size > self.max_payload:
+            logger.warning(
+                f"Payload of {size} bytes exceeds ring slot size {self.max_payload}"
+            )
+            return False
+
+        head, tail = self._cursors()
+        if head - tail >= self.slots:
+            return False
+
+        offset = self._slot_offset(head)
+        buf = self._shm.buf
+        _LENGTH.pack_into(buf, offset, size)
+        start = offset + _LENGTH.size
+        buf[start:start + size] = payload
+
+        # Publish the slot only after its body is fully written
+        struct.pack_into("<Q", buf, 0, head + 1)
+        return True
+
+    def poll(self) -> Optional[memoryview]:
+        """
+        Return a view of the next payload (consumer side).
+
+        Releases the slot returned by the previous call first.
+
+        Returns:
+            Zero-copy view of the payload, or None if the ring is empty
+        """
+        self.release()
+
+        head, tail = self._cursors()
+        if tail >= head:
+            return None
+
+        offset = self._slot_offset(tail)
+        (size,) = _LENGTH.unpack_from(self._shm.buf, offset)
+        start = offset + _LENGTH.size
+        self._pending = True
+        return self._shm.buf[start:start + size]
+
+    def release(self) -> None:
+        """Hand the slot returned by the last ``poll()`` back to the producer."""
+        if not self._pending:
+            return
+
+        _, tail = self._cursors()
+        struct.pack_into("<Q", self._shm.buf, 8, tail + 1)
+        self._pending = False
+
+    def __len__(self) -> int:
+        """Number of published payloads not yet released by the consumer."""
+        head, tail = self._cursors()
+        return head - tail
+
+    def close(self) -> None:
+        """Detach from the block, unlinking it if this instance created it."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+__all__ = ["SharedRingBuffer"]
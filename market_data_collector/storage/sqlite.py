@@ -3,19 +3,126 @@
 from __future__ import annotations
 
 import logging
+import math
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from array import array
 from pathlib import Path
 from typing import Any
 
+from ..utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 3
 
 # Retention period in days
 RETENTION_DAYS = 7
 
+# Minimum seconds between retention sweeps triggered by writes. Records may
+# outlive RETENTION_DAYS by up to this long.
+CLEANUP_INTERVAL_SECONDS = 3600
+
+_DAY_MS = 86_400_000
+
+# Rows removed per retention DELETE statement
+_CLEANUP_BATCH_SIZE = 1000
+
+# Pass as base_path to keep the database in memory (no files, nothing persisted)
+MEMORY_PATH = ":memory:"
+
+# Per-connection read tuning: memory-map up to 256 MiB of the file, keep up to
+# 64 MiB of pages in the page cache and build temp indices/sorts in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Checkpoint the WAL back into the database every 1000 pages (SQLite's default,
+# made explicit so it cannot be silently changed by a build or another tool)
+_WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Per-connection settings for non-durable storage: rollback journal in memory
+# and no fsync. A crash can corrupt the file, so only use it for throwaway data
+_NON_DURABLE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+)
+
+# Insert statements are kept as constants so every call passes the identical
+# SQL string and sqlite3's per-connection statement cache skips re-parsing
+_INSERT_TICKER_SQL = """
+    INSERT INTO ticker (
+        timestamp, symbol, high, low, bid, bid_volume, ask, ask_volume,
+        vwap, open, close, last, previous_close, change, percentage,
+        average, base_volume, quote_volume, info
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ORDERBOOK_SQL = """
+    INSERT INTO orderbook (
+        timestamp, symbol, bids, asks, nonce, datetime
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TRADE_SQL = """
+    INSERT OR IGNORE INTO trades (
+        id, timestamp, symbol, side, price, amount, cost,
+        order_id, taker_or_maker, fee_cost, fee_currency, info
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_OHLCV_SQL = """
+    INSERT OR REPLACE INTO ohlcv (
+        timestamp, symbol, timeframe, open, high, low, close, volume
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_FUNDING_RATE_SQL = """
+    INSERT OR REPLACE INTO funding_rate (
+        timestamp, symbol, funding_rate, funding_timestamp, info
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_MARK_PRICE_SQL = """
+    INSERT OR REPLACE INTO mark_price (
+        timestamp, symbol, mark_price, index_price, info
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+# REAL ticker columns returned by query_ticker_columns, as (column, ccxt key)
+_TICKER_REAL_COLUMNS = (
+    ("high", "high"),
+    ("low", "low"),
+    ("bid", "bid"),
+    ("bid_volume", "bidVolume"),
+    ("ask", "ask"),
+    ("ask_volume", "askVolume"),
+    ("vwap", "vwap"),
+    ("open", "open"),
+    ("close", "close"),
+    ("last", "last"),
+    ("previous_close", "previousClose"),
+    ("change", "change"),
+    ("percentage", "percentage"),
+    ("average", "average"),
+    ("base_volume", "baseVolume"),
+    ("quote_volume", "quoteVolume"),
+)
+
+_SELECT_TICKER_COLUMNS_SQL = "SELECT timestamp, symbol, {} FROM ticker".format(
+    ", ".join(column for column, _ in _TICKER_REAL_COLUMNS)
+)
+
+
+def _now_ms() -> int:
+    """Current Unix time in integer milliseconds (no float round-trip)."""
+    return time.time_ns() // 1_000_000
+
 
 class SQLiteStorage:
     """Manages per-symbol SQLite databases with WAL mode and retention policies.
@@ -24,19 +131,42 @@ class SQLiteStorage:
     All tables include timestamp indices for efficient time-based queries and cleanup.
     """
 
-    def __init__(self, base_path: str | Path, symbol: str) -> None:
+    def __init__(
+        self,
+        base_path: str | Path,
+        symbol: str,
+        durable: bool = True,
+        cleanup_interval: float = CLEANUP_INTERVAL_SECONDS,
+    ) -> None:
         """Initialize SQLite storage for a specific symbol.
         
         Args:
-            base_path: Base directory path for storing database files
+            base_path: Base directory path for storing database files, or
+                ``":memory:"`` for a private in-memory database
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            durable: Use WAL with fsync on commit. Pass False for scratch
+                databases (tests, backfills that can be rerun) to skip the
+                WAL and all fsyncs
+            cleanup_interval: Minimum seconds between retention sweeps run
+                by inserts (0 sweeps on every insert)
         """
         self.base_path = Path(base_path)
         self.symbol = symbol
-        self.db_path = self._get_db_path()
+        self.durable = durable
+        self.cleanup_interval = cleanup_interval
+        # Monotonic deadline for the next sweep; the first insert always sweeps
+        self._next_cleanup = 0.0
+        self._conn: sqlite3.Connection | None = None
+        self._reader: sqlite3.Connection | None = None
+        # Serializes writers sharing the cached write connection
+        self._write_lock = threading.RLock()
         
-        # Ensure storage directory exists
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        if str(base_path) == MEMORY_PATH:
+            self.db_path = Path(MEMORY_PATH)
+        else:
+            self.db_path = self._get_db_path()
+            # Ensure storage directory exists
+            self.base_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize database with schema and WAL mode
         self._initialize_database()
@@ -50,10 +180,49 @@ class SQLiteStorage:
         return self.base_path / f"{safe_symbol}.db"
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Create a new database connection with optimal settings."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable dict-like row access
-        return conn
+        """Return this storage's connection, opening it on first use.
+        
+        The connection is kept for the lifetime of the instance so inserts and
+        queries don't reopen the database (and its WAL/SHM files) or reapply
+        pragmas. An in-memory database also lives only as long as its
+        connection. ``with conn:`` commits or rolls back but does not close it;
+        call ``close()`` when done.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # Enable dict-like row access
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            if self.durable:
+                conn.execute(f"PRAGMA wal_autocheckpoint={_WAL_AUTOCHECKPOINT_PAGES}")
+            else:
+                for pragma in _NON_DURABLE_PRAGMAS:
+                    conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """Return the read-only connection used by ``query_*``, opening it lazily.
+        
+        In WAL mode a separate reader sees the last committed data while the
+        writer is mid-transaction, so queries never wait on (or interleave
+        with) an insert. In-memory and non-durable databases have no WAL and
+        share the write connection instead.
+        """
+        if self._shares_write_connection():
+            return self._get_connection()
+        if self._reader is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                reader.execute(pragma)
+            self._reader = reader
+        return self._reader
+
+    def _shares_write_connection(self) -> bool:
+        """Whether queries must use the write connection (no WAL to read from)."""
+        return not self.durable or str(self.db_path) == MEMORY_PATH
 
     def _initialize_database(self) -> None:
         """Initialize database schema and enable WAL mode."""
@@ -61,7 +230,8 @@ class SQLiteStorage:
             cursor = conn.cursor()
             
             # Enable WAL (Write-Ahead Logging) mode for better concurrency
-            cursor.execute("PRAGMA journal_mode=WAL")
+            if self.durable:
+                cursor.execute("PRAGMA journal_mode=WAL")
             
             # Create schema version table
             cursor.execute("""
@@ -194,19 +364,96 @@ class SQLiteStorage:
             # Record migration
             cursor.execute(
                 "INSERT INTO _schema_version (version, applied_at) VALUES (?, ?)",
-                (1, int(datetime.now().timestamp() * 1000))
+                (1, _now_ms())
+            )
+        
+        if from_version < 2:
+            logger.info(f"Applying schema migration v2 for {self.symbol}")
+            
+            # Queries read latest-first (ORDER BY timestamp DESC), so store the
+            # timestamp indices in that order. OHLCV is read oldest-first and
+            # keeps its ascending index.
+            for table, index in (
+                ("ticker", "idx_ticker_timestamp"),
+                ("orderbook", "idx_orderbook_timestamp"),
+                ("trades", "idx_trades_timestamp"),
+                ("funding_rate", "idx_funding_timestamp"),
+                ("mark_price", "idx_mark_price_timestamp"),
+            ):
+                cursor.execute(f"DROP INDEX IF EXISTS {index}")
+                cursor.execute(f"CREATE INDEX {index} ON {table}(timestamp DESC)")
+            
+            cursor.execute(
+                "INSERT INTO _schema_version (version, applied_at) VALUES (?, ?)",
+                (2, _now_ms())
+            )
+        
+        if from_version < 3:
+            logger.info(f"Applying schema migration v3 for {self.symbol}")
+            
+            # OHLCV queries filter on timeframe and range/order on timestamp;
+            # a composite index serves both without a sort. It also covers
+            # timeframe-only lookups, so the single-column index is dropped.
+            # Other tables need no symbol prefix: each database holds one symbol.
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ohlcv_timeframe_timestamp "
+                "ON ohlcv(timeframe, timestamp)"
             )
+            cursor.execute("DROP INDEX IF EXISTS idx_ohlcv_timeframe")
+            
+            cursor.execute(
+                "INSERT INTO _schema_version (version, applied_at) VALUES (?, ?)",
+                (3, _now_ms())
+            )
+
+    def cleanup_old_records(self) -> None:
+        """Delete records older than the retention period now.
+        
+        Afterwards the WAL is checkpointed and truncated, so the deletes do
+        not leave a large ``-wal`` file behind.
+        """
+        with self._write_lock, self._get_connection() as conn:
+            self._cleanup_old_records(conn, commit_batches=True)
+            conn.commit()
+            if not self._shares_write_connection():
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._next_cleanup = time.monotonic() + self.cleanup_interval
+
+    def _maybe_cleanup(self, conn: sqlite3.Connection) -> None:
+        """Run the retention sweep if the cleanup interval has elapsed."""
+        now = time.monotonic()
+        if now >= self._next_cleanup:
+            self._cleanup_old_records(conn)
+            self._next_cleanup = now + self.cleanup_interval
 
-    def _cleanup_old_records(self, conn: sqlite3.Connection) -> None:
-        """Delete records older than retention period from all tables."""
+    def _cleanup_old_records(
+        self, conn: sqlite3.Connection, commit_batches: bool = False
+    ) -> None:
+        """Delete records older than retention period from all tables.
+        
+        Rows are removed in batches of ``_CLEANUP_BATCH_SIZE`` via the
+        timestamp index, so a large backlog never turns into one huge DELETE.
+        With ``commit_batches`` each batch is committed on its own, which keeps
+        the WAL small and lets readers checkpoint in between.
+        """
         cursor = conn.cursor()
-        cutoff_timestamp = int((datetime.now() - timedelta(days=RETENTION_DAYS)).timestamp() * 1000)
+        cutoff_timestamp = _now_ms() - RETENTION_DAYS * _DAY_MS
         
         tables = ["ticker", "orderbook", "trades", "ohlcv", "funding_rate", "mark_price"]
         
         for table in tables:
-            cursor.execute(f"DELETE FROM {table} WHERE timestamp < ?", (cutoff_timestamp,))
-            deleted = cursor.rowcount
+            statement = (
+                f"DELETE FROM {table} WHERE rowid IN "
+                f"(SELECT rowid FROM {table} WHERE timestamp < ? LIMIT ?)"
+            )
+            deleted = 0
+            while True:
+                cursor.execute(statement, (cutoff_timestamp, _CLEANUP_BATCH_SIZE))
+                deleted += cursor.rowcount
+                if commit_batches:
+                    conn.commit()
+                if cursor.rowcount < _CLEANUP_BATCH_SIZE:
+                    break
             if deleted > 0:
                 logger.debug(f"Deleted {deleted} old records from {table} for {self.symbol}")
 
@@ -216,39 +463,58 @@ class SQLiteStorage:
         Args:
             data: Ticker data in ccxt format
         """
-        with self._get_connection() as conn:
+        self.insert_tickers([data])
+
+    def insert_tickers(self, tickers: list[dict[str, Any]]) -> int:
+        """Bulk insert tickers in a single transaction with retention cleanup.
+        
+        All rows share one commit (and one retention pass) instead of paying
+        a commit per ticker.
+        
+        Args:
+            tickers: List of ticker data in ccxt format
+            
+        Returns:
+            Number of tickers inserted
+        """
+        if not tickers:
+            return 0
+        
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO ticker (
-                    timestamp, symbol, high, low, bid, bid_volume, ask, ask_volume,
-                    vwap, open, close, last, previous_close, change, percentage,
-                    average, base_volume, quote_volume, info
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get("timestamp"),
-                data.get("symbol"),
-                data.get("high"),
-                data.get("low"),
-                data.get("bid"),
-                data.get("bidVolume"),
-                data.get("ask"),
-                data.get("askVolume"),
-                data.get("vwap"),
-                data.get("open"),
-                data.get("close"),
-                data.get("last"),
-                data.get("previousClose"),
-                data.get("change"),
-                data.get("percentage"),
-                data.get("average"),
-                data.get("baseVolume"),
-                data.get("quoteVolume"),
-                str(data.get("info", {}))
-            ))
+            cursor.executemany(
+                _INSERT_TICKER_SQL, [self._ticker_params(data) for data in tickers]
+            )
             
-            self._cleanup_old_records(conn)
+            self._maybe_cleanup(conn)
             conn.commit()
+            return len(tickers)
+
+    @staticmethod
+    def _ticker_params(data: dict[str, Any]) -> tuple:
+        """Map a ccxt ticker to the ticker table's column order."""
+        return (
+            data.get("timestamp"),
+            data.get("symbol"),
+            data.get("high"),
+            data.get("low"),
+            data.get("bid"),
+            data.get("bidVolume"),
+            data.get("ask"),
+            data.get("askVolume"),
+            data.get("vwap"),
+            data.get("open"),
+            data.get("close"),
+            data.get("last"),
+            data.get("previousClose"),
+            data.get("change"),
+            data.get("percentage"),
+            data.get("average"),
+            data.get("baseVolume"),
+            data.get("quoteVolume"),
+            str(data.get("info", {}))
+        )
 
     def insert_orderbook(self, data: dict[str, Any]) -> None:
         """Insert orderbook snapshot with retention cleanup.
@@ -256,25 +522,21 @@ class SQLiteStorage:
         Args:
             data: Orderbook data in ccxt format
         """
-        import json
-        
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO orderbook (
-                    timestamp, symbol, bids, asks, nonce, datetime
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+            # Stored as JSON text; orjson (when installed) encodes the
+            # price/amount arrays far faster than the json module
+            cursor.execute(_INSERT_ORDERBOOK_SQL, (
                 data.get("timestamp"),
                 data.get("symbol"),
-                json.dumps(data.get("bids", [])),
-                json.dumps(data.get("asks", [])),
+                dumps(data.get("bids", [])).decode(),
+                dumps(data.get("asks", [])).decode(),
                 data.get("nonce"),
                 data.get("datetime")
             ))
             
-            self._cleanup_old_records(conn)
+            self._maybe_cleanup(conn)
             conn.commit()
 
     def insert_trades(self, trades: list[dict[str, Any]]) -> int:
@@ -289,80 +551,82 @@ class SQLiteStorage:
         if not trades:
             return 0
         
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
-            inserted = 0
-            
-            for trade in trades:
-                try:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO trades (
-                            id, timestamp, symbol, side, price, amount, cost,
-                            order_id, taker_or_maker, fee_cost, fee_currency, info
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        trade.get("id"),
-                        trade.get("timestamp"),
-                        trade.get("symbol"),
-                        trade.get("side"),
-                        trade.get("price"),
-                        trade.get("amount"),
-                        trade.get("cost"),
-                        trade.get("order"),
-                        trade.get("takerOrMaker"),
-                        trade.get("fee", {}).get("cost"),
-                        trade.get("fee", {}).get("currency"),
-                        str(trade.get("info", {}))
-                    ))
-                    if cursor.rowcount > 0:
-                        inserted += 1
-                except sqlite3.IntegrityError:
-                    # Trade already exists, skip
-                    pass
             
-            self._cleanup_old_records(conn)
+            # One executemany for the batch; rowcount sums the rows actually
+            # inserted, so duplicates ignored by INSERT OR IGNORE are not counted
+            cursor.executemany(
+                _INSERT_TRADE_SQL, [self._trade_params(trade) for trade in trades]
+            )
+            inserted = cursor.rowcount
+            
+            self._maybe_cleanup(conn)
             conn.commit()
             return inserted
 
+    @staticmethod
+    def _trade_params(trade: dict[str, Any]) -> tuple:
+        """Map a ccxt trade to the trades table's column order."""
+        fee = trade.get("fee") or {}
+        return (
+            trade.get("id"),
+            trade.get("timestamp"),
+            trade.get("symbol"),
+            trade.get("side"),
+            trade.get("price"),
+            trade.get("amount"),
+            trade.get("cost"),
+            trade.get("order"),
+            trade.get("takerOrMaker"),
+            fee.get("cost"),
+            fee.get("currency"),
+            str(trade.get("info", {}))
+        )
+
     def insert_ohlcv(self, timeframe: str, ohlcv_data: list[list]) -> int:
         """Bulk insert OHLCV candles with retention cleanup.
         
         Args:
             timeframe: Timeframe string (e.g., '1m', '5m', '1h')
-            ohlcv_data: List of OHLCV arrays [timestamp, open, high, low, close, volume]
+            ohlcv_data: List of OHLCV arrays [timestamp, open, high, low, close, volume],
+                or a 2-D array (e.g. numpy) with the same columns
             
         Returns:
             Number of candles successfully inserted
         """
-        if not ohlcv_data:
+        if len(ohlcv_data) == 0:
             return 0
         
-        with self._get_connection() as conn:
+        # Array inputs are converted to Python scalars in one C-level pass;
+        # sqlite3 cannot bind numpy integer types directly
+        if hasattr(ohlcv_data, "tolist"):
+            ohlcv_data = ohlcv_data.tolist()
+        
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
-            inserted = 0
-            
-            for candle in ohlcv_data:
-                try:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO ohlcv (
-                            timestamp, symbol, timeframe, open, high, low, close, volume
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        candle[0],
-                        self.symbol,
-                        timeframe,
-                        candle[1],
-                        candle[2],
-                        candle[3],
-                        candle[4],
-                        candle[5]
-                    ))
-                    if cursor.rowcount > 0:
+            
+            symbol = self.symbol
+            rows = [
+                (candle[0], symbol, timeframe, *candle[1:6])
+                for candle in ohlcv_data
+            ]
+            try:
+                cursor.executemany(_INSERT_OHLCV_SQL, rows)
+                inserted = cursor.rowcount
+            except sqlite3.IntegrityError:
+                # A malformed candle (e.g. NULL price) aborts the batch; redo it
+                # row by row and skip only the bad candles. Rows already written
+                # are simply replaced again.
+                inserted = 0
+                for row in rows:
+                    try:
+                        cursor.execute(_INSERT_OHLCV_SQL, row)
                         inserted += 1
-                except sqlite3.IntegrityError:
-                    pass
+                    except sqlite3.IntegrityError:
+                        pass
             
-            self._cleanup_old_records(conn)
+            self._maybe_cleanup(conn)
             conn.commit()
             return inserted
 
@@ -372,14 +636,10 @@ class SQLiteStorage:
         Args:
             data: Funding rate data in ccxt format
         """
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO funding_rate (
-                    timestamp, symbol, funding_rate, funding_timestamp, info
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_INSERT_FUNDING_RATE_SQL, (
                 data.get("timestamp"),
                 data.get("symbol"),
                 data.get("fundingRate"),
@@ -387,7 +647,7 @@ class SQLiteStorage:
                 str(data.get("info", {}))
             ))
             
-            self._cleanup_old_records(conn)
+            self._maybe_cleanup(conn)
             conn.commit()
 
     def insert_mark_price(self, data: dict[str, Any]) -> None:
@@ -396,14 +656,10 @@ class SQLiteStorage:
         Args:
             data: Mark price data in ccxt format
         """
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO mark_price (
-                    timestamp, symbol, mark_price, index_price, info
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_INSERT_MARK_PRICE_SQL, (
                 data.get("timestamp"),
                 data.get("symbol"),
                 data.get("markPrice"),
@@ -411,7 +667,7 @@ class SQLiteStorage:
                 str(data.get("info", {}))
             ))
             
-            self._cleanup_old_records(conn)
+            self._maybe_cleanup(conn)
             conn.commit()
 
     def query_ticker(
@@ -430,10 +686,65 @@ class SQLiteStorage:
         Returns:
             List of ticker records in ccxt-like format
         """
-        with self._get_connection() as conn:
+        rows = self._select_ticker(
+            "SELECT * FROM ticker", start_time, end_time, limit
+        )
+        return [self._row_to_ticker(row) for row in rows]
+
+    def query_ticker_columns(
+        self,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        limit: int | None = None
+    ) -> dict[str, Any]:
+        """Query ticker data within time range as columns.
+        
+        Same filtering and ordering as ``query_ticker``, but the result is
+        one sequence per field instead of one dict per row. Numeric fields
+        are ``array("d")`` with NULL stored as NaN and timestamps are
+        ``array("q")``, so scans read a contiguous buffer:
+        
+            columns = storage.query_ticker_columns()
+            total = sum(columns["last"])
+        
+        The raw ``info`` payload is not included.
+        
+        Args:
+            start_time: Start timestamp in milliseconds (inclusive)
+            end_time: End timestamp in milliseconds (inclusive)
+            limit: Maximum number of records to return
+            
+        Returns:
+            Mapping of ccxt field name to column values
+        """
+        rows = self._select_ticker(
+            _SELECT_TICKER_COLUMNS_SQL, start_time, end_time, limit
+        )
+        fields = list(zip(*rows, strict=True)) or [()] * (2 + len(_TICKER_REAL_COLUMNS))
+        nan = math.nan
+        
+        columns: dict[str, Any] = {
+            "timestamp": array("q", fields[0]),
+            "symbol": list(fields[1]),
+        }
+        for (_, key), values in zip(_TICKER_REAL_COLUMNS, fields[2:], strict=True):
+            columns[key] = array(
+                "d", [nan if value is None else value for value in values]
+            )
+        return columns
+
+    def _select_ticker(
+        self,
+        select: str,
+        start_time: int | None,
+        end_time: int | None,
+        limit: int | None
+    ) -> list[sqlite3.Row]:
+        """Run a ticker SELECT with the shared time range and limit filters."""
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
-            query = "SELECT * FROM ticker WHERE 1=1"
+            query = select + " WHERE 1=1"
             params = []
             
             if start_time is not None:
@@ -451,9 +762,7 @@ class SQLiteStorage:
                 params.append(limit)
             
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            return [self._row_to_ticker(row) for row in rows]
+            return cursor.fetchall()
 
     def query_orderbook(
         self,
@@ -471,9 +780,7 @@ class SQLiteStorage:
         Returns:
             List of orderbook records in ccxt-like format
         """
-        import json
-        
-        with self._get_connection() as conn:
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM orderbook WHERE 1=1"
@@ -501,8 +808,8 @@ class SQLiteStorage:
                 results.append({
                     "timestamp": row["timestamp"],
                     "symbol": row["symbol"],
-                    "bids": json.loads(row["bids"]),
-                    "asks": json.loads(row["asks"]),
+                    "bids": loads(row["bids"]),
+                    "asks": loads(row["asks"]),
                     "nonce": row["nonce"],
                     "datetime": row["datetime"]
                 })
@@ -525,7 +832,7 @@ class SQLiteStorage:
         Returns:
             List of trade records in ccxt-like format
         """
-        with self._get_connection() as conn:
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM trades WHERE 1=1"
@@ -568,7 +875,7 @@ class SQLiteStorage:
         Returns:
             List of OHLCV arrays [timestamp, open, high, low, close, volume]
         """
-        with self._get_connection() as conn:
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM ohlcv WHERE timeframe = ?"
@@ -612,7 +919,7 @@ class SQLiteStorage:
         Returns:
             List of funding rate records in ccxt-like format
         """
-        with self._get_connection() as conn:
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM funding_rate WHERE 1=1"
@@ -653,7 +960,7 @@ class SQLiteStorage:
         Returns:
             List of mark price records in ccxt-like format
         """
-        with self._get_connection() as conn:
+        with self._get_reader() as conn:
             cursor = conn.cursor()
             
             query = "SELECT * FROM mark_price WHERE 1=1"
@@ -746,7 +1053,13 @@ class SQLiteStorage:
         }
 
     def close(self) -> None:
-        """Close database connection and perform cleanup."""
-        # Connections are closed automatically via context manager
-        # This method is for compatibility and future extensions
-        pass
+        """Close the cached database connections.
+        
+        An in-memory database is discarded together with its connection.
+        """
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
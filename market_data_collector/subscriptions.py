@@ -16,14 +16,317 @@ watch APIs with throttling, reconnection logic, and data normalization.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cached_property, lru_cache, partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from .config import MarketDataSettings
 from .exchange import ExchangeAdapter
+from .ringbuf import SharedRingBuffer
+from .utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+# Interval used for each config key when it is absent from settings
+_INTERVAL_DEFAULTS: Dict[str, str] = {
+    "klines": "1m",
+    "orderbook_snapshot": "1m",
+    "trades": "realtime",
+    "funding": "8h",
+    "mark_price": "1m",
+}
+
+# Seconds per interval unit suffix (e.g. "5m" -> 5 * 60)
+_UNIT_MULT: Dict[str, float] = {"s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
+# Intervals used by the shipped configs, resolved without parsing
+_INTERVAL_LUT: Dict[str, Optional[float]] = {
+    "realtime": None,
+    "30s": 30.0,
+    "1m": 60.0,
+    "5m": 300.0,
+    "15m": 900.0,
+    "1h": 3600.0,
+    "4h": 14400.0,
+    "8h": 28800.0,
+    "1d": 86400.0,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_interval_seconds(interval_str: str) -> Optional[float]:
+    """
+    Parse interval string to seconds.
+
+    Cached because the set of configured intervals is tiny while the parse
+    runs on every subscription (re)start.
+
+    Args:
+        interval_str: Interval string (e.g., "1m", "5s", "1h", "realtime")
+
+    Returns:
+        Interval in seconds, or None for realtime
+    """
+    if not interval_str or interval_str == "realtime":
+        return None
+
+    try:
+        mult = _UNIT_MULT.get(interval_str[-1])
+        return float(interval_str[:-1]) * mult if mult else float(interval_str)
+    except ValueError:
+        logger.warning(f"Could not parse interval '{interval_str}', using realtime")
+        return None
+
+
+class Channel(StrEnum):
+    """Queue item type. Compares equal to its string value (e.g. "ticker")."""
+    
+    TICKER = "ticker"
+    ORDERBOOK = "orderbook"
+    TRADE = "trade"
+    OHLCV = "ohlcv"
+    FUNDING_RATE = "funding_rate"
+    MARK_PRICE = "mark_price"
+
+
+@dataclass(slots=True)
+class Envelope:
+    """
+    Queue item produced by the subscription loops.
+    
+    A slotted object instead of a per-event dict. Key access
+    (``item["type"]``, ``item.get("timeframe")``) is kept so consumers
+    written against the former dict items keep working.
+    """
+    
+    type: Channel
+    symbol: str
+    data: Any
+    timeframe: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ENVELOPE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        if key == "timeframe":
+            return self.timeframe is not None
+        return key in _ENVELOPE_KEYS
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access with a default for keys the item does not have."""
+        if key not in self:
+            return default
+        return getattr(self, key)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict form, used when serializing."""
+        item = {"type": self.type.value, "symbol": self.symbol, "data": self.data}
+        if self.timeframe is not None:
+            item["timeframe"] = self.timeframe
+        return item
+
+
+_ENVELOPE_KEYS = frozenset({"type", "symbol", "data", "timeframe"})
+
+
+class ChannelQueue:
+    """
+    Bounded FIFO feeding one channel's consumers.
+    
+    Backed by a deque, so a put is one append, and no future is allocated
+    unless a consumer is actually parked in ``get()``. Implements the part of
+    the ``asyncio.Queue`` interface consumers use (``get``, ``get_nowait``,
+    ``put_nowait``, ``qsize``, ``empty``, ``full``, ``task_done``).
+    
+    Two overflow policies:
+    
+    - drop-oldest (default): a ``deque(maxlen=maxsize)`` that discards the
+      oldest item itself. For snapshot-like channels, where the freshest
+      update supersedes the stalest.
+    - block (``block=True``): nothing is discarded; the producer awaits
+      ``wait_not_full()`` before enqueueing. For event streams such as trades,
+      where every record counts. Puts themselves never wait, so the queue may
+      exceed ``maxsize`` by at most the batch enqueued after the wait.
+    """
+    
+    __slots__ = ("maxsize", "block", "_items", "_getters", "_putters")
+    
+    def __init__(self, maxsize: int, block: bool = False):
+        """
+        Create an empty queue.
+        
+        Args:
+            maxsize: Capacity
+            block: Make producers wait for room instead of evicting the
+                oldest item
+        """
+        self.maxsize = maxsize
+        self.block = block
+        self._items: deque = deque() if block else deque(maxlen=maxsize)
+        self._getters: deque = deque()
+        self._putters: deque = deque()
+    
+    def qsize(self) -> int:
+        """Number of items in the queue."""
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return not self._items
+    
+    def full(self) -> bool:
+        """Return True if the queue holds ``maxsize`` items or more."""
+        return len(self._items) >= self.maxsize
+    
+    def put_nowait(self, item: Any) -> None:
+        """Append an item (evicting the oldest one if full) and wake a getter."""
+        self._items.append(item)
+        if self._getters:
+            _wakeup_next(self._getters)
+    
+    def put_many(self, items: List[Any]) -> int:
+        """
+        Append a batch of items, waking one parked getter per item.
+        
+        Args:
+            items: Items to append in order
+            
+        Returns:
+            Number of older items evicted to make room (always 0 when
+            ``block`` is set)
+        """
+        queue = self._items
+        evicted = 0 if self.block else max(0, len(queue) + len(items) - self.maxsize)
+        queue.extend(items)
+        getters = self._getters
+        for _ in range(min(len(items), len(getters))):
+            _wakeup_next(getters)
+        return evicted
+    
+    async def wait_not_full(self) -> None:
+        """Wait until the queue holds fewer than ``maxsize`` items."""
+        items = self._items
+        while len(items) >= self.maxsize:
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                # Pass a wakeup this putter consumed on to the next one
+                if len(items) < self.maxsize and _was_woken(putter):
+                    _wakeup_next(self._putters)
+                raise
+    
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the oldest item.
+        
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+        if self._putters:
+            _wakeup_next(self._putters)
+        return item
+    
+    async def get(self) -> Any:
+        """Remove and return the oldest item, waiting until one is available."""
+        items = self._items
+        while not items:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except asyncio.CancelledError:
+                # Pass a wakeup this getter consumed on to the next one
+                if items and _was_woken(getter):
+                    _wakeup_next(self._getters)
+                raise
+        item = items.popleft()
+        if self._putters:
+            _wakeup_next(self._putters)
+        return item
+    
+    def task_done(self) -> None:
+        """No-op, kept for consumers written against ``asyncio.Queue``."""
+
+
+def _was_woken(waiter: asyncio.Future) -> bool:
+    """Whether a waiter was woken (resolved) rather than cancelled."""
+    return waiter.done() and not waiter.cancelled()
+
+
+def _wakeup_next(waiters: deque) -> None:
+    """Resolve the oldest waiter that is still pending."""
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+PollFunction = Callable[[str], Coroutine[Any, Any, None]]
+
+SubscriptionFactory = Callable[["SubscriptionManager", str], Coroutine[Any, Any, None]]
+
+# (task name prefix, interval keys that enable it or None for always, factory)
+_SUBSCRIPTION_TABLE: List[
+    Tuple[str, Optional[FrozenSet[str]], SubscriptionFactory]
+] = [
+    (
+        "ticker",
+        frozenset({"ticker", "klines"}),
+        lambda mgr, symbol: mgr._subscribe_ticker(symbol),
+    ),
+    (
+        "orderbook",
+        frozenset({"orderbook_snapshot"}),
+        lambda mgr, symbol: mgr._subscribe_orderbook(symbol),
+    ),
+    (
+        "trades",
+        frozenset({"trades"}),
+        lambda mgr, symbol: mgr._subscribe_trades(symbol),
+    ),
+    (
+        "ohlcv",
+        None,
+        lambda mgr, symbol: mgr._subscribe_ohlcv(symbol, mgr.ohlcv_timeframes),
+    ),
+    (
+        "funding",
+        frozenset({"funding"}),
+        lambda mgr, symbol: mgr._poll_funding(symbol),
+    ),
+    (
+        "mark_price",
+        frozenset({"mark_price", "funding"}),
+        lambda mgr, symbol: mgr._poll_mark_price(symbol),
+    ),
+]
+
 
 class SubscriptionManager:
     """
@@ -38,6 +341,9 @@ class SubscriptionManager:
         self,
         exchange: ExchangeAdapter,
         settings: MarketDataSettings,
+        serialize: bool = False,
+        ring: Optional[SharedRingBuffer] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ):
         """
         Initialize subscription manager.
@@ -45,49 +351,123 @@ class SubscriptionManager:
         Args:
             exchange: Exchange adapter with ccxt.pro watch methods
             settings: Configuration settings
+            serialize: Enqueue items as JSON bytes (orjson when installed)
+                instead of dicts, for consumers that persist raw payloads
+            ring: Shared-memory ring to publish serialized items to instead of
+                the in-process queues, for a storage consumer in another
+                process
+            sleep: Coroutine function the watch loops await for throttling
+                and error backoff (a seam for tests and custom backoff)
         """
         self.exchange = exchange
         self.settings = settings
+        self.serialize = serialize
+        self.ring = ring
+        self._sleep = sleep
+        
+        # Enqueue strategies used by the subscription loops (single item and
+        # the batch form for watch calls that return several records)
+        if ring is not None:
+            self._enqueue = self._push_ring
+            self._enqueue_many = self._push_ring_many
+        elif serialize:
+            self._enqueue = self._push_serialized
+            self._enqueue_many = self._push_serialized_many
+        else:
+            self._enqueue = self._push
+            self._enqueue_many = self._push_many
+        
+        # Data queues for storage pipeline (one per data type). Snapshot-like
+        # channels drop their oldest item when full; the trades loop waits for
+        # room instead, since a dropped trade is lost for good
+        self.ticker_queue = ChannelQueue(maxsize=1000)
+        self.orderbook_queue = ChannelQueue(maxsize=1000)
+        self.trades_queue = ChannelQueue(maxsize=1000, block=True)
+        self.ohlcv_queue = ChannelQueue(maxsize=1000)
+        self.funding_queue = ChannelQueue(maxsize=100)
+        self.mark_price_queue = ChannelQueue(maxsize=1000)
+        
+        # Items discarded by the drop-oldest policy, per queue
+        self._dropped: Dict[str, int] = {
+            "ticker": 0,
+            "orderbook": 0,
+            "trades": 0,
+            "ohlcv": 0,
+            "funding": 0,
+            "mark_price": 0,
+        }
         
-        # Data queues for storage pipeline (one per data type)
-        self.ticker_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-        self.orderbook_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-        self.trades_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-        self.ohlcv_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-        self.funding_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self.mark_price_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
-        
-        # Track active subscription tasks
+        # Track active subscription tasks. Pending polls sit in one min-heap
+        # of (loop deadline, seq, name, symbol, poll) served by a single timer
+        # handle armed for the earliest deadline
         self._tasks: Set[asyncio.Task] = set()
+        self._polls: List[Tuple[float, int, str, str, PollFunction]] = []
+        self._poll_seq = itertools.count()
+        self._poll_timer: Optional[asyncio.TimerHandle] = None
         self._running = False
         self._stop_event = asyncio.Event()
         
-        # Parse timeframes for OHLCV
-        self._ohlcv_timeframes = self._parse_ohlcv_timeframes()
+        # Resolve interval settings once; the loops and polls read these
+        # instead of walking the settings model on every (re)start
+        intervals = self.settings.intervals
+        self._intervals: Dict[str, Tuple[str, Optional[float]]] = {}
+        for key, default in _INTERVAL_DEFAULTS.items():
+            interval_str = intervals.get(key) or default
+            self._intervals[key] = (interval_str, self._parse_interval(interval_str))
+        
+        # Resolve which subscription types are enabled once, not per symbol.
+        # An absent or empty interval disables its channel, so start() never
+        # schedules a loop or poll for it
+        self._enabled: List[Tuple[str, SubscriptionFactory]] = [
+            (name, factory)
+            for name, trigger_keys, factory in _SUBSCRIPTION_TABLE
+            if trigger_keys is None
+            or any(intervals.get(key) for key in trigger_keys)
+        ]
+        
+        # Pre-bind one zero-argument coroutine factory per (symbol, channel)
+        # so start() only schedules them
+        self._plan: List[Tuple[str, Callable[[], Coroutine[Any, Any, None]]]] = [
+            (f"{name}_{symbol}", partial(factory, self, symbol))
+            for symbol in self.settings.symbols
+            for name, factory in self._enabled
+        ]
+        
+        self._logger = logger
         
         logger.info("Subscription manager initialized")
     
-    def _parse_ohlcv_timeframes(self) -> List[str]:
+    @cached_property
+    def ohlcv_timeframes(self) -> Tuple[str, ...]:
         """
-        Parse OHLCV timeframes from config intervals.
+        OHLCV timeframes from the config intervals, parsed once per manager.
         
         Returns:
-            List of timeframes (e.g., ["1m", "5m", "1h"])
+            Timeframes (e.g., ("1m", "5m", "1h"))
         """
-        timeframes = []
+        timeframes: Tuple[str, ...] = ()
         klines_interval = self.settings.intervals.get("klines", "1m")
         
         # If klines interval is a comma-separated list, split it
         if isinstance(klines_interval, str):
-            timeframes = [tf.strip() for tf in klines_interval.split(",")]
+            timeframes = tuple(tf.strip() for tf in klines_interval.split(","))
         
         # Default to 1m if empty
         if not timeframes:
-            timeframes = ["1m"]
+            timeframes = ("1m",)
         
-        logger.info(f"OHLCV timeframes: {timeframes}")
+        logger.info(f"OHLCV timeframes: {list(timeframes)}")
         return timeframes
     
+    def _parse_ohlcv_timeframes(self) -> List[str]:
+        """
+        Parse OHLCV timeframes from config intervals.
+        
+        Returns:
+            List of timeframes (e.g., ["1m", "5m", "1h"])
+        """
+        return list(self.ohlcv_timeframes)
+    
     def _parse_interval(self, interval_str: str) -> Optional[float]:
         """
         Parse interval string to seconds.
@@ -98,23 +478,67 @@ class SubscriptionManager:
         Returns:
             Interval in seconds, or None for realtime
         """
-        if interval_str == "realtime" or not interval_str:
-            return None
+        try:
+            return _INTERVAL_LUT[interval_str]
+        except KeyError:
+            return _parse_interval_seconds(interval_str)
+    
+    def _push(self, queue: ChannelQueue, name: str, item: Envelope) -> None:
+        """
+        Enqueue an item without blocking or suspending.
         
-        # Parse format like "1m", "5s", "1h", "8h"
-        if interval_str[-1] == "s":
-            return float(interval_str[:-1])
-        elif interval_str[-1] == "m":
-            return float(interval_str[:-1]) * 60
-        elif interval_str[-1] == "h":
-            return float(interval_str[:-1]) * 3600
-        else:
-            # Try to parse as raw seconds
-            try:
-                return float(interval_str)
-            except ValueError:
-                logger.warning(f"Could not parse interval '{interval_str}', using realtime")
-                return None
+        A slow consumer must never stall the WebSocket read loop; for market
+        data the freshest update is worth more than the stalest one, so a
+        full queue evicts its oldest item.
+        
+        Args:
+            queue: Target queue
+            name: Queue name used for drop accounting
+            item: Item to enqueue
+        """
+        if queue.full() and not queue.block:
+            self._dropped[name] += 1
+        queue.put_nowait(item)
+    
+    def _push_serialized(self, queue: ChannelQueue, name: str, item: Envelope) -> None:
+        """Enqueue an item as JSON bytes (``serialize=True``)."""
+        self._push(queue, name, dumps(item.as_dict()))
+    
+    def _push_ring(self, queue: ChannelQueue, name: str, item: Envelope) -> None:
+        """Publish an item to the shared ring buffer (``ring=...``)."""
+        if not self.ring.publish(dumps(item.as_dict())):
+            self._dropped[name] += 1
+    
+    def _push_many(
+        self, queue: ChannelQueue, name: str, items: List[Envelope]
+    ) -> None:
+        """
+        Enqueue the records from one watch call as a single batch.
+        
+        Consumers still receive one item per record, but the batch costs one
+        append and at most one consumer wakeup instead of one per record.
+        
+        Args:
+            queue: Target queue
+            name: Queue name used for drop accounting
+            items: Items to enqueue in order
+        """
+        evicted = queue.put_many(items)
+        if evicted:
+            self._dropped[name] += evicted
+    
+    def _push_serialized_many(
+        self, queue: ChannelQueue, name: str, items: List[Envelope]
+    ) -> None:
+        """Enqueue a batch as JSON bytes (``serialize=True``)."""
+        self._push_many(queue, name, [dumps(item.as_dict()) for item in items])
+    
+    def _push_ring_many(
+        self, queue: ChannelQueue, name: str, items: List[Envelope]
+    ) -> None:
+        """Publish a batch to the shared ring buffer, one slot per item."""
+        for item in items:
+            self._push_ring(queue, name, item)
     
     async def start(self) -> None:
         """Start all subscriptions for configured symbols."""
@@ -125,60 +549,26 @@ class SubscriptionManager:
         self._running = True
         self._stop_event.clear()
         
+        symbols = self.settings.symbols
+        tasks = self._tasks
+        
         logger.info(
-            f"Starting subscriptions for {len(self.settings.symbols)} symbols: "
-            f"{', '.join(self.settings.symbols)}"
+            f"Starting subscriptions for {len(symbols)} symbols: "
+            f"{', '.join(symbols)}"
         )
         
-        # Start subscriptions for each symbol
-        for symbol in self.settings.symbols:
-            # Ticker subscription
-            if "ticker" in self.settings.intervals or "klines" in self.settings.intervals:
-                task = asyncio.create_task(
-                    self._subscribe_ticker(symbol),
-                    name=f"ticker_{symbol}"
-                )
-                self._tasks.add(task)
-            
-            # Order book subscription
-            if "orderbook_snapshot" in self.settings.intervals:
-                task = asyncio.create_task(
-                    self._subscribe_orderbook(symbol),
-                    name=f"orderbook_{symbol}"
-                )
-                self._tasks.add(task)
-            
-            # Trades subscription
-            if "trades" in self.settings.intervals:
-                task = asyncio.create_task(
-                    self._subscribe_trades(symbol),
-                    name=f"trades_{symbol}"
-                )
-                self._tasks.add(task)
-            
-            # OHLCV subscriptions (multiple timeframes)
-            for timeframe in self._ohlcv_timeframes:
-                task = asyncio.create_task(
-                    self._subscribe_ohlcv(symbol, timeframe),
-                    name=f"ohlcv_{symbol}_{timeframe}"
-                )
-                self._tasks.add(task)
-            
-            # Funding rate subscription
-            if "funding" in self.settings.intervals:
-                task = asyncio.create_task(
-                    self._subscribe_funding(symbol),
-                    name=f"funding_{symbol}"
-                )
-                self._tasks.add(task)
-            
-            # Mark price subscription
-            if "mark_price" in self.settings.intervals or "funding" in self.settings.intervals:
-                task = asyncio.create_task(
-                    self._subscribe_mark_price(symbol),
-                    name=f"mark_price_{symbol}"
-                )
-                self._tasks.add(task)
+        # Start the pre-built subscription for each (symbol, channel) in one
+        # pass. Not an asyncio.TaskGroup: its exit waits for every task, and
+        # these run until stop(); one failing channel must not cancel the rest
+        create_task = asyncio.get_running_loop().create_task
+        started = [
+            create_task(make_coro(), name=task_name)
+            for task_name, make_coro in self._plan
+        ]
+        tasks.update(started)
+        discard = tasks.discard
+        for task in started:
+            task.add_done_callback(discard)
         
         logger.info(f"Started {len(self._tasks)} subscription tasks")
     
@@ -192,18 +582,33 @@ class SubscriptionManager:
         self._running = False
         self._stop_event.set()
         
-        # Cancel all tasks
-        for task in self._tasks:
+        # Cancel pending polls and all tasks
+        if self._poll_timer is not None:
+            self._poll_timer.cancel()
+            self._poll_timer = None
+        self._polls.clear()
+        
+        tasks = list(self._tasks)
+        for task in tasks:
             if not task.done():
                 task.cancel()
         
         # Wait for all tasks to complete
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         self._tasks.clear()
         logger.info("Subscription manager stopped")
     
+    async def __aenter__(self) -> SubscriptionManager:
+        """Start all subscriptions: ``async with manager: ...``."""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop all subscriptions, including when the body raised."""
+        await self.stop()
+    
     async def _subscribe_ticker(self, symbol: str) -> None:
         """
         Subscribe to ticker updates for a symbol.
@@ -211,44 +616,47 @@ class SubscriptionManager:
         Args:
             symbol: Trading pair symbol (e.g., "BTC/USDT:USDT")
         """
-        interval_str = self.settings.intervals.get("klines", "1m")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["klines"]
+        log = self._logger
+        tag = f"[{symbol}] ticker"
         
-        logger.info(
-            f"Starting ticker subscription: {symbol} "
-            f"(interval: {interval_str})"
-        )
+        log.info("%s subscription starting (interval: %s)", tag, interval_str)
+        
+        # Resolve attribute chains once per task rather than per update
+        watch = self.exchange.watch_ticker
+        enqueue = self._enqueue
+        queue = self.ticker_queue
+        stop_event = self._stop_event
+        sleep = self._sleep
         
         try:
-            while self._running and not self._stop_event.is_set():
+            while self._running and not stop_event.is_set():
                 try:
                     # Watch ticker via ccxt.pro
-                    ticker = await self.exchange.watch_ticker(symbol)
+                    ticker = await watch(symbol)
                     
                     # Enqueue normalized data
                     if ticker:
-                        await self.ticker_queue.put({
-                            "type": "ticker",
-                            "symbol": symbol,
-                            "data": ticker,
-                        })
-                        logger.debug(f"Ticker update: {symbol} - ${ticker.get('last')}")
+                        enqueue(
+                            queue, "ticker", Envelope(Channel.TICKER, symbol, ticker)
+                        )
+                        log.debug("%s update: last=%s", tag, ticker.get("last"))
                     
-                    # Throttle if interval specified
-                    if interval:
-                        await asyncio.sleep(interval)
+                    # Throttle if interval specified; otherwise still yield so a
+                    # stream that never suspends cannot starve other tasks
+                    await sleep(interval or 0)
                 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    logger.error(f"Error in ticker subscription for {symbol}: {e}")
+                    log.error("%s subscription error: %s", tag, e)
                     # Backoff before retry
-                    await asyncio.sleep(5)
+                    await sleep(5)
         
         except asyncio.CancelledError:
-            logger.info(f"Ticker subscription cancelled: {symbol}")
+            log.info("%s subscription cancelled", tag)
         except Exception as e:
-            logger.exception(f"Fatal error in ticker subscription for {symbol}: {e}")
+            log.exception("%s subscription fatal error: %s", tag, e)
     
     async def _subscribe_orderbook(self, symbol: str) -> None:
         """
@@ -257,48 +665,57 @@ class SubscriptionManager:
         Args:
             symbol: Trading pair symbol
         """
-        interval_str = self.settings.intervals.get("orderbook_snapshot", "1m")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["orderbook_snapshot"]
         depth = self.settings.orderbook.depth
+        log = self._logger
+        tag = f"[{symbol}] orderbook"
         
-        logger.info(
-            f"Starting orderbook subscription: {symbol} "
-            f"(depth: {depth}, interval: {interval_str})"
+        log.info(
+            "%s subscription starting (depth: %s, interval: %s)",
+            tag, depth, interval_str,
         )
         
+        # Resolve attribute chains once per task rather than per update
+        watch = self.exchange.watch_order_book
+        enqueue = self._enqueue
+        queue = self.orderbook_queue
+        stop_event = self._stop_event
+        sleep = self._sleep
+        
         try:
-            while self._running and not self._stop_event.is_set():
+            while self._running and not stop_event.is_set():
                 try:
                     # Watch order book via ccxt.pro
-                    orderbook = await self.exchange.watch_order_book(symbol, depth)
+                    orderbook = await watch(symbol, depth)
                     
                     # Enqueue normalized data
                     if orderbook:
-                        await self.orderbook_queue.put({
-                            "type": "orderbook",
-                            "symbol": symbol,
-                            "data": orderbook,
-                        })
-                        logger.debug(
-                            f"Orderbook update: {symbol} - "
-                            f"bids: {len(orderbook.get('bids', []))}, "
-                            f"asks: {len(orderbook.get('asks', []))}"
+                        enqueue(
+                            queue,
+                            "orderbook",
+                            Envelope(Channel.ORDERBOOK, symbol, orderbook),
+                        )
+                        log.debug(
+                            "%s update: bids=%d asks=%d",
+                            tag,
+                            len(orderbook.get("bids", [])),
+                            len(orderbook.get("asks", [])),
                         )
                     
-                    # Throttle if interval specified
-                    if interval:
-                        await asyncio.sleep(interval)
+                    # Throttle if interval specified; otherwise still yield so a
+                    # stream that never suspends cannot starve other tasks
+                    await sleep(interval or 0)
                 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    logger.error(f"Error in orderbook subscription for {symbol}: {e}")
-                    await asyncio.sleep(5)
+                    log.error("%s subscription error: %s", tag, e)
+                    await sleep(5)
         
         except asyncio.CancelledError:
-            logger.info(f"Orderbook subscription cancelled: {symbol}")
+            log.info("%s subscription cancelled", tag)
         except Exception as e:
-            logger.exception(f"Fatal error in orderbook subscription for {symbol}: {e}")
+            log.exception("%s subscription fatal error: %s", tag, e)
     
     async def _subscribe_trades(self, symbol: str) -> None:
         """
@@ -307,215 +724,263 @@ class SubscriptionManager:
         Args:
             symbol: Trading pair symbol
         """
-        interval_str = self.settings.intervals.get("trades", "realtime")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["trades"]
+        log = self._logger
+        tag = f"[{symbol}] trades"
         
-        logger.info(
-            f"Starting trades subscription: {symbol} "
-            f"(interval: {interval_str})"
-        )
+        log.info("%s subscription starting (interval: %s)", tag, interval_str)
+        
+        # Resolve attribute chains once per task rather than per update
+        watch = self.exchange.watch_trades
+        enqueue_many = self._enqueue_many
+        queue = self.trades_queue
+        stop_event = self._stop_event
+        sleep = self._sleep
         
         try:
-            while self._running and not self._stop_event.is_set():
+            while self._running and not stop_event.is_set():
                 try:
                     # Watch trades via ccxt.pro
-                    trades = await self.exchange.watch_trades(symbol)
+                    trades = await watch(symbol)
                     
                     # Enqueue normalized data
                     if trades:
-                        for trade in trades:
-                            await self.trades_queue.put({
-                                "type": "trade",
-                                "symbol": symbol,
-                                "data": trade,
-                            })
-                        logger.debug(f"Trades update: {symbol} - {len(trades)} trades")
+                        # Back-pressure: wait for the consumer rather than drop
+                        await queue.wait_not_full()
+                        enqueue_many(queue, "trades", [
+                            Envelope(Channel.TRADE, symbol, trade) for trade in trades
+                        ])
+                        log.debug("%s update: %d trades", tag, len(trades))
                     
-                    # Throttle if interval specified
-                    if interval:
-                        await asyncio.sleep(interval)
+                    # Throttle if interval specified; otherwise still yield so a
+                    # stream that never suspends cannot starve other tasks
+                    await sleep(interval or 0)
                 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    logger.error(f"Error in trades subscription for {symbol}: {e}")
-                    await asyncio.sleep(5)
+                    log.error("%s subscription error: %s", tag, e)
+                    await sleep(5)
         
         except asyncio.CancelledError:
-            logger.info(f"Trades subscription cancelled: {symbol}")
+            log.info("%s subscription cancelled", tag)
         except Exception as e:
-            logger.exception(f"Fatal error in trades subscription for {symbol}: {e}")
+            log.exception("%s subscription fatal error: %s", tag, e)
     
-    async def _subscribe_ohlcv(self, symbol: str, timeframe: str) -> None:
+    async def _subscribe_ohlcv(self, symbol: str, timeframes: Sequence[str]) -> None:
         """
-        Subscribe to OHLCV (candlestick) updates for a symbol and timeframe.
+        Subscribe to OHLCV (candlestick) updates for a symbol.
+        
+        All timeframes are watched through a single multi-timeframe
+        subscription and demultiplexed into the OHLCV queue.
         
         Args:
             symbol: Trading pair symbol
-            timeframe: Timeframe (e.g., "1m", "5m", "1h")
+            timeframes: Timeframes (e.g., ["1m", "5m", "1h"])
         """
-        interval_str = self.settings.intervals.get("klines", "1m")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["klines"]
+        log = self._logger
+        tag = f"[{symbol}] ohlcv@{','.join(timeframes)}"
         
-        logger.info(
-            f"Starting OHLCV subscription: {symbol} @ {timeframe} "
-            f"(interval: {interval_str})"
-        )
+        log.info("%s subscription starting (interval: %s)", tag, interval_str)
+        
+        # Resolve attribute chains once per task rather than per update
+        watch = self.exchange.watch_ohlcv_multi
+        enqueue_many = self._enqueue_many
+        queue = self.ohlcv_queue
+        stop_event = self._stop_event
+        sleep = self._sleep
         
         try:
-            while self._running and not self._stop_event.is_set():
+            while self._running and not stop_event.is_set():
                 try:
                     # Watch OHLCV via ccxt.pro
-                    ohlcv_list = await self.exchange.watch_ohlcv(symbol, timeframe)
+                    updates = await watch(symbol, timeframes)
                     
                     # Enqueue normalized data
-                    if ohlcv_list:
-                        for ohlcv in ohlcv_list:
-                            await self.ohlcv_queue.put({
-                                "type": "ohlcv",
-                                "symbol": symbol,
-                                "timeframe": timeframe,
-                                "data": ohlcv,
-                            })
-                        logger.debug(
-                            f"OHLCV update: {symbol} @ {timeframe} - "
-                            f"{len(ohlcv_list)} candles"
+                    for timeframe, ohlcv_list in updates.items():
+                        if not ohlcv_list:
+                            continue
+                        enqueue_many(queue, "ohlcv", [
+                            Envelope(Channel.OHLCV, symbol, ohlcv, timeframe)
+                            for ohlcv in ohlcv_list
+                        ])
+                        log.debug(
+                            "%s update: %s %d candles", tag, timeframe, len(ohlcv_list)
                         )
                     
-                    # Throttle if interval specified
-                    if interval:
-                        await asyncio.sleep(interval)
+                    # Throttle if interval specified; otherwise still yield so a
+                    # stream that never suspends cannot starve other tasks
+                    await sleep(interval or 0)
                 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    logger.error(
-                        f"Error in OHLCV subscription for {symbol} @ {timeframe}: {e}"
-                    )
-                    await asyncio.sleep(5)
+                    log.error("%s subscription error: %s", tag, e)
+                    await sleep(5)
         
         except asyncio.CancelledError:
-            logger.info(f"OHLCV subscription cancelled: {symbol} @ {timeframe}")
+            log.info("%s subscription cancelled", tag)
         except Exception as e:
-            logger.exception(
-                f"Fatal error in OHLCV subscription for {symbol} @ {timeframe}: {e}"
-            )
+            log.exception("%s subscription fatal error: %s", tag, e)
+    
+    def _schedule_poll(
+        self,
+        name: str,
+        symbol: str,
+        delay: float,
+        poll: PollFunction,
+    ) -> None:
+        """
+        Schedule the next run of a one-shot poll after ``delay`` seconds.
+        
+        Polls are almost entirely idle time, so rather than keeping a task
+        parked in ``asyncio.sleep`` for hours, the poll waits in a heap and a
+        task exists only for the duration of the REST round-trip. Only the
+        earliest deadline holds an event loop timer, however many
+        (symbol, poll) pairs are pending.
+        
+        Args:
+            name: Subscription name (e.g., "funding")
+            symbol: Trading pair symbol
+            delay: Seconds until the next poll
+            poll: One-shot poll coroutine function taking the symbol
+        """
+        if not self._running:
+            return
+        
+        loop = asyncio.get_running_loop()
+        entry = (loop.time() + delay, next(self._poll_seq), name, symbol, poll)
+        heapq.heappush(self._polls, entry)
+        if self._polls[0] is entry:
+            self._arm_poll_timer(loop)
+    
+    def _arm_poll_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        """(Re)arm the single poll timer for the earliest pending deadline."""
+        if self._poll_timer is not None:
+            self._poll_timer.cancel()
+        self._poll_timer = (
+            loop.call_at(self._polls[0][0], self._run_due_polls)
+            if self._polls
+            else None
+        )
+    
+    def _run_due_polls(self) -> None:
+        """Timer callback: start every poll whose deadline has passed."""
+        self._poll_timer = None
+        if not self._running:
+            return
+        
+        loop = asyncio.get_running_loop()
+        polls = self._polls
+        now = loop.time()
+        while polls and polls[0][0] <= now:
+            _, _, name, symbol, poll = heapq.heappop(polls)
+            self._spawn_poll(name, symbol, poll)
+        if polls:
+            self._arm_poll_timer(loop)
     
-    async def _subscribe_funding(self, symbol: str) -> None:
+    def _spawn_poll(self, name: str, symbol: str, poll: PollFunction) -> None:
+        """Run a due poll as a short-lived task."""
+        task = asyncio.create_task(poll(symbol), name=f"{name}_{symbol}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _poll_funding(self, symbol: str) -> None:
         """
-        Subscribe to funding rate updates for a symbol.
+        Fetch the funding rate once and schedule the next poll.
         
         Args:
             symbol: Trading pair symbol
         """
-        interval_str = self.settings.intervals.get("funding", "8h")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["funding"]
         
         # Default to 8 hours for funding rate if not specified
         if interval is None:
             interval = 8 * 3600  # 8 hours in seconds
         
-        logger.info(
-            f"Starting funding rate subscription: {symbol} "
-            f"(interval: {interval_str})"
-        )
+        log = self._logger
+        tag = f"[{symbol}] funding"
+        
+        log.debug("%s polling (interval: %s)", tag, interval_str)
         
         try:
-            while self._running and not self._stop_event.is_set():
-                try:
-                    # Fetch funding rate (REST API, not WebSocket)
-                    funding_rate = await self.exchange.fetch_funding_rate(symbol)
-                    
-                    # Enqueue normalized data
-                    if funding_rate:
-                        await self.funding_queue.put({
-                            "type": "funding_rate",
-                            "symbol": symbol,
-                            "data": funding_rate,
-                        })
-                        logger.debug(
-                            f"Funding rate update: {symbol} - "
-                            f"{funding_rate.get('fundingRate', 'N/A')}"
-                        )
-                    
-                    # Wait for next interval
-                    await asyncio.sleep(interval)
-                
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    logger.error(f"Error in funding rate subscription for {symbol}: {e}")
-                    await asyncio.sleep(60)  # Retry after 1 minute
+            # Fetch funding rate (REST API, not WebSocket)
+            funding_rate = await self.exchange.fetch_funding_rate(symbol)
+            
+            # Enqueue normalized data
+            if funding_rate:
+                self._enqueue(
+                    self.funding_queue,
+                    "funding",
+                    Envelope(Channel.FUNDING_RATE, symbol, funding_rate),
+                )
+                log.debug(
+                    "%s update: rate=%s", tag, funding_rate.get("fundingRate", "N/A")
+                )
         
         except asyncio.CancelledError:
-            logger.info(f"Funding rate subscription cancelled: {symbol}")
+            log.info("%s subscription cancelled", tag)
+            return
         except Exception as e:
-            logger.exception(
-                f"Fatal error in funding rate subscription for {symbol}: {e}"
-            )
+            log.error("%s subscription error: %s", tag, e)
+            interval = 60  # Retry after 1 minute
+        
+        self._schedule_poll("funding", symbol, interval, self._poll_funding)
     
-    async def _subscribe_mark_price(self, symbol: str) -> None:
+    async def _poll_mark_price(self, symbol: str) -> None:
         """
-        Subscribe to mark price updates for a symbol.
+        Derive the mark price once and schedule the next poll.
         
         Args:
             symbol: Trading pair symbol
         """
-        interval_str = self.settings.intervals.get("mark_price", "1m")
-        interval = self._parse_interval(interval_str)
+        interval_str, interval = self._intervals["mark_price"]
         
         # Default to 1 minute if not specified
         if interval is None:
             interval = 60
         
-        logger.info(
-            f"Starting mark price subscription: {symbol} "
-            f"(interval: {interval_str})"
-        )
+        log = self._logger
+        tag = f"[{symbol}] mark_price"
+        
+        log.debug("%s polling (interval: %s)", tag, interval_str)
         
         try:
-            while self._running and not self._stop_event.is_set():
-                try:
-                    # Derive mark price from ticker
-                    mark_price = await self.exchange.derive_mark_price(symbol)
-                    
-                    # Enqueue normalized data
-                    if mark_price:
-                        await self.mark_price_queue.put({
-                            "type": "mark_price",
-                            "symbol": symbol,
-                            "data": {
-                                "symbol": symbol,
-                                "mark_price": mark_price,
-                                "timestamp": None,  # Will be set by storage layer
-                            },
-                        })
-                        logger.debug(f"Mark price update: {symbol} - ${mark_price}")
-                    
-                    # Wait for next interval
-                    await asyncio.sleep(interval)
-                
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    logger.error(f"Error in mark price subscription for {symbol}: {e}")
-                    await asyncio.sleep(30)  # Retry after 30 seconds
+            # Derive mark price from ticker
+            mark_price = await self.exchange.derive_mark_price(symbol)
+            
+            # Enqueue normalized data
+            if mark_price:
+                self._enqueue(
+                    self.mark_price_queue,
+                    "mark_price",
+                    Envelope(Channel.MARK_PRICE, symbol, {
+                        "symbol": symbol,
+                        "mark_price": mark_price,
+                        "timestamp": None,  # Will be set by storage layer
+                    }),
+                )
+                log.debug("%s update: %s", tag, mark_price)
         
         except asyncio.CancelledError:
-            logger.info(f"Mark price subscription cancelled: {symbol}")
+            log.info("%s subscription cancelled", tag)
+            return
         except Exception as e:
-            logger.exception(
-                f"Fatal error in mark price subscription for {symbol}: {e}"
-            )
+            log.error("%s subscription error: %s", tag, e)
+            interval = 30  # Retry after 30 seconds
+        
+        self._schedule_poll("mark_price", symbol, interval, self._poll_mark_price)
     
     def get_queue_sizes(self) -> Dict[str, int]:
         """
         Get current queue sizes for monitoring.
         
         Returns:
-            Dictionary mapping queue names to their sizes
+            Dictionary mapping queue names to their sizes, plus
+            ``<name>_dropped`` counters for items discarded when full
         """
-        return {
+        sizes = {
             "ticker": self.ticker_queue.qsize(),
             "orderbook": self.orderbook_queue.qsize(),
             "trades": self.trades_queue.qsize(),
@@ -523,6 +988,8 @@ class SubscriptionManager:
             "funding": self.funding_queue.qsize(),
             "mark_price": self.mark_price_queue.qsize(),
         }
+        sizes.update({f"{name}_dropped": n for name, n in self._dropped.items()})
+        return sizes
     
     @property
     def is_running(self) -> bool:
@@ -531,8 +998,8 @@ class SubscriptionManager:
     
     @property
     def task_count(self) -> int:
-        """Get count of active subscription tasks."""
-        return len(self._tasks)
+        """Get count of active subscriptions (running tasks and scheduled polls)."""
+        return len(self._tasks) + len(self._polls)
 
 
-__all__ = ["SubscriptionManager"]
+__all__ = ["Channel", "ChannelQueue", "Envelope", "SubscriptionManager"]
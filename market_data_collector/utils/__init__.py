@@ -1,3 +1,5 @@
-from .logging import configure_logging, get_logger
+from .eventloop import run
+from .logging import configure_logging, get_logger, init_logging
+from .serialization import dumps, loads
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = ["configure_logging", "get_logger", "init_logging", "dumps", "loads", "run"]
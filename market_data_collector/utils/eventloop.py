@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
+HAS_UVLOOP = uvloop is not None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion, on a uvloop event loop when available."""
+
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from ..config import settings
 _MAX_BYTES = 10 * 1024 * 1024
 _BACKUP_COUNT = 5
 _LOGGING_INITIALIZED = False
+_LOGGING_LOCK = threading.Lock()
 
 
 def _resolve_level(level: int | str) -> int:
@@ -28,8 +30,19 @@ def _resolve_log_file(path_value: str) -> Path:
 
 
 def configure_logging(force: bool = False) -> None:
-    """Configure application-wide logging using a rotating file handler."""
+    """Configure application-wide logging using a rotating file handler.
 
+    When ``logging.file`` is unset a ``NullHandler`` is installed instead.
+    """
+
+    if _LOGGING_INITIALIZED and not force:
+        return
+
+    with _LOGGING_LOCK:
+        _configure_locked(force)
+
+
+def _configure_locked(force: bool) -> None:
     global _LOGGING_INITIALIZED
 
     if _LOGGING_INITIALIZED and not force:
@@ -37,12 +50,29 @@ def configure_logging(force: bool = False) -> None:
 
     log_settings = settings.logging
     level = _resolve_level(log_settings.level)
-    log_path = _resolve_log_file(log_settings.file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
 
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
+    if log_settings.file is None:
+        # No log file: no handler to open, format or lock per record. Drop
+        # file handlers from an earlier configuration so reconfiguring with
+        # force=True turns file logging off
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, RotatingFileHandler):
+                root_logger.removeHandler(handler)
+                handler.close()
+        if not any(
+            isinstance(handler, logging.NullHandler)
+            for handler in root_logger.handlers
+        ):
+            root_logger.addHandler(logging.NullHandler())
+        _LOGGING_INITIALIZED = True
+        return
+
+    log_path = _resolve_log_file(log_settings.file)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
     existing_handlers = [
         handler
         for handler in root_logger.handlers
@@ -71,14 +101,17 @@ def configure_logging(force: bool = False) -> None:
     _LOGGING_INITIALIZED = True
 
 
+def init_logging(force: bool = False) -> None:
+    """Initialize collector logging explicitly from an entry point."""
+
+    configure_logging(force=force)
+
+
 def get_logger(name: str | None = None) -> logging.Logger:
-    """Return a logger with the collector configuration applied."""
+    """Return a logger, initializing the collector configuration on first use."""
 
     configure_logging()
     return logging.getLogger(name)
 
 
-configure_logging()
-
-
-__all__ = ["configure_logging", "get_logger"]
+__all__ = ["configure_logging", "get_logger", "init_logging"]
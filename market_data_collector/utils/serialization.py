@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text produced by :func:`dumps`."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -23,12 +23,8 @@ def test_acceptance_criteria():
     print("=" * 80 + "\n")
 
     # Setup
-    db_path = Path("./test_data/acceptance_test.db")
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    if db_path.exists():
-        db_path.unlink()
-
-    api = BridgeAPI(db_path)
+    # In-memory database: starts empty, nothing to delete or fsync
+    api = BridgeAPI(Path(":memory:"))
 
     # Test video data
     video_url = "https://www.douyin.com/video/7123456789012345678"
@@ -100,12 +96,14 @@ def test_acceptance_criteria():
     }
 
     print("\n  Verified fields:")
+    verified = []
     for field, expected in key_fields.items():
         actual = stored_video[field]
         assert (
             actual == expected
         ), f"Field {field}: expected {expected}, got {actual}"
-        print(f"    ✓ {field}: {actual}")
+        verified.append(f"    ✓ {field}: {actual}")
+    print("\n".join(verified))
 
     print("\n✓ CRITERION 3: No duplicates on repeated runs")
 
@@ -0,0 +1,139 @@
+"""Tests for the SQLite database layer in app/db.py."""
+
+import shutil
+import sqlite3
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import event
+from sqlalchemy.exc import ProgrammingError
+
+from app import db as db_module
+from app.db import ChunkWriter, Database
+
+VIDEO = {
+    "aweme_id": "7300000000000000001",
+    "desc": "Chunk writer test #demo",
+    "create_time": 1609459200,
+    "author": {"uid": "author_001", "nickname": "Author"},
+}
+
+
+def test_chunk_writer_isolates_failing_chunks():
+    """Test one bad chunk in a merged batch does not fail the others."""
+    db = Database(Path(":memory:"))
+    writer = ChunkWriter(db)
+    good, malformed, unbindable = Future(), Future(), Future()
+
+    # Queue all three before the thread starts so they are merged into one batch
+    writer._queue.put(([VIDEO], good))
+    writer._queue.put(([None], malformed))
+    # A dict description normalizes fine but cannot be written
+    unwritable = {**VIDEO, "aweme_id": "7300000000000000002", "desc": {"text": "x"}}
+    writer._queue.put(([unwritable], unbindable))
+    writer._ensure_thread()
+
+    assert good.result(timeout=5) == {"inserted": 1, "updated": 0}
+    with pytest.raises(AttributeError):
+        malformed.result(timeout=5)
+    with pytest.raises(ProgrammingError, match="binding parameter"):
+        unbindable.result(timeout=5)
+
+    result = db.list_videos({}, 1, 10)
+    assert [item["aweme_id"] for item in result["items"]] == [VIDEO["aweme_id"]]
+
+
+def test_reopen_after_data_directory_removed(tmp_path):
+    """Test a known database path reopens after its directory is deleted."""
+    db_path = tmp_path / "data" / "douyin.db"
+    db = Database(db_path)
+    db.upsert_videos([VIDEO])
+    db.close()
+    shutil.rmtree(db_path.parent)
+
+    db = Database(db_path)
+    assert db.list_videos({}, 1, 10)["total"] == 0
+    db.close()
+
+
+def _paged_videos():
+    """Twelve videos sharing create_time in pairs, three without create_time."""
+    videos = [
+        {
+            **VIDEO,
+            "aweme_id": f"73000000000001{n:02d}",
+            "create_time": 1609459200 + n // 2,
+        }
+        for n in range(12)
+    ]
+    videos += [
+        {**VIDEO, "aweme_id": f"73000000000002{n:02d}", "create_time": None}
+        for n in range(3)
+    ]
+    return videos
+
+
+def test_cursor_pages_match_offset_pages():
+    """Test keyset pages walk the same order as offsets, NULL create_time last."""
+    db = Database(Path(":memory:"))
+    db.upsert_videos(_paged_videos())
+    expected = [item["aweme_id"] for item in db.list_videos({}, 1, 50)["items"]]
+
+    seen, cursor = [], None
+    while True:
+        result = db.list_videos({}, 1, 4, cursor, include_total=False)
+        seen.extend(item["aweme_id"] for item in result["items"])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert [aweme_id[-5:-2] for aweme_id in seen[-3:]] == ["002"] * 3
+
+
+def test_list_queries_read_in_index_order():
+    """Test first and cursor pages use the list index without a temp sort."""
+    db = Database(Path(":memory:"))
+    db.upsert_videos(_paged_videos())
+    statements = []
+
+    @event.listens_for(db._engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT video.aweme_id, video.author_id"):
+            statements.append((statement, parameters))
+
+    first = db.list_videos({}, 1, 4, include_total=False)
+    db.list_videos({}, 1, 4, first["next_cursor"], include_total=False)
+    db.list_videos({"author_id": "author_001"}, 1, 4, include_total=False)
+    assert len(statements) == 3
+
+    with db._engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            details = " | ".join(row[-1] for row in plan)
+            assert "TEMP B-TREE" not in details, details
+
+
+def test_tags_backfilled_for_videos_stored_before_tag_table(tmp_path):
+    """Test upgrading a database without the tag table indexes existing videos."""
+    db_path = tmp_path / "douyin.db"
+    db = Database(db_path)
+    db.upsert_videos([VIDEO, {**VIDEO, "aweme_id": "7300000000000000003", "desc": ""}])
+    db.close()
+
+    # Recreate a database from before tags were indexed
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE videotag")
+    db_module._SCHEMA_READY.discard(db_path.absolute())
+
+    db = Database(db_path)
+    result = db.list_videos({"tag": "demo"}, 1, 10)
+    assert [item["aweme_id"] for item in result["items"]] == [VIDEO["aweme_id"]]
+    db.close()
@@ -19,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from market_data_collector.exchange import create_exchange_adapter
+from market_data_collector.utils import run
 
 # Configure logging
 logging.basicConfig(
@@ -37,9 +38,22 @@ async def test_websocket_connection(adapter, symbol: str):
     logger.info("=" * 80)
     
     try:
+        # The four streams are independent, so wait on them concurrently
+        logger.info(
+            f"\nWatching ticker, order book, trades and OHLCV (1m) for {symbol}..."
+        )
+        ticker, orderbook, trades, ohlcv_list = await asyncio.wait_for(
+            asyncio.gather(
+                adapter.watch_ticker(symbol),
+                adapter.watch_order_book(symbol, limit=5),
+                adapter.watch_trades(symbol),
+                adapter.watch_ohlcv(symbol, timeframe="1m", limit=3),
+            ),
+            timeout=30,
+        )
+
         # Test watch_ticker
-        logger.info(f"\n1. Testing watch_ticker for {symbol}...")
-        ticker = await adapter.watch_ticker(symbol)
+        logger.info(f"\n1. watch_ticker for {symbol}")
         logger.info(f"✓ Ticker received:")
         logger.info(f"  - Symbol: {ticker.get('symbol')}")
         logger.info(f"  - Last price: {ticker.get('last')}")
@@ -48,8 +62,7 @@ async def test_websocket_connection(adapter, symbol: str):
         logger.info(f"  - Timestamp (ms): {ticker.get('timestamp')}")
         
         # Test watch_order_book
-        logger.info(f"\n2. Testing watch_order_book for {symbol}...")
-        orderbook = await adapter.watch_order_book(symbol, limit=5)
+        logger.info(f"\n2. watch_order_book for {symbol}")
         logger.info(f"✓ Order book received:")
         logger.info(f"  - Symbol: {orderbook.get('symbol')}")
         logger.info(f"  - Bids (top 3): {orderbook.get('bids', [])[:3]}")
@@ -57,8 +70,7 @@ async def test_websocket_connection(adapter, symbol: str):
         logger.info(f"  - Timestamp (ms): {orderbook.get('timestamp')}")
         
         # Test watch_trades
-        logger.info(f"\n3. Testing watch_trades for {symbol}...")
-        trades = await adapter.watch_trades(symbol)
+        logger.info(f"\n3. watch_trades for {symbol}")
         logger.info(f"✓ Trades received: {len(trades)} trade(s)")
         if trades:
             trade = trades[0]
@@ -69,8 +81,7 @@ async def test_websocket_connection(adapter, symbol: str):
             logger.info(f"    - Timestamp (ms): {trade.get('timestamp')}")
         
         # Test watch_ohlcv
-        logger.info(f"\n4. Testing watch_ohlcv for {symbol} (1m)...")
-        ohlcv_list = await adapter.watch_ohlcv(symbol, timeframe="1m", limit=3)
+        logger.info(f"\n4. watch_ohlcv for {symbol} (1m)")
         logger.info(f"✓ OHLCV data received: {len(ohlcv_list)} candle(s)")
         if ohlcv_list:
             candle = ohlcv_list[-1]
@@ -105,6 +116,10 @@ async def test_rest_fallback(adapter, symbol: str):
         logger.info(f"  - Last price: {ticker.get('last')}")
         logger.info(f"  - Timestamp (ms): {ticker.get('timestamp')}")
         
+        fast_ticker = await adapter.fetch_ticker_fast(symbol)
+        assert fast_ticker.get("symbol") == symbol
+        logger.info(f"✓ Ticker fetched on the async client: {fast_ticker.get('last')}")
+        
         # Test fetch_order_book
         logger.info(f"\n2. Testing fetch_order_book (REST) for {symbol}...")
         orderbook = await adapter.fetch_order_book(symbol, limit=5)
@@ -283,4 +298,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(run(main()))
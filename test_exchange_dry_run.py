@@ -8,15 +8,35 @@ actually connecting to the exchange.
 
 import asyncio
 import sys
+import tempfile
+import traceback
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from market_data_collector.exchange import ExchangeAdapter, create_exchange_adapter
+from market_data_collector.exchange import (
+    _RETRY_CONCURRENCY,
+    ExchangeAdapter,
+    _retry_slot,
+    create_exchange_adapter,
+)
+from market_data_collector.utils import run
 
-# Use print for output (simpler than logging)
-def log(message):
-    print(message, flush=True)
+# Output is buffered and written once per test instead of once per line
+_BUF: list[str] = []
+
+
+def log(message, exc_info=False):
+    _BUF.append(message)
+    if exc_info:
+        _BUF.append(traceback.format_exc().rstrip())
+
+
+def flush():
+    if _BUF:
+        sys.stdout.write("\n".join(_BUF) + "\n")
+        _BUF.clear()
+    sys.stdout.flush()
 
 
 async def test_initialization():
@@ -109,18 +129,45 @@ async def test_timestamp_normalization():
         assert normalized_ticker["timestamp"] == 1609459200000
         log(f"✓ Ticker timestamp normalized: {ticker['timestamp']} -> {normalized_ticker['timestamp']}")
         
+        struct = adapter._normalize_ticker_struct(
+            {"symbol": "BTC/USDT:USDT", "timestamp": 1609459200, "last": 50000.0}
+        )
+        assert struct.timestamp == 1609459200000 and struct.last == 50000.0
+        assert struct.bid is None and not hasattr(struct, "__dict__")
+        log(f"✓ Ticker struct built: {struct}")
+        
         # Trade
         trade = {"timestamp": 1609459200, "price": 50000}
         normalized_trade = adapter._normalize_trade(trade)
         assert normalized_trade["timestamp"] == 1609459200000
         log(f"✓ Trade timestamp normalized")
         
+        # Trades as columns
+        columns = adapter._normalize_trade_columns([
+            {"timestamp": 1609459200, "price": 50000.0, "amount": 0.5, "side": "buy"},
+            {"timestamp": 1609459201, "price": None, "amount": 1.0, "side": "sell"},
+        ])
+        assert list(columns.timestamp) == [1609459200000, 1609459201000]
+        assert columns.price[0] == 50000.0 and columns.price[1] != columns.price[1]
+        assert list(columns.side) == [1, -1]
+        log(f"✓ Trade columns built ({len(columns)} trades)")
+        
         # OHLCV
         ohlcv = [1609459200, 50000, 51000, 49000, 50500, 100]
         normalized_ohlcv = adapter._normalize_ohlcv(ohlcv)
         assert normalized_ohlcv[0] == 1609459200000
         log(f"✓ OHLCV timestamp normalized: {ohlcv[0]} -> {normalized_ohlcv[0]}")
         
+        # OHLCV batch (unit decided once per batch)
+        seconds_batch = [[1609459200 + 60 * i, 1, 2, 0.5, 1.5, 10] for i in range(20)]
+        normalized_batch = adapter._normalize_ohlcv_list(seconds_batch)
+        assert [row[0] for row in normalized_batch] == [
+            (1609459200 + 60 * i) * 1000 for i in range(20)
+        ]
+        ms_batch = [[1609459200000 + 60000 * i, 1, 2, 0.5, 1.5, 10] for i in range(20)]
+        assert adapter._normalize_ohlcv_list(ms_batch)[-1][0] == 1609459200000 + 60000 * 19
+        log(f"✓ OHLCV batch timestamps normalized ({len(normalized_batch)} candles)")
+        
         await adapter.close()
         
         log("\n✓ Timestamp normalization tests passed!")
@@ -199,6 +246,180 @@ async def test_exchange_instances():
         return False
 
 
+async def test_markets_cache():
+    """Test markets are served from a fresh on-disk cache without network."""
+    log("\n" + "=" * 80)
+    log("TEST: Markets Cache")
+    log("=" * 80)
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = ExchangeAdapter(
+                "bybit", "swap", sandbox=True, markets_cache_dir=Path(tmpdir)
+            )
+            adapter.markets_cache_path.write_text(
+                '{"markets": {"BTC/USDT:USDT": {"id": "BTCUSDT", '
+                '"symbol": "BTC/USDT:USDT", "base": "BTC", "quote": "USDT", '
+                '"settle": "USDT", "type": "swap", "spot": false, "swap": true, '
+                '"active": true}}, "currencies": {}}'
+            )
+            
+            markets = await adapter.load_markets()
+            assert "BTC/USDT:USDT" in markets
+            by_id = adapter.exchange.markets_by_id["BTCUSDT"]
+            assert by_id[0]["symbol"] == "BTC/USDT:USDT"
+            log(f"✓ Loaded {len(markets)} market(s) from {adapter.markets_cache_path.name}")
+            
+            assert adapter.exchange_pro.markets_by_id is adapter.exchange.markets_by_id
+            assert await adapter.exchange_pro.load_markets() is adapter.exchange.markets
+            log("✓ Markets shared with ccxt.pro client without reloading")
+            
+            adapter.markets_cache_ttl = 0
+            assert adapter._read_markets_cache() is None
+            log("✓ Expired cache is ignored")
+            
+            # A cache path that cannot be replaced must not leak temp files
+            adapter.markets_cache_path.unlink()
+            adapter.markets_cache_path.mkdir()
+            (adapter.markets_cache_path / "keep").touch()
+            adapter._write_markets_cache()
+            assert not list(Path(tmpdir).glob("*.tmp"))
+            log("✓ Failed cache write leaves no temp file")
+            
+            await adapter.close()
+        
+        log("\n✓ Markets cache tests passed!")
+        return True
+        
+    except Exception as e:
+        log(f"✗ Markets cache test failed: {e}", exc_info=True)
+        return False
+
+
+async def test_connection_pool():
+    """Test symbols are pinned to stable connections in the ccxt.pro pool."""
+    log("\n" + "=" * 80)
+    log("TEST: WebSocket Connection Pool")
+    log("=" * 80)
+    
+    try:
+        adapter = ExchangeAdapter("bybit", "swap", sandbox=True, max_connections=3)
+        
+        stats = adapter.connection_stats()
+        assert stats["connections"] == 3
+        assert adapter.exchange_pro is adapter._pool.clients[0]
+        log(f"✓ {stats['connections']} ccxt.pro clients created")
+        
+        symbols = [f"{base}/USDT:USDT" for base in ("BTC", "ETH", "SOL", "XRP")]
+        picked = [adapter._pool.pick(symbol) for symbol in symbols]
+        assert picked == [adapter._pool.pick(symbol) for symbol in symbols]
+        assert sum(adapter.connection_stats()["symbols_per_connection"]) == 4
+        log(f"✓ Symbols per connection: {adapter.connection_stats()['symbols_per_connection']}")
+        
+        await adapter.close()
+        
+        log("\n✓ Connection pool tests passed!")
+        return True
+        
+    except Exception as e:
+        log(f"✗ Connection pool test failed: {e}", exc_info=True)
+        return False
+
+
+async def test_retry_gating():
+    """Test a failed watch retries only after a jittered sleep and a free slot."""
+    log("\n" + "=" * 80)
+    log("TEST: Retry Gating")
+    log("=" * 80)
+    
+    try:
+        adapter = ExchangeAdapter("bybit", "swap", sandbox=True)
+        adapter.base_backoff = adapter.max_backoff = 0.01
+        calls = 0
+        
+        async def flaky_watch(symbol):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("Simulated disconnect")
+            return symbol
+        
+        # Hold every retry slot so the retry has to wait for one
+        slots = _retry_slot()
+        for _ in range(_RETRY_CONCURRENCY):
+            await slots.acquire()
+        
+        watch = asyncio.create_task(
+            adapter._watch("watch_test", flaky_watch, lambda result: result, "BTC")
+        )
+        await asyncio.sleep(0.1)
+        assert not watch.done() and calls == 1
+        log("✓ Retry after a failed fast path waits on the retry slot")
+        
+        slots.release()
+        assert await asyncio.wait_for(watch, timeout=1.0) == "BTC"
+        assert calls == 2
+        log("✓ Retry runs once a slot is free")
+        
+        for _ in range(_RETRY_CONCURRENCY - 1):
+            slots.release()
+        await adapter.close()
+        
+        log("\n✓ Retry gating tests passed!")
+        return True
+        
+    except Exception as e:
+        log(f"✗ Retry gating test failed: {e}", exc_info=True)
+        return False
+
+
+async def test_ohlcv_multi_fallback():
+    """Test the per-timeframe fallback is not held back by a stuck timeframe."""
+    log("\n" + "=" * 80)
+    log("TEST: OHLCV Multi-Timeframe Fallback")
+    log("=" * 80)
+    
+    class FlakyOhlcvAdapter(ExchangeAdapter):
+        __slots__ = ()
+        
+        async def watch_ohlcv(self, symbol, timeframe="1m"):
+            if timeframe == "5m":
+                # Stand-in for a timeframe stuck in its retry backoff
+                await asyncio.Event().wait()
+            if timeframe == "15m":
+                raise ConnectionError("Simulated 15m failure")
+            return [[1698765420000, 1.0, 2.0, 0.5, 1.5, 10.0]]
+    
+    try:
+        adapter = FlakyOhlcvAdapter("bybit", "swap", sandbox=True)
+        # Force the fallback without touching the class-level capability map
+        client = adapter._pool.pick("BTC/USDT:USDT")
+        client.has = {**client.has, "watchOHLCVForSymbols": False}
+        
+        updates = await asyncio.wait_for(
+            adapter.watch_ohlcv_multi("BTC/USDT:USDT", ["1m", "5m"]), timeout=1.0
+        )
+        assert list(updates) == ["1m"]
+        assert "watch_ohlcv(BTC/USDT:USDT, 5m)" in adapter._watch_tasks
+        log("✓ Ready timeframe returned while another is still pending")
+        
+        try:
+            await adapter.watch_ohlcv_multi("BTC/USDT:USDT", ["15m"])
+        except ConnectionError:
+            log("✓ Error raised when every completed timeframe fails")
+        else:
+            raise AssertionError("Expected ConnectionError")
+        
+        await adapter.close()
+        
+        log("\n✓ OHLCV multi-timeframe fallback tests passed!")
+        return True
+        
+    except Exception as e:
+        log(f"✗ OHLCV multi-timeframe fallback test failed: {e}", exc_info=True)
+        return False
+
+
 async def main():
     """Main test entry point."""
     log("\n" + "=" * 80)
@@ -210,15 +431,35 @@ async def main():
     # Run tests
     result = await test_initialization()
     test_results.append(("Initialization", result))
+    flush()
     
     result = await test_timestamp_normalization()
     test_results.append(("Timestamp Normalization", result))
+    flush()
     
     result = await test_symbol_formatting()
     test_results.append(("Symbol Formatting", result))
+    flush()
     
     result = await test_exchange_instances()
     test_results.append(("Exchange Instances", result))
+    flush()
+    
+    result = await test_markets_cache()
+    test_results.append(("Markets Cache", result))
+    flush()
+    
+    result = await test_connection_pool()
+    test_results.append(("Connection Pool", result))
+    flush()
+    
+    result = await test_retry_gating()
+    test_results.append(("Retry Gating", result))
+    flush()
+    
+    result = await test_ohlcv_multi_fallback()
+    test_results.append(("OHLCV Multi Fallback", result))
+    flush()
     
     # Summary
     log("\n" + "=" * 80)
@@ -251,4 +492,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    try:
+        exit_code = run(main())
+    finally:
+        flush()
+    sys.exit(exit_code)
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Integration test demonstrating the complete video crawl flow."""
 
+import os
 import sys
-import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
+# Test databases are thrown away, so skip fsync on commit
+os.environ.setdefault("DB_SYNC", "OFF")
 
 from app.api import BridgeAPI
 
@@ -18,12 +22,12 @@ def test_complete_video_workflow():
     3. Test idempotency on repeated crawls
     4. Verify auto-completion behavior
     """
-    db_path = Path("./test_data/integration_test.db")
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Clean slate
-    if db_path.exists():
-        db_path.unlink()
+    # Private directory per run, so parallel workers never share a database
+    # or collide on the timestamped CSV export written next to it
+    workdir = tempfile.TemporaryDirectory(
+        prefix="doudou_integration_", ignore_cleanup_errors=True
+    )
+    db_path = Path(workdir.name) / "integration_test.db"
 
     api = BridgeAPI(db_path)
 
@@ -93,7 +97,7 @@ def test_complete_video_workflow():
     assert result["success"] and result["inserted"] == 1, "Initial ingestion failed"
 
     # Wait for auto-completion
-    time.sleep(2.5)
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
     state = api.state.snapshot()
     print(
         f"✓ Crawl completed: status='{state['status']}', message='{state['status_message']}'"
@@ -122,10 +126,12 @@ def test_complete_video_workflow():
         "video_url": "https://v3.douyinvod.com/video1.mp4",
     }
 
+    checked = []
     for field, expected in fields_to_check.items():
         actual = video.get(field)
         assert actual == expected, f"Field '{field}': expected {expected}, got {actual}"
-        print(f"  ✓ {field}: {actual}")
+        checked.append(f"  ✓ {field}: {actual}")
+    print("\n".join(checked))
 
     print("\n✅ Test Case 1 PASSED: All fields captured correctly\n")
 
@@ -149,7 +155,7 @@ def test_complete_video_workflow():
         "Minimal video ingestion failed"
     )
 
-    time.sleep(2.5)
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
 
     videos = api.list_videos({}, 1, 10)
     assert videos["total"] == 2, "Expected 2 videos after minimal video"
@@ -164,7 +170,9 @@ def test_complete_video_workflow():
     for run in range(1, 4):
         api.state.start("video", video_url)
         result = api.push_chunk([complete_video])
-        time.sleep(2.5)
+        assert api.state.completed_event.wait(timeout=5.0), (
+            f"Run {run}: auto-completion timed out"
+        )
 
         videos = api.list_videos({}, 1, 10)
         assert videos["total"] == 2, (
@@ -193,7 +201,7 @@ def test_complete_video_workflow():
 
     api.state.start("video", video_url)
     result = api.push_chunk([viral_video])
-    time.sleep(2.5)
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
 
     videos = api.list_videos({}, 1, 10)
     updated_video = next(
@@ -234,16 +242,62 @@ def test_complete_video_workflow():
     print("📹 Test Case 6: Author information persistence")
     print("-" * 80)
 
-    # Check that author was stored
-    author = api.db.find_author("author_complete_test")
-    assert author is not None, "Author not found in database"
-    assert author.nickname == "完整测试作者", "Author nickname mismatch"
-    assert author.follower_count == 100000, "Author follower count mismatch"
-    print(f"✓ Author stored: {author.nickname} (@{author.unique_id})")
-    print(f"✓ Followers: {author.follower_count:,}")
-    print(f"✓ Videos: {author.aweme_count}")
+    # Author fields come back joined onto the video rows
+    videos = api.list_videos({"author_id": "author_complete_test"}, 1, 10)
+    assert videos["total"] == 1, "Author not found in database"
+    video = videos["items"][0]
+    assert video["author_name"] == "完整测试作者", "Author nickname mismatch"
+    assert video["author_follower_count"] == 100000, "Author follower count mismatch"
+    print(f"✓ Author stored: {video['author_name']} (@{video['author_unique_id']})")
+    print(f"✓ Followers: {video['author_follower_count']:,}")
+    print(f"✓ Videos: {video['author_aweme_count']}")
     print("\n✅ Test Case 6 PASSED: Author data persisted correctly\n")
 
+    # Test case 7: Hashtags extracted at ingest time
+    print("📹 Test Case 7: Hashtag filter")
+    print("-" * 80)
+
+    tagged = api.list_videos({"tag": "#测试"}, 1, 10)
+    assert [v["aweme_id"] for v in tagged["items"]] == [complete_video["aweme_id"]], (
+        "Tag filter should match the video whose desc contains #测试"
+    )
+    assert api.list_videos({"tag": "不存在"}, 1, 10)["total"] == 0
+    print("✓ Videos filtered by hashtag")
+    print("\n✅ Test Case 7 PASSED: Hashtags indexed on ingest\n")
+
+    # Test case 8: Concurrent pushes share the single writer
+    print("📹 Test Case 8: Concurrent push_chunk calls")
+    print("-" * 80)
+
+    api.state.start("author", "author_complete_test")
+    batches = [
+        [{"aweme_id": f"72000000000001{n:02d}", "desc": f"Concurrent {n}"}]
+        for n in range(8)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(api.push_chunk, batches))
+    assert all(r["success"] and r["inserted"] == 1 for r in results), results
+    assert api.list_videos({}, 1, 50)["total"] == 10, "Concurrent pushes lost rows"
+    print(f"✓ {len(results)} concurrent chunks written, each reported its own count")
+    print("\n✅ Test Case 8 PASSED: Concurrent chunks coalesced by the writer\n")
+
+    # Test case 9: Keyset pagination matches offset pagination
+    print("📹 Test Case 9: Cursor pagination")
+    print("-" * 80)
+
+    expected = [v["aweme_id"] for v in api.list_videos({}, 1, 50)["items"]]
+    seen, cursor = [], None
+    while True:
+        result = api.list_videos({}, 1, 3, cursor)
+        seen.extend(v["aweme_id"] for v in result["items"])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected, "Cursor pages should walk the same order as offsets"
+    assert api.list_videos({}, 2, 3, include_total=False)["total"] is None
+    print(f"✓ {len(seen)} videos paged through with next_cursor")
+    print("\n✅ Test Case 9 PASSED: Keyset pagination\n")
+
     print("=" * 80)
     print("🎉 ALL INTEGRATION TESTS PASSED!")
     print("=" * 80)
@@ -0,0 +1,40 @@
+"""Tests for collector logging configuration."""
+
+import logging
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+import market_data_collector.utils.logging as collector_logging
+
+
+@pytest.fixture
+def log_settings(monkeypatch):
+    """Swap in a private copy of the settings and restore root handlers after."""
+    settings = collector_logging.settings.model_copy(deep=True)
+    monkeypatch.setattr(collector_logging, "settings", settings)
+    root_logger = logging.getLogger()
+    handlers, level = list(root_logger.handlers), root_logger.level
+    yield settings.logging
+    for handler in root_logger.handlers:
+        if handler not in handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+    root_logger.setLevel(level)
+
+
+def test_force_reconfigure_without_file_removes_file_handler(log_settings, tmp_path):
+    """Test configure_logging(force=True) with file=None turns file logging off."""
+    log_settings.file = str(tmp_path / "collector.log")
+    collector_logging.configure_logging(force=True)
+    assert any(
+        isinstance(handler, RotatingFileHandler)
+        for handler in logging.getLogger().handlers
+    )
+
+    log_settings.file = None
+    collector_logging.configure_logging(force=True)
+    assert not any(
+        isinstance(handler, RotatingFileHandler)
+        for handler in logging.getLogger().handlers
+    )
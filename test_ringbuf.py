@@ -0,0 +1,64 @@
+"""Unit tests for the shared-memory ring buffer."""
+
+import pytest
+
+from market_data_collector.ringbuf import SharedRingBuffer
+
+
+@pytest.fixture
+def ring():
+    """Create a small ring buffer and unlink it afterwards."""
+    buffer = SharedRingBuffer(slots=4, slot_size=64, create=True)
+    yield buffer
+    buffer.close()
+
+
+class TestPublishPoll:
+    """Test producer/consumer handoff."""
+
+    def test_roundtrip_preserves_order(self, ring):
+        """Test payloads are polled in publish order."""
+        assert ring.publish(b"first")
+        assert ring.publish(b"second")
+
+        assert bytes(ring.poll()) == b"first"
+        assert bytes(ring.poll()) == b"second"
+        assert ring.poll() is None
+
+    def test_full_ring_rejects_publish(self, ring):
+        """Test publish fails once every slot is unreleased."""
+        for i in range(ring.slots):
+            assert ring.publish(str(i).encode())
+
+        assert not ring.publish(b"overflow")
+
+        view = ring.poll()
+        assert bytes(view) == b"0"
+        del view
+        ring.release()
+        assert ring.publish(b"overflow")
+
+    def test_oversized_payload_rejected(self, ring):
+        """Test payloads larger than a slot are not written."""
+        assert not ring.publish(b"x" * (ring.max_payload + 1))
+        assert len(ring) == 0
+
+    def test_attach_by_name(self, ring):
+        """Test a second handle sees payloads published through the first."""
+        ring.publish(b"shared")
+
+        consumer = SharedRingBuffer(name=ring.name)
+        try:
+            view = consumer.poll()
+            assert bytes(view) == b"shared"
+            del view
+            consumer.release()
+            assert len(ring) == 0
+        finally:
+            consumer.close()
+
+    def test_attach_requires_name(self):
+        """Test attaching without a name is rejected."""
+        with pytest.raises(ValueError):
+            SharedRingBuffer()
+
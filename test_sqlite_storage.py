@@ -1,15 +1,35 @@
 """Unit tests for SQLite storage backend with retention policy."""
 
 import json
+import math
 import sqlite3
 import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from market_data_collector.storage.sqlite import RETENTION_DAYS, SQLiteStorage
+from market_data_collector.storage.sqlite import (
+    MEMORY_PATH,
+    RETENTION_DAYS,
+    SCHEMA_VERSION,
+    SQLiteStorage,
+)
+
+
+DAY_MS = 86_400_000
+
+
+def now_ms():
+    """Current time as integer milliseconds, the storage timestamp unit."""
+    return time.time_ns() // 1_000_000
+
+
+def days_ago_ms(days):
+    """Integer millisecond timestamp ``days`` days before now."""
+    return now_ms() - days * DAY_MS
 
 
 @pytest.fixture
@@ -20,9 +40,56 @@ def temp_storage_dir():
 
 
 @pytest.fixture
-def storage(temp_storage_dir):
-    """Create a SQLite storage instance for testing."""
-    return SQLiteStorage(temp_storage_dir, "BTCUSDT")
+def storage():
+    """Create an in-memory SQLite storage instance for testing."""
+    storage = SQLiteStorage(MEMORY_PATH, "BTCUSDT")
+    yield storage
+    storage.close()
+
+
+@pytest.fixture(scope="class")
+def seed_time():
+    """Base timestamp of the canonical dataset in ``populated_storage``."""
+    return now_ms()
+
+
+@pytest.fixture(scope="class")
+def populated_storage(seed_time):
+    """Create one in-memory storage per test class seeded with a canonical dataset.
+    
+    Holds five tickers one second apart (``last`` = 49000 + i), ten 1m candles
+    one minute apart (open = 49000 + i) and a single 5m candle, all starting at
+    ``seed_time``. Tests using it must only read; tests that write use the
+    function-scoped ``storage`` fixture.
+    """
+    storage = SQLiteStorage(MEMORY_PATH, "BTCUSDT")
+    
+    assert storage.insert_tickers([
+        {
+            "timestamp": seed_time + (i * 1000),
+            "symbol": "BTCUSDT",
+            "last": 49000.0 + i
+        }
+        for i in range(5)
+    ]) == 5
+    assert storage.insert_ohlcv("1m", [
+        [seed_time + (i * 60000), 49000.0 + i, 50000.0 + i, 48500.0 + i, 49500.0 + i, 100.0]
+        for i in range(10)
+    ]) == 10
+    assert storage.insert_ohlcv(
+        "5m", [[seed_time, 48500.0, 50500.0, 48000.0, 50000.0, 500.0]]
+    ) == 1
+    
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def file_storage(temp_storage_dir):
+    """Create a durable file-backed SQLite storage instance."""
+    storage = SQLiteStorage(temp_storage_dir, "BTCUSDT")
+    yield storage
+    storage.close()
 
 
 class TestInitialization:
@@ -47,14 +114,79 @@ class TestInitialization:
         storage = SQLiteStorage(temp_storage_dir, "BTC/USDT:USDT")
         assert storage.db_path.name == "BTC_USDT_USDT.db"
 
-    def test_enables_wal_mode(self, storage):
+    def test_in_memory_storage(self):
+        """Test that ':memory:' keeps data in one connection without files."""
+        storage = SQLiteStorage(MEMORY_PATH, "BTCUSDT")
+        try:
+            assert storage.db_path == Path(MEMORY_PATH)
+            assert not Path(MEMORY_PATH).exists()
+            now = now_ms()
+            storage.insert_ticker({"timestamp": now, "symbol": "BTCUSDT", "last": 1.0})
+            assert storage._get_connection() is storage._get_connection()
+            assert len(storage.query_ticker()) == 1
+        finally:
+            storage.close()
+
+    def test_reuses_connection(self, file_storage):
+        """Test that the connection is opened once and reopened after close."""
+        conn = file_storage._get_connection()
+        assert file_storage._get_connection() is conn
+        file_storage.close()
+        assert file_storage._get_connection() is not conn
+
+    def test_concurrent_read_write(self, file_storage):
+        """Test that queries run on their own connection during bulk inserts."""
+        base_time = now_ms()
+        errors = []
+        
+        def writer():
+            try:
+                for batch in range(20):
+                    file_storage.insert_tickers([
+                        {
+                            "timestamp": base_time + batch * 100 + i,
+                            "symbol": "BTCUSDT",
+                            "last": 49000.0
+                        }
+                        for i in range(100)
+                    ])
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        seen = []
+        while thread.is_alive():
+            seen.append(len(file_storage.query_ticker()))
+        thread.join()
+        
+        assert not errors
+        assert file_storage._get_reader() is not file_storage._get_connection()
+        assert seen == sorted(seen), "Reader saw uncommitted or rolled back rows"
+        assert len(file_storage.query_ticker()) == 2000
+
+    def test_enables_wal_mode(self, file_storage):
         """Test that WAL mode is enabled."""
-        with storage._get_connection() as conn:
+        with file_storage._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("PRAGMA journal_mode")
             result = cursor.fetchone()
             assert result[0].lower() == "wal"
 
+    def test_enables_mmap_and_page_cache(self, file_storage):
+        """Test that read-tuning pragmas are applied to the connection."""
+        with file_storage._get_connection() as conn:
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+
+    def test_non_durable_mode(self, temp_storage_dir):
+        """Test that durable=False skips WAL and fsync."""
+        storage = SQLiteStorage(temp_storage_dir, "BTCUSDT", durable=False)
+        with storage._get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
     def test_creates_all_tables(self, storage):
         """Test that all required tables are created."""
         with storage._get_connection() as conn:
@@ -100,14 +232,35 @@ class TestInitialization:
             for index in expected_indices:
                 assert index in indices, f"Index {index} not created"
 
+    def test_ohlcv_query_uses_timeframe_timestamp_index(self, storage):
+        """Test that OHLCV range queries are served by the composite index."""
+        with storage._get_connection() as conn:
+            plan = " ".join(
+                row["detail"] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM ohlcv WHERE timeframe = ? "
+                    "AND timestamp >= ? ORDER BY timestamp ASC",
+                    ("1m", 0)
+                )
+            )
+            assert "idx_ohlcv_timeframe_timestamp" in plan
+            assert "TEMP B-TREE" not in plan
+
+    def test_latest_first_indices_are_descending(self, storage):
+        """Test that indices for latest-first queries are stored DESC."""
+        with storage._get_connection() as conn:
+            for index in ("idx_ticker_timestamp", "idx_trades_timestamp"):
+                columns = conn.execute(f"PRAGMA index_xinfo({index})").fetchall()
+                assert columns[0]["name"] == "timestamp"
+                assert columns[0]["desc"] == 1
+
     def test_records_schema_version(self, storage):
         """Test that schema version is recorded."""
         with storage._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT version FROM _schema_version")
+            cursor.execute("SELECT MAX(version) FROM _schema_version")
             result = cursor.fetchone()
             assert result is not None
-            assert result[0] == 1
+            assert result[0] == SCHEMA_VERSION
 
 
 class TestTickerOperations:
@@ -115,7 +268,7 @@ class TestTickerOperations:
 
     def test_insert_and_query_ticker(self, storage):
         """Test inserting and querying ticker data."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         ticker_data = {
             "timestamp": now,
             "symbol": "BTCUSDT",
@@ -151,23 +304,12 @@ class TestTickerOperations:
         assert result["bid"] == 49500.0
         assert result["last"] == 49500.0
 
-    def test_query_ticker_with_time_range(self, storage):
+    def test_query_ticker_with_time_range(self, populated_storage, seed_time):
         """Test querying ticker data with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
-        
-        # Insert three tickers at different times
-        for i in range(3):
-            ticker = {
-                "timestamp": base_time + (i * 1000),
-                "symbol": "BTCUSDT",
-                "last": 49000.0 + i
-            }
-            storage.insert_ticker(ticker)
-        
         # Query with time range (inclusive on both ends)
-        results = storage.query_ticker(
-            start_time=base_time + 1000,
-            end_time=base_time + 2000
+        results = populated_storage.query_ticker(
+            start_time=seed_time + 1000,
+            end_time=seed_time + 2000
         )
         
         # Should return 2 results (at +1000 and +2000)
@@ -175,22 +317,32 @@ class TestTickerOperations:
         assert results[0]["last"] == 49002.0  # DESC order
         assert results[1]["last"] == 49001.0
 
-    def test_query_ticker_with_limit(self, storage):
+    def test_query_ticker_with_limit(self, populated_storage):
         """Test querying ticker data with limit."""
-        base_time = int(datetime.now().timestamp() * 1000)
+        results = populated_storage.query_ticker(limit=3)
+        assert len(results) == 3
+        assert results[0]["last"] == 49004.0  # Latest first
+
+    def test_query_ticker_columnar(self, populated_storage, seed_time):
+        """Test querying ticker data as columns."""
+        columns = populated_storage.query_ticker_columns(
+            start_time=seed_time + 1000,
+            end_time=seed_time + 2000
+        )
         
-        # Insert five tickers
-        for i in range(5):
-            ticker = {
-                "timestamp": base_time + (i * 1000),
-                "symbol": "BTCUSDT",
-                "last": 49000.0 + i
-            }
-            storage.insert_ticker(ticker)
+        assert list(columns["timestamp"]) == [seed_time + 2000, seed_time + 1000]
+        assert columns["symbol"] == ["BTCUSDT", "BTCUSDT"]
+        assert sum(columns["last"]) == 98003.0
+        # NULL fields come back as NaN
+        assert all(math.isnan(value) for value in columns["high"])
+
+    def test_query_ticker_columnar_empty(self, storage):
+        """Test that an empty range still returns every column."""
+        columns = storage.query_ticker_columns()
         
-        # Query with limit
-        results = storage.query_ticker(limit=3)
-        assert len(results) == 3
+        assert len(columns["timestamp"]) == 0
+        assert len(columns["last"]) == 0
+        assert columns["symbol"] == []
 
 
 class TestOrderbookOperations:
@@ -198,7 +350,7 @@ class TestOrderbookOperations:
 
     def test_insert_and_query_orderbook(self, storage):
         """Test inserting and querying orderbook data."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         orderbook_data = {
             "timestamp": now,
             "symbol": "BTCUSDT",
@@ -223,7 +375,7 @@ class TestOrderbookOperations:
 
     def test_query_orderbook_with_time_range(self, storage):
         """Test querying orderbook with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
+        base_time = now_ms()
         
         for i in range(3):
             orderbook = {
@@ -247,7 +399,7 @@ class TestTradesOperations:
 
     def test_insert_and_query_trades(self, storage):
         """Test bulk inserting and querying trades."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         trades_data = [
             {
                 "id": "trade1",
@@ -291,7 +443,7 @@ class TestTradesOperations:
 
     def test_insert_duplicate_trades_ignored(self, storage):
         """Test that duplicate trades are ignored."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         trade = {
             "id": "trade1",
             "timestamp": now,
@@ -310,9 +462,32 @@ class TestTradesOperations:
         results = storage.query_trades()
         assert len(results) == 1
 
+    def test_insert_trades_counts_only_new_ids(self, storage):
+        """Test that a mixed batch reports only the trades actually inserted."""
+        now = now_ms()
+        
+        def trade(trade_id):
+            return {
+                "id": trade_id,
+                "timestamp": now,
+                "symbol": "BTCUSDT",
+                "side": "sell",
+                "price": 49500.0,
+                "amount": 0.5
+            }
+        
+        assert storage.insert_trades([trade("a"), trade("b")]) == 2
+        
+        # "b" is already stored and "c" repeats within the batch
+        inserted = storage.insert_trades([trade("b"), trade("c"), trade("c")])
+        assert inserted == 1
+        
+        results = storage.query_trades()
+        assert sorted(r["id"] for r in results) == ["a", "b", "c"]
+
     def test_query_trades_with_time_range(self, storage):
         """Test querying trades with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
+        base_time = now_ms()
         
         trades = [
             {
@@ -341,7 +516,7 @@ class TestOHLCVOperations:
 
     def test_insert_and_query_ohlcv(self, storage):
         """Test bulk inserting and querying OHLCV data."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         ohlcv_data = [
             [now, 49000.0, 50000.0, 48500.0, 49500.0, 100.0],
             [now + 60000, 49500.0, 50500.0, 49000.0, 50000.0, 120.0],
@@ -362,27 +537,19 @@ class TestOHLCVOperations:
         assert results[0][4] == 49500.0  # close
         assert results[0][5] == 100.0    # volume
 
-    def test_insert_ohlcv_multiple_timeframes(self, storage):
-        """Test inserting OHLCV data for multiple timeframes."""
-        now = int(datetime.now().timestamp() * 1000)
-        
-        candles_1m = [[now, 49000.0, 50000.0, 48500.0, 49500.0, 100.0]]
-        candles_5m = [[now, 48500.0, 50500.0, 48000.0, 50000.0, 500.0]]
-        
-        storage.insert_ohlcv("1m", candles_1m)
-        storage.insert_ohlcv("5m", candles_5m)
+    def test_insert_ohlcv_multiple_timeframes(self, populated_storage):
+        """Test that OHLCV data is kept apart per timeframe."""
+        results_1m = populated_storage.query_ohlcv("1m")
+        results_5m = populated_storage.query_ohlcv("5m")
         
-        results_1m = storage.query_ohlcv("1m")
-        results_5m = storage.query_ohlcv("5m")
-        
-        assert len(results_1m) == 1
+        assert len(results_1m) == 10
         assert len(results_5m) == 1
         assert results_1m[0][5] == 100.0  # 1m volume
         assert results_5m[0][5] == 500.0  # 5m volume
 
     def test_insert_ohlcv_replace_existing(self, storage):
         """Test that duplicate OHLCV candles are replaced."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         
         candle1 = [[now, 49000.0, 50000.0, 48500.0, 49500.0, 100.0]]
         candle2 = [[now, 49100.0, 50100.0, 48600.0, 49600.0, 105.0]]
@@ -394,21 +561,12 @@ class TestOHLCVOperations:
         assert len(results) == 1
         assert results[0][1] == 49100.0  # Updated open
 
-    def test_query_ohlcv_with_time_range(self, storage):
+    def test_query_ohlcv_with_time_range(self, populated_storage, seed_time):
         """Test querying OHLCV with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
-        
-        candles = [
-            [base_time + (i * 60000), 49000.0 + i, 50000.0 + i, 48500.0 + i, 49500.0 + i, 100.0]
-            for i in range(10)
-        ]
-        
-        storage.insert_ohlcv("1m", candles)
-        
-        results = storage.query_ohlcv(
+        results = populated_storage.query_ohlcv(
             "1m",
-            start_time=base_time + 180000,
-            end_time=base_time + 300000
+            start_time=seed_time + 180000,
+            end_time=seed_time + 300000
         )
         
         assert len(results) == 3
@@ -419,7 +577,7 @@ class TestFundingRateOperations:
 
     def test_insert_and_query_funding_rate(self, storage):
         """Test inserting and querying funding rate data."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         funding_data = {
             "timestamp": now,
             "symbol": "BTCUSDT",
@@ -440,7 +598,7 @@ class TestFundingRateOperations:
 
     def test_insert_funding_rate_replace_existing(self, storage):
         """Test that duplicate funding rates are replaced."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         
         funding1 = {
             "timestamp": now,
@@ -463,7 +621,7 @@ class TestFundingRateOperations:
 
     def test_query_funding_rate_with_time_range(self, storage):
         """Test querying funding rate with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
+        base_time = now_ms()
         
         for i in range(3):
             funding = {
@@ -487,7 +645,7 @@ class TestMarkPriceOperations:
 
     def test_insert_and_query_mark_price(self, storage):
         """Test inserting and querying mark price data."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         mark_price_data = {
             "timestamp": now,
             "symbol": "BTCUSDT",
@@ -509,7 +667,7 @@ class TestMarkPriceOperations:
 
     def test_insert_mark_price_replace_existing(self, storage):
         """Test that duplicate mark prices are replaced."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         
         mark_price1 = {
             "timestamp": now,
@@ -532,7 +690,7 @@ class TestMarkPriceOperations:
 
     def test_query_mark_price_with_time_range(self, storage):
         """Test querying mark price with time range."""
-        base_time = int(datetime.now().timestamp() * 1000)
+        base_time = now_ms()
         
         for i in range(5):
             mark_price = {
@@ -553,151 +711,93 @@ class TestMarkPriceOperations:
 class TestRetentionPolicy:
     """Test retention policy and automatic cleanup of old records."""
 
-    def test_cleanup_old_ticker_records(self, storage):
-        """Test that old ticker records are deleted."""
-        now = int(datetime.now().timestamp() * 1000)
-        old_time = int((datetime.now() - timedelta(days=RETENTION_DAYS + 1)).timestamp() * 1000)
-        
-        # Insert old ticker directly without triggering cleanup
-        with storage._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO ticker (timestamp, symbol, last)
-                VALUES (?, ?, ?)
-            """, (old_time, "BTCUSDT", 45000.0))
-            conn.commit()
-        
-        # Verify old ticker exists
-        all_tickers = storage.query_ticker()
-        assert len(all_tickers) == 1
-        
-        # Insert new ticker (triggers cleanup)
-        new_ticker = {
-            "timestamp": now,
-            "symbol": "BTCUSDT",
-            "last": 49500.0
-        }
-        storage.insert_ticker(new_ticker)
-        
-        # Old ticker should be deleted
-        recent_tickers = storage.query_ticker()
-        assert len(recent_tickers) == 1
-        assert recent_tickers[0]["timestamp"] == now
-
-    def test_cleanup_old_trades_records(self, storage):
-        """Test that old trade records are deleted."""
-        now = int(datetime.now().timestamp() * 1000)
-        old_time = int((datetime.now() - timedelta(days=RETENTION_DAYS + 1)).timestamp() * 1000)
-        
-        # Insert old trade directly without triggering cleanup
-        with storage._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO trades (id, timestamp, symbol, side, price, amount)
+    @pytest.mark.parametrize(
+        "old_row_sql, old_row_values, insert_new, query_timestamps",
+        [
+            pytest.param(
+                "INSERT INTO ticker (timestamp, symbol, last) VALUES (?, ?, ?)",
+                ("BTCUSDT", 45000.0),
+                lambda storage, now: storage.insert_ticker(
+                    {"timestamp": now, "symbol": "BTCUSDT", "last": 49500.0}
+                ),
+                lambda storage: [r["timestamp"] for r in storage.query_ticker()],
+                id="ticker",
+            ),
+            pytest.param(
+                """
+                INSERT INTO trades (timestamp, id, symbol, side, price, amount)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, ("old_trade", old_time, "BTCUSDT", "buy", 45000.0, 0.1))
-            conn.commit()
-        
-        # Insert new trades (triggers cleanup)
-        new_trades = [
-            {
-                "id": "new_trade",
-                "timestamp": now,
-                "symbol": "BTCUSDT",
-                "side": "sell",
-                "price": 49500.0,
-                "amount": 0.1
-            }
-        ]
-        storage.insert_trades(new_trades)
-        
-        # Only new trade should remain
-        results = storage.query_trades()
-        assert len(results) == 1
-        assert results[0]["id"] == "new_trade"
-
-    def test_cleanup_old_ohlcv_records(self, storage):
-        """Test that old OHLCV records are deleted."""
-        now = int(datetime.now().timestamp() * 1000)
-        old_time = int((datetime.now() - timedelta(days=RETENTION_DAYS + 1)).timestamp() * 1000)
-        
-        # Insert old candle directly without triggering cleanup
-        with storage._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+                """,
+                ("old_trade", "BTCUSDT", "buy", 45000.0, 0.1),
+                lambda storage, now: storage.insert_trades([{
+                    "id": "new_trade",
+                    "timestamp": now,
+                    "symbol": "BTCUSDT",
+                    "side": "sell",
+                    "price": 49500.0,
+                    "amount": 0.1
+                }]),
+                lambda storage: [r["timestamp"] for r in storage.query_trades()],
+                id="trades",
+            ),
+            pytest.param(
+                """
                 INSERT INTO ohlcv (timestamp, symbol, timeframe, open, high, low, close, volume)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (old_time, "BTCUSDT", "1m", 45000.0, 46000.0, 44000.0, 45500.0, 100.0))
-            conn.commit()
-        
-        # Insert new candles (triggers cleanup)
-        new_candles = [[now, 49000.0, 50000.0, 48500.0, 49500.0, 150.0]]
-        storage.insert_ohlcv("1m", new_candles)
-        
-        # Only new candles should remain
-        results = storage.query_ohlcv("1m")
-        assert len(results) == 1
-        assert results[0][0] == now
-
-    def test_cleanup_old_funding_rate_records(self, storage):
-        """Test that old funding rate records are deleted."""
-        now = int(datetime.now().timestamp() * 1000)
-        old_time = int((datetime.now() - timedelta(days=RETENTION_DAYS + 1)).timestamp() * 1000)
-        
-        # Insert old funding rate directly without triggering cleanup
+                """,
+                ("BTCUSDT", "1m", 45000.0, 46000.0, 44000.0, 45500.0, 100.0),
+                lambda storage, now: storage.insert_ohlcv(
+                    "1m", [[now, 49000.0, 50000.0, 48500.0, 49500.0, 150.0]]
+                ),
+                lambda storage: [r[0] for r in storage.query_ohlcv("1m")],
+                id="ohlcv",
+            ),
+            pytest.param(
+                "INSERT INTO funding_rate (timestamp, symbol, funding_rate) VALUES (?, ?, ?)",
+                ("BTCUSDT", 0.0001),
+                lambda storage, now: storage.insert_funding_rate(
+                    {"timestamp": now, "symbol": "BTCUSDT", "fundingRate": 0.0002}
+                ),
+                lambda storage: [r["timestamp"] for r in storage.query_funding_rate()],
+                id="funding_rate",
+            ),
+            pytest.param(
+                "INSERT INTO mark_price (timestamp, symbol, mark_price) VALUES (?, ?, ?)",
+                ("BTCUSDT", 45000.0),
+                lambda storage, now: storage.insert_mark_price(
+                    {"timestamp": now, "symbol": "BTCUSDT", "markPrice": 49500.0}
+                ),
+                lambda storage: [r["timestamp"] for r in storage.query_mark_price()],
+                id="mark_price",
+            ),
+        ],
+    )
+    def test_cleanup_old_records(
+        self, storage, old_row_sql, old_row_values, insert_new, query_timestamps
+    ):
+        """Test that records older than the retention window are deleted."""
+        now = now_ms()
+        old_time = days_ago_ms(RETENTION_DAYS + 1)
+        
+        # Insert old record directly without triggering cleanup
         with storage._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO funding_rate (timestamp, symbol, funding_rate)
-                VALUES (?, ?, ?)
-            """, (old_time, "BTCUSDT", 0.0001))
+            conn.execute(old_row_sql, (old_time, *old_row_values))
             conn.commit()
         
-        # Insert new funding rate (triggers cleanup)
-        new_funding = {
-            "timestamp": now,
-            "symbol": "BTCUSDT",
-            "fundingRate": 0.0002
-        }
-        storage.insert_funding_rate(new_funding)
-        
-        # Only new funding rate should remain
-        results = storage.query_funding_rate()
-        assert len(results) == 1
-        assert results[0]["timestamp"] == now
-
-    def test_cleanup_old_mark_price_records(self, storage):
-        """Test that old mark price records are deleted."""
-        now = int(datetime.now().timestamp() * 1000)
-        old_time = int((datetime.now() - timedelta(days=RETENTION_DAYS + 1)).timestamp() * 1000)
+        # Verify old record exists
+        assert query_timestamps(storage) == [old_time]
         
-        # Insert old mark price directly without triggering cleanup
-        with storage._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO mark_price (timestamp, symbol, mark_price)
-                VALUES (?, ?, ?)
-            """, (old_time, "BTCUSDT", 45000.0))
-            conn.commit()
+        # Insert new record (triggers cleanup)
+        insert_new(storage, now)
         
-        # Insert new mark price (triggers cleanup)
-        new_mark_price = {
-            "timestamp": now,
-            "symbol": "BTCUSDT",
-            "markPrice": 49500.0
-        }
-        storage.insert_mark_price(new_mark_price)
-        
-        # Only new mark price should remain
-        results = storage.query_mark_price()
-        assert len(results) == 1
-        assert results[0]["timestamp"] == now
+        # Only the new record should remain
+        assert query_timestamps(storage) == [now]
 
     def test_cleanup_preserves_recent_records(self, storage):
         """Test that recent records are preserved during cleanup."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         recent_times = [
-            int((datetime.now() - timedelta(days=i)).timestamp() * 1000)
+            now - i * DAY_MS
             for i in range(RETENTION_DAYS - 1)
         ]
         
@@ -722,25 +822,83 @@ class TestRetentionPolicy:
         results = storage.query_ticker()
         assert len(results) == len(recent_times) + 1
 
+    def test_cleanup_throttled_between_inserts(self, storage):
+        """Test that inserts sweep at most once per cleanup interval."""
+        now = now_ms()
+        old_time = days_ago_ms(RETENTION_DAYS + 1)
+        
+        # First insert sweeps and starts the interval
+        storage.insert_ticker({"timestamp": now, "symbol": "BTCUSDT", "last": 49500.0})
+        
+        with storage._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO ticker (timestamp, symbol, last)
+                VALUES (?, ?, ?)
+            """, (old_time, "BTCUSDT", 45000.0))
+            conn.commit()
+        
+        # Within the interval another insert leaves the old record alone
+        storage.insert_ticker({"timestamp": now + 1, "symbol": "BTCUSDT", "last": 49501.0})
+        assert len(storage.query_ticker()) == 3
+        
+        # An explicit sweep removes it regardless of the interval
+        storage.cleanup_old_records()
+        assert all(t["timestamp"] >= now for t in storage.query_ticker())
+
+
+    def test_explicit_cleanup_truncates_wal(self, file_storage):
+        """Test that an explicit sweep checkpoints and truncates the WAL."""
+        old_time = days_ago_ms(RETENTION_DAYS + 1)
+        with file_storage._get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO ticker (timestamp, symbol, last) VALUES (?, ?, ?)",
+                [(old_time + i, "BTCUSDT", 45000.0) for i in range(5000)]
+            )
+            conn.commit()
+        
+        file_storage.cleanup_old_records()
+        
+        assert file_storage.query_ticker() == []
+        wal_path = Path(f"{file_storage.db_path}-wal")
+        assert wal_path.stat().st_size == 0
+
 
 class TestPerSymbolIsolation:
     """Test that each symbol gets its own database."""
 
     def test_different_symbols_different_databases(self, temp_storage_dir):
         """Test that different symbols use different database files."""
-        storage_btc = SQLiteStorage(temp_storage_dir, "BTCUSDT")
-        storage_eth = SQLiteStorage(temp_storage_dir, "ETHUSDT")
+        storage_btc = SQLiteStorage(temp_storage_dir, "BTCUSDT", durable=False)
+        storage_eth = SQLiteStorage(temp_storage_dir, "ETHUSDT", durable=False)
         
         assert storage_btc.db_path != storage_eth.db_path
         assert storage_btc.db_path.exists()
         assert storage_eth.db_path.exists()
 
+    @pytest.mark.parametrize(
+        "symbol", ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BTC/USDT:USDT"]
+    )
+    def test_symbol_round_trip(self, temp_storage_dir, symbol):
+        """Test that each symbol's database stores and returns its own ticker.
+        
+        Every case gets its own temporary directory, so the cases are
+        independent and spread across workers under ``pytest -n auto``.
+        """
+        storage = SQLiteStorage(temp_storage_dir, symbol, durable=False)
+        try:
+            storage.insert_ticker({"timestamp": now_ms(), "symbol": symbol, "last": 1.0})
+            results = storage.query_ticker()
+            assert [r["symbol"] for r in results] == [symbol]
+            assert storage.db_path.parent == temp_storage_dir
+        finally:
+            storage.close()
+
     def test_symbol_data_isolation(self, temp_storage_dir):
         """Test that data is isolated between symbols."""
-        storage_btc = SQLiteStorage(temp_storage_dir, "BTCUSDT")
-        storage_eth = SQLiteStorage(temp_storage_dir, "ETHUSDT")
+        storage_btc = SQLiteStorage(temp_storage_dir, "BTCUSDT", durable=False)
+        storage_eth = SQLiteStorage(temp_storage_dir, "ETHUSDT", durable=False)
         
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         
         # Insert ticker for BTC
         btc_ticker = {
@@ -776,6 +934,11 @@ class TestEdgeCases:
         inserted = storage.insert_trades([])
         assert inserted == 0
 
+    def test_insert_empty_tickers_list(self, storage):
+        """Test inserting empty tickers list."""
+        inserted = storage.insert_tickers([])
+        assert inserted == 0
+
     def test_insert_empty_ohlcv_list(self, storage):
         """Test inserting empty OHLCV list."""
         inserted = storage.insert_ohlcv("1m", [])
@@ -788,7 +951,7 @@ class TestEdgeCases:
 
     def test_query_with_no_matching_time_range(self, storage):
         """Test querying with time range that has no matches."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         
         ticker = {
             "timestamp": now,
@@ -807,7 +970,7 @@ class TestEdgeCases:
 
     def test_ticker_with_null_fields(self, storage):
         """Test inserting ticker with null/missing fields."""
-        now = int(datetime.now().timestamp() * 1000)
+        now = now_ms()
         ticker = {
             "timestamp": now,
             "symbol": "BTCUSDT"
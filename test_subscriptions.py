@@ -6,99 +6,73 @@ Tests subscription manager with mock exchange data.
 
 import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from market_data_collector import SubscriptionManager
+from fakes import FakeExchange
+from market_data_collector import Channel, ChannelQueue, Envelope, SubscriptionManager
 from market_data_collector.config import MarketDataSettings
-from market_data_collector.exchange import ExchangeAdapter
+from market_data_collector.ringbuf import SharedRingBuffer
+from market_data_collector.utils.serialization import loads
+
+# One event loop for the whole module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# Validated once at import; fixtures hand out copies
+SETTINGS_DATA = {
+    "exchange": {
+        "name": "Bybit",
+        "market_type": "usdt_perpetual",
+        "base_rest_url": "https://api.bybit.com",
+        "base_websocket_url": "wss://stream.bybit.com/v5/public/linear",
+    },
+    "symbols": ["BTC/USDT:USDT", "ETH/USDT:USDT"],
+    "intervals": {
+        "klines": "1m,5m",
+        "orderbook_snapshot": "1m",
+        "trades": "realtime",
+        "funding": "8h",
+        "mark_price": "1m",
+    },
+    "orderbook": {"depth": 200},
+    "storage": {
+        "backend": "filesystem",
+        "path": "data/test",
+        "compression": "gzip",
+    },
+    "logging": {
+        "level": "ERROR",
+        "file": None,
+        "format": "%(message)s",
+    },
+    "runtime": {
+        "dry_run": False,
+        "enable_metrics": True,
+        "use_proxy": False,
+    },
+}
+
+BASE_SETTINGS = MarketDataSettings.model_validate(SETTINGS_DATA)
 
 
 @pytest.fixture
 def mock_settings():
     """Create mock settings for testing."""
-    return MarketDataSettings.model_validate({
-        "exchange": {
-            "name": "Bybit",
-            "market_type": "usdt_perpetual",
-            "base_rest_url": "https://api.bybit.com",
-            "base_websocket_url": "wss://stream.bybit.com/v5/public/linear",
-        },
-        "symbols": ["BTC/USDT:USDT", "ETH/USDT:USDT"],
-        "intervals": {
-            "klines": "1m,5m",
-            "orderbook_snapshot": "1m",
-            "trades": "realtime",
-            "funding": "8h",
-            "mark_price": "1m",
-        },
-        "orderbook": {"depth": 200},
-        "storage": {
-            "backend": "filesystem",
-            "path": "data/test",
-            "compression": "gzip",
-        },
-        "logging": {
-            "level": "INFO",
-            "file": "logs/test.log",
-            "format": "%(message)s",
-        },
-        "runtime": {
-            "dry_run": False,
-            "enable_metrics": True,
-            "use_proxy": False,
-        },
-    })
+    return BASE_SETTINGS.model_copy(deep=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_exchange():
-    """Create mock exchange adapter."""
-    exchange = MagicMock(spec=ExchangeAdapter)
-    
-    # Mock watch methods
-    exchange.watch_ticker = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "timestamp": 1698765432000,
-        "last": 35000.0,
-        "bid": 34999.5,
-        "ask": 35000.5,
-    })
-    
-    exchange.watch_order_book = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "timestamp": 1698765432000,
-        "bids": [[34999.5, 1.5], [34999.0, 2.3]],
-        "asks": [[35000.5, 1.8], [35001.0, 2.1]],
-    })
-    
-    exchange.watch_trades = AsyncMock(return_value=[
-        {
-            "id": "12345",
-            "timestamp": 1698765432000,
-            "symbol": "BTC/USDT:USDT",
-            "side": "buy",
-            "price": 35000.0,
-            "amount": 0.5,
-        }
-    ])
-    
-    exchange.watch_ohlcv = AsyncMock(return_value=[
-        [1698765420000, 34990.0, 35010.0, 34980.0, 35000.0, 123.45]
-    ])
-    
-    exchange.fetch_funding_rate = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "fundingRate": 0.0001,
-        "fundingTimestamp": 1698768000000,
-        "timestamp": 1698765432000,
-    })
+    """Create a fake exchange adapter.
     
-    exchange.derive_mark_price = AsyncMock(return_value=35005.5)
-    
-    return exchange
+    A FakeExchange rather than a ``MagicMock(spec=ExchangeAdapter)`` with
+    ``AsyncMock`` attributes, so the subscription loops spend their time in
+    the code under test instead of in ``unittest.mock`` call dispatch.
+    Only its ticker call counter is mutable, so one instance serves the
+    whole module.
+    """
+    return FakeExchange()
 
 
-@pytest.mark.asyncio
 async def test_subscription_manager_init(mock_exchange, mock_settings):
     """Test subscription manager initialization."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
@@ -110,7 +84,6 @@ async def test_subscription_manager_init(mock_exchange, mock_settings):
     assert manager.ticker_queue.qsize() == 0
 
 
-@pytest.mark.asyncio
 async def test_subscription_manager_start_stop(mock_exchange, mock_settings):
     """Test starting and stopping subscription manager."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
@@ -129,7 +102,6 @@ async def test_subscription_manager_start_stop(mock_exchange, mock_settings):
     assert manager.task_count == 0
 
 
-@pytest.mark.asyncio
 async def test_parse_interval(mock_exchange, mock_settings):
     """Test interval parsing."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
@@ -139,9 +111,9 @@ async def test_parse_interval(mock_exchange, mock_settings):
     assert manager._parse_interval("5m") == 300.0
     assert manager._parse_interval("1h") == 3600.0
     assert manager._parse_interval("8h") == 28800.0
+    assert manager._parse_interval("2h") == 7200.0  # not in the lookup table
 
 
-@pytest.mark.asyncio
 async def test_parse_ohlcv_timeframes(mock_exchange, mock_settings):
     """Test OHLCV timeframe parsing."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
@@ -152,137 +124,217 @@ async def test_parse_ohlcv_timeframes(mock_exchange, mock_settings):
     assert len(timeframes) == 2
 
 
-@pytest.mark.asyncio
 async def test_ticker_subscription(mock_exchange, mock_settings):
     """Test ticker subscription receives data."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
-    
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.ticker_queue.qsize() > 0
-    
-    # Get data
-    data = await manager.ticker_queue.get()
-    assert data["type"] == "ticker"
-    assert data["symbol"] in mock_settings.symbols
-    assert "last" in data["data"]
-    
-    await manager.stop()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.ticker_queue.get(), timeout=1.0)
+        assert isinstance(data, Envelope)
+        assert data.type is Channel.TICKER
+        assert data["type"] == "ticker"
+        assert data["symbol"] in mock_settings.symbols
+        assert "last" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_orderbook_subscription(mock_exchange, mock_settings):
     """Test orderbook subscription receives data."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
-    
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.orderbook_queue.qsize() > 0
-    
-    # Get data
-    data = await manager.orderbook_queue.get()
-    assert data["type"] == "orderbook"
-    assert "bids" in data["data"]
-    assert "asks" in data["data"]
-    
-    await manager.stop()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.orderbook_queue.get(), timeout=1.0)
+        assert data["type"] == "orderbook"
+        assert "bids" in data["data"]
+        assert "asks" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_trades_subscription(mock_exchange, mock_settings):
     """Test trades subscription receives data."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
-    
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.trades_queue.qsize() > 0
-    
-    # Get data
-    data = await manager.trades_queue.get()
-    assert data["type"] == "trade"
-    assert "price" in data["data"]
-    assert "amount" in data["data"]
-    
-    await manager.stop()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.trades_queue.get(), timeout=1.0)
+        assert data["type"] == "trade"
+        assert "price" in data["data"]
+        assert "amount" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_ohlcv_subscription(mock_exchange, mock_settings):
     """Test OHLCV subscription receives data."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.ohlcv_queue.get(), timeout=1.0)
+        assert data["type"] == "ohlcv"
+        assert data["timeframe"] in ["1m", "5m"]
+        assert len(data["data"]) == 6  # [timestamp, O, H, L, C, V]
+
+
+async def test_envelope_get_matches_dict_items():
+    """Test Envelope.get treats an unset timeframe as a missing key."""
+    ticker = Envelope(Channel.TICKER, "BTC", {"last": 1.0})
+    assert "timeframe" not in ticker
+    assert ticker.get("timeframe", "1m") == "1m"
+    assert ticker.get("missing", "x") == "x"
+    assert ticker.get("symbol") == "BTC"
+    
+    candle = Envelope(Channel.OHLCV, "BTC", [], "5m")
+    assert candle.get("timeframe", "1m") == "5m"
+
+
+async def test_full_queue_drops_oldest(mock_exchange, mock_settings):
+    """Test enqueueing into a full queue evicts the oldest item."""
+    manager = SubscriptionManager(mock_exchange, mock_settings)
+    queue = manager.funding_queue
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
+    for i in range(queue.maxsize + 1):
+        manager._enqueue(queue, "funding", Envelope(Channel.FUNDING_RATE, "BTC", i))
     
-    # Check if data was queued
-    assert manager.ohlcv_queue.qsize() > 0
+    assert queue.full()
+    assert (await queue.get())["data"] == 1
+    assert manager.get_queue_sizes()["funding_dropped"] == 1
+
+
+async def test_channel_queue_get_waits_for_put():
+    """Test a parked consumer is woken by the next put."""
+    queue = ChannelQueue(maxsize=2)
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
     
-    # Get data
-    data = await manager.ohlcv_queue.get()
-    assert data["type"] == "ohlcv"
-    assert data["timeframe"] in ["1m", "5m"]
-    assert len(data["data"]) == 6  # [timestamp, O, H, L, C, V]
+    queue.put_nowait("a")
+    assert await asyncio.wait_for(getter, timeout=1.0) == "a"
     
-    await manager.stop()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
 
 
-@pytest.mark.asyncio
-async def test_funding_subscription(mock_exchange, mock_settings):
-    """Test funding rate subscription receives data."""
-    manager = SubscriptionManager(mock_exchange, mock_settings)
+async def test_batch_put_wakes_one_getter_per_item():
+    """Test a batch wakes as many parked consumers as it has items."""
+    queue = ChannelQueue(maxsize=4)
+    getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+    await asyncio.sleep(0)
     
-    await manager.start()
+    queue.put_many(["a", "b"])
+    done, pending = await asyncio.wait(getters, timeout=0.1)
+    assert sorted(task.result() for task in done) == ["a", "b"]
+    assert len(pending) == 1
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
+    queue.put_nowait("c")
+    assert await asyncio.wait_for(pending.pop(), timeout=1.0) == "c"
+
+
+async def test_batch_enqueue_drops_oldest(mock_exchange, mock_settings):
+    """Test a batch larger than the free space evicts the oldest items."""
+    manager = SubscriptionManager(mock_exchange, mock_settings)
+    queue = manager.funding_queue
     
-    # Check if data was queued
-    assert manager.funding_queue.qsize() > 0
+    manager._enqueue_many(queue, "funding", [
+        Envelope(Channel.FUNDING_RATE, "BTC", i) for i in range(queue.maxsize + 3)
+    ])
     
-    # Get data
-    data = await manager.funding_queue.get()
-    assert data["type"] == "funding_rate"
-    assert "fundingRate" in data["data"]
+    assert queue.qsize() == queue.maxsize
+    assert queue.get_nowait()["data"] == 3
+    assert manager.get_queue_sizes()["funding_dropped"] == 3
+
+
+async def test_blocking_queue_waits_for_room():
+    """Test a blocking queue keeps every item and holds the producer when full."""
+    queue = ChannelQueue(maxsize=2, block=True)
+    queue.put_many(["a", "b"])
+    assert queue.full()
+    
+    waiter = asyncio.create_task(queue.wait_not_full())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    
+    assert await queue.get() == "a"
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert queue.put_many(["c", "d"]) == 0
+    assert [queue.get_nowait() for _ in range(3)] == ["b", "c", "d"]
+
+
+async def test_serialized_queue_items(mock_exchange, mock_settings):
+    """Test queue items are JSON bytes when serialization is enabled."""
+    manager = SubscriptionManager(mock_exchange, mock_settings, serialize=True)
+    
+    async with manager:
+        await asyncio.sleep(0.2)
+        
+        payload = await manager.ticker_queue.get()
+        assert isinstance(payload, bytes)
+        
+        data = loads(payload)
+        assert data["type"] == "ticker"
+        assert data["data"]["last"] == 35000.0
+
+
+async def test_ring_buffer_handoff(mock_exchange, mock_settings):
+    """Test items are published to a shared ring instead of the queues."""
+    ring = SharedRingBuffer(slots=64, slot_size=4096, create=True)
+    try:
+        manager = SubscriptionManager(mock_exchange, mock_settings, ring=ring)
+        
+        async with manager:
+            await asyncio.sleep(0.1)
+        
+        assert manager.ticker_queue.qsize() == 0
+        assert len(ring) > 0
+        
+        view = ring.poll()
+        assert "type" in loads(bytes(view))
+        del view
+        ring.release()
+    finally:
+        ring.close()
+
+
+async def test_funding_subscription(mock_exchange, mock_settings):
+    """Test funding rate subscription receives data."""
+    manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.stop()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.funding_queue.get(), timeout=1.0)
+        assert data["type"] == "funding_rate"
+        assert "fundingRate" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_mark_price_subscription(mock_exchange, mock_settings):
     """Test mark price subscription receives data."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
+    async with manager:
+        # Await the first item rather than sleeping a fixed time
+        data = await asyncio.wait_for(manager.mark_price_queue.get(), timeout=1.0)
+        assert data["type"] == "mark_price"
+        assert "mark_price" in data["data"]
+
+
+async def test_polls_share_one_timer(mock_exchange, mock_settings):
+    """Test pending polls fire in deadline order from a single timer."""
+    manager = SubscriptionManager(mock_exchange, mock_settings)
+    manager._running = True
+    fired = []
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
+    async def poll(symbol):
+        fired.append(symbol)
     
-    # Check if data was queued
-    assert manager.mark_price_queue.qsize() > 0
+    manager._schedule_poll("poll", "late", 0.05, poll)
+    manager._schedule_poll("poll", "early", 0.01, poll)
+    assert manager.task_count == 2
     
-    # Get data
-    data = await manager.mark_queue.get()
-    assert data["type"] == "mark_price"
-    assert "mark_price" in data["data"]
+    await asyncio.sleep(0.1)
     
-    await manager.stop()
+    assert fired == ["early", "late"]
+    assert manager._poll_timer is None
+    assert manager.task_count == 0
 
 
-@pytest.mark.asyncio
 async def test_get_queue_sizes(mock_exchange, mock_settings):
     """Test getting queue sizes."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
@@ -297,48 +349,50 @@ async def test_get_queue_sizes(mock_exchange, mock_settings):
     assert all(size >= 0 for size in sizes.values())
 
 
-@pytest.mark.asyncio
 async def test_multiple_symbols(mock_exchange, mock_settings):
     """Test subscriptions for multiple symbols."""
     manager = SubscriptionManager(mock_exchange, mock_settings)
     
-    await manager.start()
-    
-    # Should have tasks for both BTC and ETH
-    assert manager.task_count >= 2 * 6  # 2 symbols × 6 data types (min)
-    
-    await manager.stop()
+    async with manager:
+        # Should have tasks for both BTC and ETH
+        assert manager.task_count >= 2 * 6  # 2 symbols × 6 data types (min)
 
 
-@pytest.mark.asyncio
-async def test_error_recovery(mock_exchange, mock_settings):
-    """Test error recovery in subscriptions."""
-    # Make watch_ticker fail first time, then succeed
-    call_count = 0
-    
-    async def failing_ticker(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            raise Exception("Simulated error")
-        return {
-            "symbol": "BTC/USDT:USDT",
-            "timestamp": 1698765432000,
-            "last": 35000.0,
-        }
-    
-    mock_exchange.watch_ticker = AsyncMock(side_effect=failing_ticker)
-    
+async def test_unconfigured_channels_not_started(mock_exchange, mock_settings):
+    """Test absent or empty intervals start no task for their channel."""
+    mock_settings.intervals["funding"] = ""
+    del mock_settings.intervals["mark_price"]
     manager = SubscriptionManager(mock_exchange, mock_settings)
-    await manager.start()
-    
-    # Wait for retry
-    await asyncio.sleep(6)  # Backoff is 5 seconds
-    
-    # Should have recovered
-    assert manager.ticker_queue.qsize() > 0
     
-    await manager.stop()
+    async with manager:
+        # 2 symbols × (ticker, orderbook, trades, OHLCV); no funding or mark price
+        assert manager.task_count == 2 * 4
+        await asyncio.sleep(0)
+        assert manager.funding_queue.empty()
+        assert manager.mark_price_queue.empty()
+
+
+async def test_error_recovery(mock_settings):
+    """Test error recovery in subscriptions."""
+    # watch_ticker fails the first time, then succeeds
+    exchange = FakeExchange(fail_first_ticker=True)
+    
+    # Skip the 5 second backoff: every loop wait yields once instead
+    backoffs = []
+    
+    def instant_sleep(delay):
+        backoffs.append(delay)
+        return asyncio.sleep(0)
+    
+    manager = SubscriptionManager(exchange, mock_settings, sleep=instant_sleep)
+    async with manager:
+        # Wait for retry
+        await asyncio.sleep(0.05)
+        
+        # Should have backed off once and recovered
+        assert 5 in backoffs
+        assert exchange.ticker_calls > 1
+        assert manager.ticker_queue.qsize() > 0
 
 
 if __name__ == "__main__":
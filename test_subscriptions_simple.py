@@ -8,97 +8,60 @@ Run with: python test_subscriptions_simple.py
 import asyncio
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from fakes import FakeExchange
 from market_data_collector import SubscriptionManager
 from market_data_collector.config import MarketDataSettings
-from market_data_collector.exchange import ExchangeAdapter
+
+
+# Validated once at import; fixtures hand out copies
+SETTINGS_DATA = {
+    "exchange": {
+        "name": "Bybit",
+        "market_type": "usdt_perpetual",
+        "base_rest_url": "https://api.bybit.com",
+        "base_websocket_url": "wss://stream.bybit.com/v5/public/linear",
+    },
+    "symbols": ["BTC/USDT:USDT", "ETH/USDT:USDT"],
+    "intervals": {
+        "klines": "1m,5m",
+        "orderbook_snapshot": "1m",
+        "trades": "realtime",
+        "funding": "8h",
+        "mark_price": "1m",
+    },
+    "orderbook": {"depth": 200},
+    "storage": {
+        "backend": "filesystem",
+        "path": "data/test",
+        "compression": "gzip",
+    },
+    "logging": {
+        "level": "ERROR",
+        "file": None,
+        "format": "%(message)s",
+    },
+    "runtime": {
+        "dry_run": False,
+        "enable_metrics": True,
+        "use_proxy": False,
+    },
+}
+
+BASE_SETTINGS = MarketDataSettings.model_validate(SETTINGS_DATA)
 
 
 def create_mock_settings():
     """Create mock settings for testing."""
-    return MarketDataSettings.model_validate({
-        "exchange": {
-            "name": "Bybit",
-            "market_type": "usdt_perpetual",
-            "base_rest_url": "https://api.bybit.com",
-            "base_websocket_url": "wss://stream.bybit.com/v5/public/linear",
-        },
-        "symbols": ["BTC/USDT:USDT", "ETH/USDT:USDT"],
-        "intervals": {
-            "klines": "1m,5m",
-            "orderbook_snapshot": "1m",
-            "trades": "realtime",
-            "funding": "8h",
-            "mark_price": "1m",
-        },
-        "orderbook": {"depth": 200},
-        "storage": {
-            "backend": "filesystem",
-            "path": "data/test",
-            "compression": "gzip",
-        },
-        "logging": {
-            "level": "INFO",
-            "file": "logs/test.log",
-            "format": "%(message)s",
-        },
-        "runtime": {
-            "dry_run": False,
-            "enable_metrics": True,
-            "use_proxy": False,
-        },
-    })
+    return BASE_SETTINGS.model_copy(deep=True)
 
 
 def create_mock_exchange():
-    """Create mock exchange adapter."""
-    exchange = MagicMock(spec=ExchangeAdapter)
-    
-    # Mock watch methods
-    exchange.watch_ticker = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "timestamp": 1698765432000,
-        "last": 35000.0,
-        "bid": 34999.5,
-        "ask": 35000.5,
-    })
-    
-    exchange.watch_order_book = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "timestamp": 1698765432000,
-        "bids": [[34999.5, 1.5], [34999.0, 2.3]],
-        "asks": [[35000.5, 1.8], [35001.0, 2.1]],
-    })
-    
-    exchange.watch_trades = AsyncMock(return_value=[
-        {
-            "id": "12345",
-            "timestamp": 1698765432000,
-            "symbol": "BTC/USDT:USDT",
-            "side": "buy",
-            "price": 35000.0,
-            "amount": 0.5,
-        }
-    ])
-    
-    exchange.watch_ohlcv = AsyncMock(return_value=[
-        [1698765420000, 34990.0, 35010.0, 34980.0, 35000.0, 123.45]
-    ])
-    
-    exchange.fetch_funding_rate = AsyncMock(return_value={
-        "symbol": "BTC/USDT:USDT",
-        "fundingRate": 0.0001,
-        "fundingTimestamp": 1698768000000,
-        "timestamp": 1698765432000,
-    })
-    
-    exchange.derive_mark_price = AsyncMock(return_value=35005.5)
-    
-    return exchange
+    """Create a fake exchange adapter."""
+    return FakeExchange()
 
 
 async def test_subscription_manager_init():
@@ -193,15 +156,8 @@ async def test_ticker_subscription():
     
     await manager.start()
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.ticker_queue.qsize() > 0
-    print(f"  Received {manager.ticker_queue.qsize()} ticker updates")
-    
-    # Get data
-    data = await manager.ticker_queue.get()
+    # Await the first item rather than sleeping a fixed time
+    data = await asyncio.wait_for(manager.ticker_queue.get(), timeout=1.0)
     assert data["type"] == "ticker"
     assert data["symbol"] in mock_settings.symbols
     assert "last" in data["data"]
@@ -222,15 +178,8 @@ async def test_orderbook_subscription():
     
     await manager.start()
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.orderbook_queue.qsize() > 0
-    print(f"  Received {manager.orderbook_queue.qsize()} orderbook updates")
-    
-    # Get data
-    data = await manager.orderbook_queue.get()
+    # Await the first item rather than sleeping a fixed time
+    data = await asyncio.wait_for(manager.orderbook_queue.get(), timeout=1.0)
     assert data["type"] == "orderbook"
     assert "bids" in data["data"]
     assert "asks" in data["data"]
@@ -251,15 +200,8 @@ async def test_trades_subscription():
     
     await manager.start()
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.trades_queue.qsize() > 0
-    print(f"  Received {manager.trades_queue.qsize()} trade updates")
-    
-    # Get data
-    data = await manager.trades_queue.get()
+    # Await the first item rather than sleeping a fixed time
+    data = await asyncio.wait_for(manager.trades_queue.get(), timeout=1.0)
     assert data["type"] == "trade"
     assert "price" in data["data"]
     assert "amount" in data["data"]
@@ -280,15 +222,8 @@ async def test_ohlcv_subscription():
     
     await manager.start()
     
-    # Wait for some data
-    await asyncio.sleep(0.5)
-    
-    # Check if data was queued
-    assert manager.ohlcv_queue.qsize() > 0
-    print(f"  Received {manager.ohlcv_queue.qsize()} OHLCV updates")
-    
-    # Get data
-    data = await manager.ohlcv_queue.get()
+    # Await the first item rather than sleeping a fixed time
+    data = await asyncio.wait_for(manager.ohlcv_queue.get(), timeout=1.0)
     assert data["type"] == "ohlcv"
     assert data["timeframe"] in ["1m", "5m"]
     assert len(data["data"]) == 6  # [timestamp, O, H, L, C, V]
@@ -341,6 +276,18 @@ async def test_multiple_symbols():
     print("✓ Multiple symbol subscription test passed")
 
 
+async def _run_test(test) -> bool:
+    """Run one test, reporting failures instead of raising."""
+    try:
+        await test()
+        return True
+    except AssertionError as e:
+        print(f"✗ {test.__name__} failed: {e}")
+    except Exception as e:
+        print(f"✗ {test.__name__} errored: {e}")
+    return False
+
+
 async def run_all_tests():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -360,19 +307,11 @@ async def run_all_tests():
         test_multiple_symbols,
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            await test()
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ {test.__name__} failed: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ {test.__name__} errored: {e}")
-            failed += 1
+    # Every test builds its own manager and exchange, so they run concurrently
+    # and the suite takes as long as its slowest test, not the sum of them
+    results = await asyncio.gather(*(_run_test(test) for test in tests))
+    passed = sum(results)
+    failed = len(results) - passed
     
     print("\n" + "=" * 60)
     print(f"Test Results: {passed} passed, {failed} failed")
@@ -1,63 +1,74 @@
 #!/usr/bin/env python3
 """Test single video crawl functionality."""
 
-import json
+import os
 import sys
-import time
 from pathlib import Path
+from types import MappingProxyType
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.api import BridgeAPI
 
+# Dump full push/state payloads only when asked (TEST_VERBOSE=1)
+VERBOSE = os.environ.get("TEST_VERBOSE") == "1"
+
+# Single video payload, shared read-only by every push in the test
+VIDEO_DATA = MappingProxyType({
+    "aweme_id": "7123456789012345678",
+    "desc": "Test video for single video crawl",
+    "create_time": 1609459200,
+    "duration": 15000,
+    "statistics": {
+        "digg_count": 1500,
+        "comment_count": 50,
+        "share_count": 25,
+        "play_count": 10000,
+        "collect_count": 100,
+    },
+    "author": {
+        "uid": "video_author_001",
+        "id": "video_author_001",
+        "nickname": "Video Test Author",
+        "sec_uid": "MS4wLjABAAAAvideotest123",
+        "unique_id": "videotestauthor",
+        "signature": "This is a test author",
+        "avatar_thumb": "https://example.com/avatar.jpg",
+        "follower_count": 50000,
+        "following_count": 100,
+        "aweme_count": 150,
+        "region": "US",
+    },
+    "music": {
+        "title": "Test Background Music",
+        "author": "Test Music Artist",
+    },
+    "video": {
+        "cover": {"url_list": ["https://example.com/video_cover.jpg"]},
+        "play_addr": {"url_list": ["https://example.com/test_video.mp4"]},
+    },
+    "item_type": "video",
+})
+
+# Same video with updated engagement metrics
+UPDATED_VIDEO_DATA = MappingProxyType({
+    **VIDEO_DATA,
+    "statistics": {
+        "digg_count": 2000,  # Increased from 1500
+        "comment_count": 75,  # Increased from 50
+        "share_count": 30,  # Increased from 25
+        "play_count": 15000,  # Increased from 10000
+        "collect_count": 150,  # Increased from 100
+    },
+})
+
 
 def test_video_crawl():
     """Test that video crawl can ingest a single video idempotently."""
-    db_path = Path("./test_data/video_test.db")
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Remove existing DB to start fresh
-    if db_path.exists():
-        db_path.unlink()
-
-    api = BridgeAPI(db_path)
-
-    # Simulate a single video data capture
-    video_data = {
-        "aweme_id": "7123456789012345678",
-        "desc": "Test video for single video crawl",
-        "create_time": 1609459200,
-        "duration": 15000,
-        "statistics": {
-            "digg_count": 1500,
-            "comment_count": 50,
-            "share_count": 25,
-            "play_count": 10000,
-            "collect_count": 100,
-        },
-        "author": {
-            "uid": "video_author_001",
-            "id": "video_author_001",
-            "nickname": "Video Test Author",
-            "sec_uid": "MS4wLjABAAAAvideotest123",
-            "unique_id": "videotestauthor",
-            "signature": "This is a test author",
-            "avatar_thumb": "https://example.com/avatar.jpg",
-            "follower_count": 50000,
-            "following_count": 100,
-            "aweme_count": 150,
-            "region": "US",
-        },
-        "music": {
-            "title": "Test Background Music",
-            "author": "Test Music Artist",
-        },
-        "video": {
-            "cover": {"url_list": ["https://example.com/video_cover.jpg"]},
-            "play_addr": {"url_list": ["https://example.com/test_video.mp4"]},
-        },
-        "item_type": "video",
-    }
+    # In-memory database: starts empty, nothing to delete or fsync
+    api = BridgeAPI(Path(":memory:"))
+    # Auto-complete right after capture; the test waits on the completion event
+    api.video_complete_delay = 0.05
 
     print("=" * 70)
     print("TEST 1: Initial video ingestion")
@@ -70,8 +81,9 @@ def test_video_crawl():
 
     # Simulate data capture via push_chunk
     print("Pushing video data...")
-    push_result = api.push_chunk([video_data])
-    print(f"push_chunk result: {json.dumps(push_result, indent=2)}")
+    push_result = api.push_chunk([VIDEO_DATA])
+    if VERBOSE:
+        print(f"push_chunk result: {push_result!r}")
 
     assert push_result["success"], "Failed to push video data"
     assert push_result["inserted"] == 1, (
@@ -82,13 +94,14 @@ def test_video_crawl():
     )
     print("✓ Video data inserted successfully\n")
 
-    # Give the auto-completion timer a moment to trigger
-    print("Waiting for auto-completion (3 seconds)...")
-    time.sleep(3)
+    # Wait for the auto-completion timer to fire
+    print("Waiting for auto-completion...")
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
 
     # Check crawl state
     state = api.state.snapshot()
-    print(f"Crawl state: {json.dumps(state, indent=2)}")
+    if VERBOSE:
+        print(f"Crawl state: {state!r}")
     assert not state["active"], "Crawl should have auto-completed"
     assert state["status"] == "complete", (
         f"Expected status 'complete', got '{state['status']}'"
@@ -102,10 +115,10 @@ def test_video_crawl():
     assert videos["total"] == 1, f"Expected 1 video in DB, found {videos['total']}"
 
     stored_video = videos["items"][0]
-    assert stored_video["aweme_id"] == video_data["aweme_id"]
-    assert stored_video["desc"] == video_data["desc"]
-    assert stored_video["author_name"] == video_data["author"]["nickname"]
-    assert stored_video["digg_count"] == video_data["statistics"]["digg_count"]
+    assert stored_video["aweme_id"] == VIDEO_DATA["aweme_id"]
+    assert stored_video["desc"] == VIDEO_DATA["desc"]
+    assert stored_video["author_name"] == VIDEO_DATA["author"]["nickname"]
+    assert stored_video["digg_count"] == VIDEO_DATA["statistics"]["digg_count"]
     print("✓ Video details match expected values\n")
 
     print("=" * 70)
@@ -118,8 +131,9 @@ def test_video_crawl():
 
     # Push the same video data again
     print("Pushing same video data again...")
-    push_result = api.push_chunk([video_data])
-    print(f"push_chunk result: {json.dumps(push_result, indent=2)}")
+    push_result = api.push_chunk([VIDEO_DATA])
+    if VERBOSE:
+        print(f"push_chunk result: {push_result!r}")
 
     assert push_result["success"], "Failed to push video data on second run"
     assert push_result["inserted"] == 0, (
@@ -131,7 +145,7 @@ def test_video_crawl():
     print("✓ Video updated (not duplicated)\n")
 
     # Wait for auto-completion
-    time.sleep(3)
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
 
     # Verify still only one video in database
     print("Verifying no duplicates in database...")
@@ -145,23 +159,14 @@ def test_video_crawl():
     print("TEST 3: Updated metrics on re-ingestion")
     print("=" * 70)
 
-    # Modify video data (simulate updated engagement metrics)
-    updated_video_data = video_data.copy()
-    updated_video_data["statistics"] = {
-        "digg_count": 2000,  # Increased from 1500
-        "comment_count": 75,  # Increased from 50
-        "share_count": 30,  # Increased from 25
-        "play_count": 15000,  # Increased from 10000
-        "collect_count": 150,  # Increased from 100
-    }
-
     # Start another crawl
     api.state.start("video", "https://www.douyin.com/video/7123456789012345678")
 
     # Push updated data
     print("Pushing video with updated metrics...")
-    push_result = api.push_chunk([updated_video_data])
-    print(f"push_chunk result: {json.dumps(push_result, indent=2)}")
+    push_result = api.push_chunk([UPDATED_VIDEO_DATA])
+    if VERBOSE:
+        print(f"push_chunk result: {push_result!r}")
 
     assert push_result["success"], "Failed to push updated video data"
     assert push_result["updated"] == 1, (
@@ -170,7 +175,7 @@ def test_video_crawl():
     print("✓ Video updated with new metrics\n")
 
     # Wait for auto-completion
-    time.sleep(3)
+    assert api.state.completed_event.wait(timeout=5.0), "Auto-completion timed out"
 
     # Verify metrics were updated
     print("Verifying updated metrics in database...")
@@ -204,5 +209,32 @@ def test_video_crawl():
     return 0
 
 
+
+def test_video_crawl_bulk():
+    """Test that one push_chunk call ingests and re-ingests a large batch."""
+    api = BridgeAPI(Path(":memory:"))
+    api.state.start("video", "https://www.douyin.com/video/bulk")
+
+    # 1000 distinct videos in one chunk share a single write transaction
+    videos = [
+        {**VIDEO_DATA, "aweme_id": str(7_200_000_000_000_000_000 + i)}
+        for i in range(1000)
+    ]
+
+    push_result = api.push_chunk(videos)
+    assert push_result["success"], "Failed to push bulk video data"
+    assert push_result["inserted"] == 1000
+    assert push_result["updated"] == 0
+
+    push_result = api.push_chunk(videos)
+    assert push_result["inserted"] == 0
+    assert push_result["updated"] == 1000
+
+    assert api.list_videos({}, 1, 10)["total"] == 1000
+    print("✓ Bulk chunk of 1000 videos upserted idempotently")
+
+
 if __name__ == "__main__":
-    sys.exit(test_video_crawl())
+    status = test_video_crawl()
+    test_video_crawl_bulk()
+    sys.exit(status)